@@ -5,6 +5,7 @@ Loads settings from environment variables / .env file.
 
 from pathlib import Path
 from functools import lru_cache
+from typing import Literal
 from pydantic_settings import BaseSettings
 
 
@@ -12,19 +13,103 @@ class Settings(BaseSettings):
     # ── Gemini (LLM only — embeddings are local) ────────────
     gemini_api_key: str = ""
     gemini_model: str = "gemini-2.0-flash"
+    llm_max_concurrency: int = 32
+    llm_timeout_seconds: float = 60.0
 
     # ── Local Embeddings ─────────────────────────────────────
     local_embedding_model: str = "all-MiniLM-L6-v2"
+    # "translate": Tamil questions are translated to English by the LLM before retrieval.
+    # "crosslingual": Tamil questions are embedded directly; requires a multilingual
+    # model (e.g. paraphrase-multilingual-MiniLM-L12-v2) and an index built with it.
+    # "parallel": the question is translated and embedded directly at the same time;
+    # the translation is searched if it arrives within TAMIL_TRANSLATION_BUDGET_MS,
+    # the Tamil text otherwise (best with a multilingual model).
+    tamil_retrieval_mode: Literal["translate", "crosslingual", "parallel"] = "translate"
+    tamil_translation_budget_ms: int = 500
+    # Micro-batch query embeddings: queries arriving within EMBED_BATCH_MAX_WAIT_MS of
+    # each other (up to EMBED_BATCH_MAX_SIZE) are encoded in one forward pass
+    embed_batching: bool = True
+    embed_batch_max_size: int = 32
+    embed_batch_max_wait_ms: float = 5.0
 
     # ── FAISS ────────────────────────────────────────────────
     faiss_index_path: str = "app/data/vector_store/index.faiss"
+    # Any faiss.index_factory string: "Flat" (exact float32), "SQfp16" / "SQ8" (scalar
+    # quantized, 2x / 4x smaller), "PQ48" (product quantized), "HNSW32", "IVF1024,PQ32", ...
+    faiss_index_factory: str = "Flat"
+    # "cosine": normalised vectors searched by inner product (scores are similarities);
+    # "l2": raw vectors and L2 distances, as indexes were built before
+    faiss_metric: str = "cosine"
+    faiss_nprobe: int = 16  # IVF lists probed per query
+    faiss_ef_search: int = 64  # HNSW search breadth per query
+    # >0: keep float32 vectors on disk next to the chunks and re-score this many
+    # candidates from a quantized index exactly before taking the top k
+    faiss_rerank_candidates: int = 0
+    # Memory-map the saved index read-only so uvicorn workers share it via the page cache
+    faiss_mmap: bool = False
+    indexing_workers: int = 1  # background threads running upload / re-index jobs
+    indexing_job_history: int = 100  # finished jobs kept for status polling
 
     # ── Chunking ─────────────────────────────────────────────
+    # "statute": one chunk per Chapter/Section/Article with act/chapter/section metadata,
+    # falling back to fixed-size chunks for documents without such headings;
+    # "recursive": fixed-size chunks for every document
+    chunking_strategy: str = "statute"
     chunk_size: int = 500
     chunk_overlap: int = 50
+    statute_chunk_max_size: int = 1500  # longer sections are sub-split
 
     # ── Retrieval ────────────────────────────────────────────
-    top_k_results: int = 5
+    top_k_results: int = 5  # upper bound; fewer chunks are used when relevance drops off
+    retrieval_min_similarity: float = 0.25  # cosine floor for a chunk to reach the prompt
+    retrieval_similarity_dropoff: float = 0.15  # stop once a chunk scores this far below the best
+    # Hybrid retrieval: BM25 over the same chunks, fused with FAISS results by reciprocal rank
+    hybrid_retrieval: bool = True
+    hybrid_candidates: int = 20  # hits taken from each retriever before fusion
+    hybrid_rrf_k: int = 60
+    hybrid_bm25_min_ratio: float = 0.5  # drop BM25 hits scoring below this fraction of the best
+    # Questions citing a section ("IPC 420", "BNS section 103") fetch it directly, without search
+    citation_lookup: bool = True
+    # Cross-encoder re-ranking: retrieve RERANK_CANDIDATES chunks, keep the best RERANK_TOP_N.
+    # Past RERANK_BUDGET_MS the retrieval order is used instead.
+    rerank_enabled: bool = False
+    rerank_model: str = "cross-encoder/ms-marco-MiniLM-L-6-v2"
+    rerank_candidates: int = 50
+    rerank_top_n: int = 5
+    rerank_budget_ms: int = 300  # per scoring job, from when it starts (jobs queue for the one scoring thread)
+    rerank_batch_size: int = 16  # pairs per forward pass; the budget is checked between passes
+
+    # ── Issue classifier ─────────────────────────────────────
+    # "local": nearest-centroid over the embedding model, asking the LLM only when the
+    # best category's probability is below CLASSIFIER_MIN_CONFIDENCE; "llm": always the LLM
+    classifier_mode: str = "local"
+    # Tune both together with the sweep in `benchmark.py classifier` for the embedding model in use
+    classifier_min_confidence: float = 0.5  # below this the LLM classifies instead
+    classifier_temperature: float = 0.05  # softmax temperature over centroid similarities
+
+    # ── Batch Q&A (/api/query/batch) ─────────────────────────
+    batch_query_max_questions: int = 1000
+    batch_query_concurrency: int = 8  # LLM calls in flight per batch (LLM_MAX_CONCURRENCY still caps the total)
+
+    # ── Language detection ───────────────────────────────────
+    tamil_script_ratio: float = 0.3
+    langdetect_fallback: bool = False
+
+    # ── Semantic answer cache ────────────────────────────────
+    answer_cache_enabled: bool = True
+    answer_cache_similarity: float = 0.95
+    answer_cache_max_entries: int = 1000
+    answer_cache_ttl_seconds: int = 86400
+    answer_cache_persist: bool = False
+
+    # ── Complaint drafts ─────────────────────────────────────
+    complaint_draft_ttl_seconds: int = 3600  # how long /complaint/pdf can render a draft by its ID
+    complaint_draft_max_entries: int = 1000
+
+    # ── Translation memory ───────────────────────────────────
+    translation_memory_enabled: bool = True
+    translation_memory_max_entries: int = 10000  # on-disk rows; seeded strings are never evicted
+    translation_memory_ttl_seconds: int = 604800  # translations of user text; seeded strings never expire
 
     # ── CORS ─────────────────────────────────────────────────
     cors_origins: str = "http://localhost:3000,http://127.0.0.1:3000"
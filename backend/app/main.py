@@ -9,7 +9,14 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import get_settings
-from app.routers import query, classifier, complaint, documents
+from app.routers import query, classifier, assist, complaint, documents
+from app.services.llm_service import LLMService
+from app.services.answer_cache import AnswerCache
+from app.services.draft_store import DraftStore
+from app.services.reranker import RerankerService
+from app.services.translation_memory import TranslationMemory
+from app.services.indexing_jobs import IndexingJobManager
+from app.utils.memory import process_memory_mb
 
 
 # ── Ensure data directories exist ──────────────────────────
@@ -27,7 +34,15 @@ async def lifespan(app: FastAPI):
     from app.services.embedding_service import EmbeddingService
     emb = EmbeddingService()
     emb.load_index_if_exists()
+    RerankerService()  # loads the cross-encoder now rather than on the first query
+    if get_settings().classifier_mode == "local":
+        from app.services.local_classifier import LocalClassifier
+        LocalClassifier()  # embeds the labelled examples once
+    cache = AnswerCache()
+    cache.load()
     yield
+    cache.save()
+    IndexingJobManager().shutdown()
 
 
 # ── App ─────────────────────────────────────────────────────
@@ -51,6 +66,7 @@ app.add_middleware(
 # ── Routers ─────────────────────────────────────────────────
 app.include_router(query.router, prefix="/api/query", tags=["RAG Q&A"])
 app.include_router(classifier.router, prefix="/api/classify", tags=["Classifier"])
+app.include_router(assist.router, prefix="/api/assist", tags=["Assist"])
 app.include_router(complaint.router, prefix="/api/complaint", tags=["Complaint"])
 app.include_router(documents.router, prefix="/api/documents", tags=["Documents"])
 
@@ -66,4 +82,16 @@ async def root():
 
 @app.get("/health", tags=["Health"])
 async def health():
-    return {"status": "healthy"}
+    from app.services.embedding_service import EmbeddingService
+    batcher = EmbeddingService().query_batcher
+    return {
+        "status": "healthy",
+        "llm": LLMService.stats.snapshot(),
+        "rerank": RerankerService.stats.snapshot(),
+        "answer_cache": AnswerCache().stats,
+        "translation_memory": TranslationMemory().stats,
+        "complaint_drafts": DraftStore().stats,
+        "index_load": EmbeddingService().load_report,
+        "query_embedding": batcher.stats if batcher else None,
+        "memory": process_memory_mb(),
+    }
@@ -4,13 +4,16 @@ NyayaSahaya — Pydantic schemas for request / response models.
 
 from __future__ import annotations
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 # ── RAG Q&A ──────────────────────────────────────────────────
 class QueryRequest(BaseModel):
     question: str = Field(..., min_length=3, max_length=2000, description="Legal question in Tamil or English")
     language: Optional[str] = Field(None, description="Force language: 'ta' or 'en'. Auto-detected if omitted.")
+    text_only: bool = Field(
+        False, description="For questions citing a section (e.g. 'IPC 420'), return its text without an AI explanation"
+    )
 
 
 class SourceChunk(BaseModel):
@@ -23,10 +26,45 @@ class QueryResponse(BaseModel):
     answer: str
     detected_language: str
     category: Optional[str] = None
+    index_version: Optional[str] = Field(None, description="Version of the index snapshot the answer was retrieved from")
+    citations: list[str] = Field([], description="Sections cited in the question and looked up directly, e.g. 'IPC Section 420'")
     sources: list[SourceChunk] = []
+    timings: dict[str, float] = Field(
+        {}, description="Milliseconds per stage: translation_ms, retrieval_ms, rerank_ms, generation_ms (those that ran)"
+    )
     disclaimer: str = "This AI provides general legal information and is not a substitute for professional legal advice."
 
 
+class BatchQueryItem(BaseModel):
+    id: Optional[str] = Field(None, description="Caller's reference, echoed in the result. Defaults to the 1-based position.")
+    question: str = Field(..., min_length=3, max_length=2000, description="Legal question in Tamil or English")
+    language: Optional[str] = Field(None, description="Force language: 'ta' or 'en'. Auto-detected if omitted.")
+
+    @field_validator("id", mode="before")
+    @classmethod
+    def _id_as_str(cls, value):
+        # CSV exports often have numeric IDs
+        return str(value) if isinstance(value, (int, float)) and not isinstance(value, bool) else value
+
+
+class BatchQueryRequest(BaseModel):
+    questions: list[BatchQueryItem] = Field(..., min_length=1)
+    text_only: bool = Field(False, description="As in QueryRequest, for questions citing a section")
+
+
+class BatchQueryResult(BaseModel):
+    """One NDJSON line of a batch response."""
+    id: str
+    question: str
+    answer: Optional[str] = None
+    error: Optional[str] = Field(None, description="Set instead of `answer` when this question failed")
+    detected_language: Optional[str] = None
+    index_version: Optional[str] = None
+    citations: list[str] = []
+    sources: list[SourceChunk] = []
+    disclaimer: Optional[str] = None
+
+
 # ── Classifier ───────────────────────────────────────────────
 class ClassifyRequest(BaseModel):
     description: str = Field(..., min_length=5, max_length=3000, description="Describe your legal issue")
@@ -36,10 +74,29 @@ class ClassifyResponse(BaseModel):
     category: str
     confidence: Optional[str] = None
     explanation: str
+    method: Optional[str] = Field(None, description="'local' (embedding classifier) or 'llm'")
     detected_language: str
     disclaimer: str = "This AI provides general legal information and is not a substitute for professional legal advice."
 
 
+# ── Assist (classify + answer) ───────────────────────────────
+class AssistRequest(BaseModel):
+    question: str = Field(..., min_length=5, max_length=2000, description="Legal question or issue in Tamil or English")
+    language: Optional[str] = Field(None, description="Force language: 'ta' or 'en'. Auto-detected if omitted.")
+    text_only: bool = Field(
+        False, description="For questions citing a section (e.g. 'IPC 420'), return its text without an AI explanation"
+    )
+
+
+class AssistResponse(QueryResponse):
+    classification: Optional[ClassifyResponse] = Field(
+        None, description="Issue category for the same text; null if classification failed (the answer is still returned)"
+    )
+    timings: dict[str, float] = Field(
+        {}, description="Milliseconds per stage: the QueryResponse stages plus classification_ms and total_ms"
+    )
+
+
 # ── Complaint ────────────────────────────────────────────────
 class ComplaintRequest(BaseModel):
     complainant_name: str = Field(..., min_length=2, max_length=200)
@@ -51,7 +108,34 @@ class ComplaintRequest(BaseModel):
     language: Optional[str] = Field("en", description="'ta' or 'en'")
 
 
+class ComplaintPDFRequest(BaseModel):
+    draft_id: Optional[str] = Field(
+        None, description="ID returned by /complaint/draft; its stored draft is rendered without another LLM call"
+    )
+    draft_text: Optional[str] = Field(
+        None, min_length=1, max_length=20000, description="Draft text (e.g. as edited by the user), rendered as-is"
+    )
+    language: Optional[str] = Field("en", description="'ta' or 'en'")
+    # The form details, as for /complaint/draft: the latest draft generated from the same
+    # details is reused, and one is generated only if there is none (or the draft_id expired)
+    complainant_name: Optional[str] = Field(None, min_length=2, max_length=200)
+    complainant_address: Optional[str] = Field(None, min_length=5, max_length=500)
+    opponent_name: Optional[str] = Field(None, min_length=2, max_length=200)
+    issue_description: Optional[str] = Field(None, min_length=10, max_length=5000)
+    location: Optional[str] = Field(None, min_length=2, max_length=300)
+    date: Optional[str] = Field(None, description="Date of incident (YYYY-MM-DD)")
+
+    def details(self) -> Optional[dict]:
+        """The form details if all of them were sent, else None."""
+        fields = ("complainant_name", "complainant_address", "opponent_name", "issue_description", "location", "date")
+        values = {f: getattr(self, f) for f in fields}
+        if any(v is None for v in values.values()):
+            return None
+        return {**values, "language": self.language or "en"}
+
+
 class ComplaintResponse(BaseModel):
+    draft_id: Optional[str] = Field(None, description="Pass to /complaint/pdf to render this draft without regenerating it")
     draft_text: str
     language: str
     disclaimer: str = "This AI provides general legal information and is not a substitute for professional legal advice."
@@ -62,9 +146,36 @@ class DocumentIndexResponse(BaseModel):
     message: str
     documents_processed: int
     total_chunks: int
+    chunks_embedded: int = 0
+    documents_unchanged: int = 0
+    documents_removed: int = 0
+    full_rebuild: bool = False
 
 
 class DocumentUploadResponse(BaseModel):
     message: str
     filename: str
     chunks_created: int
+    duplicate_chunks: int = 0
+    duplicate_of: Optional[str] = None  # another indexed file with the same content
+    unchanged: bool = False  # this file was already indexed with the same content
+
+
+class IndexJobResponse(BaseModel):
+    job_id: str
+    status: str
+    message: str
+
+
+class IndexJobStatus(BaseModel):
+    job_id: str
+    kind: str
+    description: str
+    status: str = Field(..., description="queued, running, completed or failed")
+    phase: str = Field(..., description="Current step, e.g. chunking, embedding, indexing, saving, done")
+    chunks_total: int = 0
+    chunks_embedded: int = 0
+    chunks_per_second: float = 0.0
+    elapsed_seconds: float = 0.0
+    result: Optional[dict] = None
+    error: Optional[str] = None
@@ -0,0 +1,38 @@
+"""
+NyayaSahaya — Combined classify + answer endpoint.
+"""
+
+from fastapi import APIRouter, HTTPException
+from app.models.schemas import AssistRequest, AssistResponse, ClassifyResponse
+from app.services.assist_service import AssistService
+
+router = APIRouter()
+
+
+@router.post("/", response_model=AssistResponse)
+async def assist(request: AssistRequest):
+    """
+    Classify a legal issue and answer it in one call. The language is detected
+    and Tamil translated once for both; classification and retrieval +
+    generation run concurrently.
+    """
+    try:
+        result = await AssistService().assist(
+            question=request.question,
+            force_language=request.language,
+            text_only=request.text_only,
+        )
+        classification = result["classification"]
+        return AssistResponse(
+            answer=result["answer"],
+            detected_language=result["detected_language"],
+            category=result["category"],
+            index_version=result["index_version"],
+            citations=result["citations"],
+            sources=result["sources"],
+            timings=result["timings"],
+            disclaimer=result["disclaimer"],
+            classification=ClassifyResponse(**classification) if classification else None,
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error processing request: {str(e)}")
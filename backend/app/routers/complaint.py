@@ -4,9 +4,10 @@ NyayaSahaya — Complaint draft generation + PDF download endpoints.
 
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import StreamingResponse
+import asyncio
 import io
 
-from app.models.schemas import ComplaintRequest, ComplaintResponse
+from app.models.schemas import ComplaintPDFRequest, ComplaintRequest, ComplaintResponse
 from app.services.complaint_service import ComplaintService
 from app.services.pdf_service import PDFService
 
@@ -17,7 +18,8 @@ router = APIRouter()
 async def generate_complaint_draft(request: ComplaintRequest):
     """
     Generate a formal legal complaint draft from user-provided details.
-    Returns the draft text; use /complaint/pdf for downloadable PDF.
+    Returns the draft text and a draft ID; pass the ID to /complaint/pdf
+    to download the same draft as a PDF.
     """
     try:
         service = ComplaintService()
@@ -36,35 +38,38 @@ async def generate_complaint_draft(request: ComplaintRequest):
 
 
 @router.post("/pdf")
-async def generate_complaint_pdf(request: ComplaintRequest):
+async def generate_complaint_pdf(request: ComplaintPDFRequest):
     """
-    Generate a formal legal complaint as a downloadable PDF.
+    Render a complaint as a downloadable PDF. Send the `draft_id` from
+    /complaint/draft (or the draft text itself) and no LLM call is made;
+    with only the form details, the draft generated for them is reused if
+    there is one and a new one generated otherwise.
     """
     try:
-        # First generate the complaint text
-        complaint_service = ComplaintService()
-        result = await complaint_service.generate_complaint(
-            complainant_name=request.complainant_name,
-            complainant_address=request.complainant_address,
-            opponent_name=request.opponent_name,
-            issue_description=request.issue_description,
-            location=request.location,
-            date=request.date,
+        draft = await ComplaintService().resolve_draft(
+            draft_id=request.draft_id,
+            draft_text=request.draft_text,
             language=request.language or "en",
+            details=request.details(),
         )
+    except LookupError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Complaint generation error: {str(e)}")
 
-        # Then convert to PDF
-        pdf_service = PDFService()
-        pdf_bytes = pdf_service.generate_complaint_pdf(
-            draft_text=result["draft_text"],
-            language=result["language"],
+    try:
+        # Rendering is CPU-bound; keep it off the event loop
+        pdf_bytes = await asyncio.to_thread(
+            PDFService().generate_complaint_pdf,
+            draft_text=draft["draft_text"],
+            language=draft["language"],
         )
-
+        name = request.complainant_name or draft.get("complainant_name") or "draft"
         return StreamingResponse(
             io.BytesIO(pdf_bytes),
             media_type="application/pdf",
             headers={
-                "Content-Disposition": f"attachment; filename=complaint_{request.complainant_name.replace(' ', '_')}.pdf"
+                "Content-Disposition": f"attachment; filename=complaint_{name.replace(' ', '_')}.pdf"
             },
         )
     except Exception as e:
@@ -7,19 +7,80 @@ import logging
 from pathlib import Path
 
 from fastapi import APIRouter, HTTPException, UploadFile, File
-from app.models.schemas import DocumentIndexResponse, DocumentUploadResponse
+from app.models.schemas import DocumentIndexResponse, DocumentUploadResponse, IndexJobResponse, IndexJobStatus
 from app.services.embedding_service import EmbeddingService
-from app.utils.text_processor import chunk_text, read_document
+from app.services.indexing_jobs import IndexingJob, IndexingJobManager
 from app.config import get_settings
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-@router.post("/upload", response_model=DocumentUploadResponse)
+def _document_files(docs_dir: Path) -> list[Path]:
+    """All indexable documents in a directory, in a stable order."""
+    return sorted(list(docs_dir.glob("*.txt")) + list(docs_dir.glob("*.pdf")))
+
+
+def _upload_job(save_path: Path, docs_dir: Path):
+    """Job body for an uploaded file: chunk, embed, index and save it."""
+    def work(job: IndexingJob) -> dict:
+        emb_service = EmbeddingService()
+        if emb_service.needs_rebuild:
+            emb_service.sync_documents(_document_files(docs_dir), full=True, progress=job)
+            entry = emb_service.files.get(save_path.name, {})
+            result = {"chunks_embedded": entry.get("count", 0),
+                      "duplicate_chunks": len(entry.get("shared", [])), "duplicate_of": None, "unchanged": False}
+        else:
+            result = emb_service.index_file(save_path, progress=job)
+        job.phase("saving")
+        emb_service.save_index()
+
+        message = f"Successfully indexed {save_path.name}"
+        if result["unchanged"]:
+            message = f"{save_path.name} is already indexed with the same content; no new vectors added"
+        elif result["duplicate_of"]:
+            message = f"{save_path.name} is identical to already indexed {result['duplicate_of']}; no new vectors added"
+        return DocumentUploadResponse(
+            message=message,
+            filename=save_path.name,
+            chunks_created=result["chunks_embedded"],
+            duplicate_chunks=result["duplicate_chunks"],
+            duplicate_of=result["duplicate_of"],
+            unchanged=result["unchanged"],
+        ).model_dump()
+    return work
+
+
+def _sync_job(files: list[Path], full: bool):
+    """Job body for /index-all: bring the index in line with `files` and save it."""
+    def work(job: IndexingJob) -> dict:
+        emb_service = EmbeddingService()
+        stats = emb_service.sync_documents(files, full=full, progress=job)
+        job.phase("saving")
+        emb_service.save_index()
+        logger.info(
+            f"Indexed {len(stats['added'])} new, {len(stats['updated'])} changed, "
+            f"{len(stats['removed'])} removed, {stats['unchanged']} unchanged documents "
+            f"({stats['chunks_embedded']} chunks embedded, full rebuild: {stats['full_rebuild']})"
+        )
+        return DocumentIndexResponse(
+            message="Successfully indexed all documents",
+            documents_processed=len(stats["added"]) + len(stats["updated"]),
+            total_chunks=emb_service.total_vectors,
+            chunks_embedded=stats["chunks_embedded"],
+            documents_unchanged=stats["unchanged"],
+            documents_removed=len(stats["removed"]),
+            full_rebuild=stats["full_rebuild"],
+        ).model_dump()
+    return work
+
+
+@router.post("/upload", response_model=IndexJobResponse, status_code=202)
 async def upload_document(file: UploadFile = File(...)):
     """
-    Upload a legal document (.txt or .pdf), chunk it, embed it, and add to FAISS index.
+    Upload a legal document (.txt or .pdf) and queue a job that chunks, embeds
+    and adds it to the FAISS index. Poll /jobs/{job_id} for progress; queries
+    keep using the current index until the job publishes the new one.
     """
     if not file.filename:
         raise HTTPException(status_code=400, detail="No file provided.")
@@ -32,69 +93,46 @@ async def upload_document(file: UploadFile = File(...)):
     try:
         settings = get_settings()
         # Save uploaded file
-        save_path = Path(settings.sample_docs_dir) / file.filename
+        docs_dir = Path(settings.sample_docs_dir)
+        save_path = docs_dir / file.filename
         content = await file.read()
         with open(save_path, "wb") as f:
             f.write(content)
 
-        # Read and chunk
-        text = read_document(save_path)
-        chunks = chunk_text(text, source=file.filename)
-
-        # Embed and index
-        emb_service = EmbeddingService()
-        emb_service.add_chunks(chunks)
-        emb_service.save_index()
-
-        return DocumentUploadResponse(
-            message=f"Successfully indexed {file.filename}",
-            filename=file.filename,
-            chunks_created=len(chunks),
-        )
+        job = IndexingJobManager().submit("upload", file.filename, _upload_job(save_path, docs_dir))
+        return IndexJobResponse(job_id=job.job_id, status=job.status, message=f"Queued {file.filename} for indexing")
     except Exception as e:
         logger.error(f"Document upload error: {e}")
         raise HTTPException(status_code=500, detail=f"Error processing document: {str(e)}")
 
 
-@router.post("/index-all", response_model=DocumentIndexResponse)
-async def index_all_documents():
+@router.post("/index-all", response_model=IndexJobResponse, status_code=202)
+async def index_all_documents(full: bool = False):
     """
-    Read all documents in the sample_docs directory, chunk, embed, and build the FAISS index.
+    Queue a job that brings the FAISS index in line with the sample_docs directory.
+    Only new or changed files are embedded; pass ?full=true to rebuild from scratch.
     """
-    try:
-        settings = get_settings()
-        docs_dir = Path(settings.sample_docs_dir)
-
-        if not docs_dir.exists():
-            raise HTTPException(status_code=404, detail="Sample docs directory not found.")
+    settings = get_settings()
+    docs_dir = Path(settings.sample_docs_dir)
 
-        files = list(docs_dir.glob("*.txt")) + list(docs_dir.glob("*.pdf"))
-        if not files:
-            raise HTTPException(status_code=404, detail="No .txt or .pdf files found in sample_docs directory.")
+    if not docs_dir.exists():
+        raise HTTPException(status_code=404, detail="Sample docs directory not found.")
 
-        emb_service = EmbeddingService()
-        emb_service.create_index()  # Reset index
+    files = _document_files(docs_dir)
+    if not files:
+        raise HTTPException(status_code=404, detail="No .txt or .pdf files found in sample_docs directory.")
 
-        total_chunks = 0
-        for i, file_path in enumerate(files):
-            text = read_document(file_path)
-            chunks = chunk_text(text, source=file_path.name)
-            emb_service.add_chunks(chunks)
-            total_chunks += len(chunks)
-            logger.info(f"[{i+1}/{len(files)}] Indexed {file_path.name}: {len(chunks)} chunks")
+    job = IndexingJobManager().submit("index-all", f"{len(files)} documents", _sync_job(files, full))
+    return IndexJobResponse(job_id=job.job_id, status=job.status, message=f"Queued {len(files)} documents for indexing")
 
-        emb_service.save_index()
 
-        return DocumentIndexResponse(
-            message="Successfully indexed all documents",
-            documents_processed=len(files),
-            total_chunks=total_chunks,
-        )
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Indexing error: {e}")
-        raise HTTPException(status_code=500, detail=f"Error indexing documents: {str(e)}")
+@router.get("/jobs/{job_id}", response_model=IndexJobStatus)
+async def indexing_job_status(job_id: str):
+    """Progress of a background indexing job: phase, chunks embedded and throughput."""
+    job = IndexingJobManager().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown indexing job: {job_id}")
+    return IndexJobStatus(**job.to_dict())
 
 
 @router.get("/status")
@@ -108,9 +146,11 @@ async def index_status():
     if docs_dir.exists():
         doc_files = [f.name for f in docs_dir.iterdir() if f.suffix.lower() in {".txt", ".pdf"}]
 
+    store = emb_service.snapshot()
     return {
-        "total_vectors": emb_service.total_vectors,
-        "total_metadata": len(emb_service.metadata),
-        "index_loaded": emb_service.index is not None,
+        "index_version": str(store.version),
+        "total_vectors": store.total_vectors,
+        "total_metadata": len(store.chunks),
+        "index_loaded": store.index is not None,
         "documents_on_disk": doc_files,
     }
@@ -2,13 +2,25 @@
 NyayaSahaya — RAG-based legal Q&A endpoint.
 """
 
-from fastapi import APIRouter, HTTPException
-from app.models.schemas import QueryRequest, QueryResponse
+import json
+import logging
+
+from fastapi import APIRouter, HTTPException, UploadFile, File
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from app.config import get_settings
+from app.models.schemas import BatchQueryItem, BatchQueryRequest, BatchQueryResult, QueryRequest, QueryResponse
 from app.services.rag_service import RAGService
 
+logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+def _sse(event: str, data: dict) -> str:
+    """Format one Server-Sent Events message."""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
 @router.post("/", response_model=QueryResponse)
 async def ask_legal_question(request: QueryRequest):
     """
@@ -20,12 +32,102 @@ async def ask_legal_question(request: QueryRequest):
         result = await rag.answer_question(
             question=request.question,
             force_language=request.language,
+            text_only=request.text_only,
         )
         return QueryResponse(
             answer=result["answer"],
             detected_language=result["detected_language"],
+            index_version=result["index_version"],
+            citations=result["citations"],
             sources=result["sources"],
+            timings=result["timings"],
             disclaimer=result["disclaimer"],
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error processing query: {str(e)}")
+
+
+@router.post("/stream")
+async def stream_legal_question(request: QueryRequest):
+    """
+    Streaming variant of the Q&A endpoint (Server-Sent Events).
+    Emits a `sources` event as soon as retrieval finishes, then `token`
+    events as the answer is generated, then `done` (or `error`).
+    """
+    rag = RAGService()
+
+    async def event_stream():
+        try:
+            async for event in rag.stream_answer(
+                question=request.question,
+                force_language=request.language,
+                text_only=request.text_only,
+            ):
+                name = event.pop("event")
+                yield _sse(name, event)
+        except Exception as e:
+            logger.error(f"Streaming query error: {e}")
+            yield _sse("error", {"detail": f"Error processing query: {str(e)}"})
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _batch_response(items: list[BatchQueryItem], text_only: bool) -> StreamingResponse:
+    """Answer a batch, streaming one NDJSON result line per question as each completes."""
+    limit = get_settings().batch_query_max_questions
+    if len(items) > limit:
+        raise HTTPException(status_code=413, detail=f"Too many questions: {len(items)} (max {limit}).")
+    rag = RAGService()
+    questions = [
+        {"id": item.id or str(n), "question": item.question, "language": item.language}
+        for n, item in enumerate(items, start=1)
+    ]
+
+    async def lines():
+        try:
+            async for result in rag.answer_batch(questions, text_only=text_only):
+                yield BatchQueryResult(**result).model_dump_json(exclude_none=True) + "\n"
+        except Exception as e:
+            logger.error(f"Batch query error: {e}")
+            yield json.dumps({"error": f"Error processing batch: {str(e)}"}) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@router.post("/batch")
+async def batch_legal_questions(request: BatchQueryRequest):
+    """
+    Answer many questions at once (e.g. a legal-aid partner's CSV, converted).
+    Retrieval is batched, identical questions are answered once, and results
+    stream back as NDJSON lines ({"id", "question", "answer" | "error", ...})
+    in order of completion, not submission.
+    """
+    return _batch_response(request.questions, request.text_only)
+
+
+@router.post("/batch/upload")
+async def batch_legal_questions_upload(file: UploadFile = File(...), text_only: bool = False):
+    """
+    Same as /batch, for an uploaded NDJSON file: one question per line, either
+    a JSON object {"id", "question", "language"} or a bare JSON string.
+    """
+    items = []
+    content = (await file.read()).decode("utf-8-sig", errors="replace")
+    for line_no, line in enumerate(content.splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+            if isinstance(record, str):
+                record = {"question": record}
+            record = {**record, "id": record.get("id") or line_no}
+            items.append(BatchQueryItem(**record))
+        except (json.JSONDecodeError, TypeError, AttributeError, ValidationError) as e:
+            raise HTTPException(status_code=422, detail=f"Line {line_no}: {e}")
+    if not items:
+        raise HTTPException(status_code=400, detail="No questions found in the uploaded file.")
+    return _batch_response(items, text_only)
@@ -0,0 +1,130 @@
+"""
+NyayaSahaya — Semantic answer cache.
+Reuses a previous RAG answer when a new question's embedding is close enough
+to one already answered (same language, same index version).
+"""
+
+import logging
+import pickle
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class AnswerCache:
+    """Process-wide LRU/TTL cache of answers keyed on query embeddings."""
+
+    _instance: Optional["AnswerCache"] = None
+    _initialized: bool = False
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+        settings = get_settings()
+        self.enabled = settings.answer_cache_enabled
+        self.threshold = settings.answer_cache_similarity
+        self.max_entries = settings.answer_cache_max_entries
+        self.ttl = settings.answer_cache_ttl_seconds
+        self.persist = settings.answer_cache_persist
+        self.path = Path(settings.vector_store_dir) / "answer_cache.pkl"
+        # key -> {"vector", "language", "index_version", "result", "created_at"}
+        self._entries: OrderedDict[int, dict] = OrderedDict()
+        self._next_key = 0
+        self.hits = 0
+        self.misses = 0
+        self._initialized = True
+
+    @staticmethod
+    def _normalize(vector: np.ndarray) -> np.ndarray:
+        vector = np.asarray(vector, dtype="float32").reshape(-1)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def _evict_stale(self, index_version: str):
+        """Drop expired entries and entries built against another index version."""
+        now = time.time()
+        stale = [
+            key for key, e in self._entries.items()
+            if e["index_version"] != index_version or now - e["created_at"] > self.ttl
+        ]
+        for key in stale:
+            del self._entries[key]
+
+    def lookup(self, vector: np.ndarray, language: str, index_version: str) -> Optional[dict]:
+        """Return a cached result for a similar question, or None."""
+        if not self.enabled:
+            return None
+        self._evict_stale(index_version)
+
+        keys = [k for k, e in self._entries.items() if e["language"] == language]
+        if not keys:
+            self.misses += 1
+            return None
+
+        matrix = np.stack([self._entries[k]["vector"] for k in keys])
+        sims = matrix @ self._normalize(vector)
+        best = int(np.argmax(sims))
+        if sims[best] < self.threshold:
+            self.misses += 1
+            return None
+
+        key = keys[best]
+        self._entries.move_to_end(key)
+        self.hits += 1
+        logger.info(f"Answer cache hit (similarity {sims[best]:.3f})")
+        return self._entries[key]["result"]
+
+    def store(self, vector: np.ndarray, language: str, index_version: str, result: dict):
+        """Cache a generated result, evicting the least recently used entry if full."""
+        if not self.enabled:
+            return
+        self._entries[self._next_key] = {
+            "vector": self._normalize(vector),
+            "language": language,
+            "index_version": index_version,
+            "result": result,
+            "created_at": time.time(),
+        }
+        self._next_key += 1
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+    # ── Persistence ──────────────────────────────────────────
+    def save(self):
+        """Persist the cache to disk (only when answer_cache_persist is on)."""
+        if not (self.enabled and self.persist):
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "wb") as f:
+            pickle.dump(list(self._entries.values()), f)
+        logger.info(f"Saved {len(self._entries)} cached answers to {self.path}")
+
+    def load(self):
+        """Load a previously persisted cache, if any."""
+        if not (self.enabled and self.persist and self.path.exists()):
+            return
+        with open(self.path, "rb") as f:
+            entries = pickle.load(f)
+        for entry in entries[-self.max_entries:]:
+            self._entries[self._next_key] = entry
+            self._next_key += 1
+        logger.info(f"Loaded {len(self._entries)} cached answers from {self.path}")
+
+    @property
+    def stats(self) -> dict:
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
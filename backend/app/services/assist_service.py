@@ -0,0 +1,62 @@
+"""
+NyayaSahaya — Combined classify + answer for one piece of user text.
+
+The frontend used to send the same text to /api/classify and /api/query,
+each detecting the language and translating Tamil on its own. AssistService
+detects the language once, starts at most one translation and shares it,
+then runs classification and the RAG answer concurrently.
+"""
+
+import asyncio
+import logging
+import time
+
+from app.services.classifier_service import ClassifierService
+from app.services.language_service import LanguageService
+from app.services.rag_service import RAGService, _elapsed_ms
+
+logger = logging.getLogger(__name__)
+
+
+class AssistService:
+    """Classification and RAG answer for the same text, sharing language detection and translation."""
+
+    def __init__(self):
+        self.language = LanguageService()
+        self.classifier = ClassifierService()
+        self.rag = RAGService()
+
+    async def assist(self, question: str, force_language: str | None = None, text_only: bool = False) -> dict:
+        """
+        The RAG answer (as answer_question returns it) plus a "classification"
+        entry, which is None if classification failed: the answer is what the
+        user asked for, so it does not fail with it. Timings cover both.
+        """
+        start = time.perf_counter()
+        timings: dict = {}
+        detected_lang = force_language or self.language.detect_language(question)
+
+        translation = None
+        if detected_lang == "ta" and (self.classifier.translates_tamil or self.rag.translates_tamil):
+            translation = asyncio.ensure_future(self.language.translate(question, "ta", "en"))
+            # Neither side may end up awaiting it (e.g. a citation lookup); don't warn about its errors then
+            translation.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+        async def classify() -> dict | None:
+            classify_start = time.perf_counter()
+            try:
+                return await self.classifier.classify(question, detected_lang, translation)
+            except Exception as e:
+                logger.warning(f"Classification failed alongside the answer: {e}")
+                return None
+            finally:
+                timings["classification_ms"] = _elapsed_ms(classify_start)
+
+        classification, result = await asyncio.gather(
+            classify(),
+            self.rag.answer_question(question, detected_lang, text_only, translation),
+        )
+        result["timings"] = {**result["timings"], **timings, "total_ms": _elapsed_ms(start)}
+        result["category"] = classification["category"] if classification else None
+        result["classification"] = classification
+        return result
@@ -0,0 +1,206 @@
+"""
+NyayaSahaya — Columnar chunk store (text and metadata for every indexed vector).
+
+Instead of one Python dict per chunk, chunks live in a few flat NumPy arrays:
+all texts in one UTF-8 blob with an offsets array, repeated strings such as
+the source filename interned to small integer codes, and a vector-ID → row
+table for O(1) lookup. Saved as plain .npy files, the store is memory-mapped
+on load, so startup does not deserialise the corpus and every worker process
+shares the same page-cache copy. Optionally the store also keeps each chunk's
+full-precision embedding, used to re-score candidates from a quantized index.
+
+Arrays are never modified in place (mapped ones are read-only): writes build
+new arrays, which also makes copy() cheap for copy-on-write snapshots.
+"""
+
+import json
+from pathlib import Path
+from typing import Iterable, Optional
+
+import numpy as np
+
+# Per-chunk string fields stored as interned codes; missing values are ""
+STRING_COLUMNS = ("source", "act", "chapter", "section")
+
+_EMPTY_I64 = np.empty(0, dtype=np.int64)
+
+
+class ChunkStore:
+    """Chunk text and metadata keyed by FAISS vector ID."""
+
+    def __init__(self):
+        self.ids = _EMPTY_I64  # vector ID of each row, ascending
+        self.offsets = np.zeros(1, dtype=np.int64)  # row i's text is blob[offsets[i]:offsets[i + 1]]
+        self.blob = np.empty(0, dtype=np.uint8)
+        self.chunk_index = np.empty(0, dtype=np.int32)  # position of the chunk within its document
+        self.hashes = np.empty(0, dtype=np.uint64)  # text_hash() of each row
+        self.codes = {name: np.empty(0, dtype=np.int32) for name in STRING_COLUMNS}
+        self.vocab: dict[str, list[str]] = {name: [] for name in STRING_COLUMNS}
+        self.rows = _EMPTY_I64  # vector ID -> row, -1 when absent
+        self.vectors: Optional[np.ndarray] = None  # float32 embedding per row, if kept
+        self._codes_by_value: Optional[dict[str, dict[str, int]]] = None
+        self._row_by_hash: Optional[dict[int, int]] = None  # writer-side dedupe lookup, built lazily
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def copy(self) -> "ChunkStore":
+        """A copy that can be written without affecting this store (arrays are shared)."""
+        other = ChunkStore()
+        other.ids, other.offsets, other.blob = self.ids, self.offsets, self.blob
+        other.chunk_index, other.hashes, other.rows = self.chunk_index, self.hashes, self.rows
+        other.vectors = self.vectors
+        other.codes = dict(self.codes)
+        other.vocab = {name: list(values) for name, values in self.vocab.items()}
+        if self._row_by_hash is not None:
+            other._row_by_hash = dict(self._row_by_hash)
+        return other
+
+    # ── Reading ──────────────────────────────────────────────
+    def row(self, vector_id: int) -> int:
+        """Row of a vector ID, or -1 if it has no chunk."""
+        if 0 <= vector_id < len(self.rows):
+            return int(self.rows[vector_id])
+        return -1
+
+    def text(self, row: int) -> str:
+        return bytes(self.blob[self.offsets[row]:self.offsets[row + 1]]).decode("utf-8")
+
+    def get(self, vector_id: int) -> Optional[dict]:
+        """The chunk stored under a vector ID as a fresh dict, or None."""
+        row = self.row(vector_id)
+        if row < 0:
+            return None
+        chunk = {"text": self.text(row), "index": int(self.chunk_index[row])}
+        for name in STRING_COLUMNS:
+            value = self.vocab[name][self.codes[name][row]]
+            if value:
+                chunk[name] = value
+        chunk["text_hash"] = f"{int(self.hashes[row]):016x}"
+        return chunk
+
+    def has_hash(self, digest: str) -> bool:
+        """True if a chunk with this text hash is stored."""
+        if self._row_by_hash is None:
+            self._row_by_hash = dict(zip(self.hashes.tolist(), range(len(self.hashes))))
+        return int(digest, 16) in self._row_by_hash
+
+    # ── Writing ──────────────────────────────────────────────
+    def _intern(self, name: str, values: Iterable[str]) -> np.ndarray:
+        if self._codes_by_value is None:
+            self._codes_by_value = {n: {v: i for i, v in enumerate(self.vocab[n])} for n in STRING_COLUMNS}
+        lookup, vocab = self._codes_by_value[name], self.vocab[name]
+        codes = []
+        for value in values:
+            code = lookup.get(value)
+            if code is None:
+                code = lookup[value] = len(vocab)
+                vocab.append(value)
+            codes.append(code)
+        return np.asarray(codes, dtype=np.int32)
+
+    def append(self, ids: np.ndarray, chunks: list[dict], vectors: Optional[np.ndarray] = None):
+        """
+        Add chunks under vector IDs larger than any stored so far, with their
+        embeddings if given. Embeddings are only kept while every row has one.
+        """
+        if not chunks:
+            return
+        if vectors is not None and (self.vectors is not None or len(self.ids) == 0):
+            self.vectors = vectors if self.vectors is None else np.concatenate([self.vectors, vectors])
+        else:
+            self.vectors = None
+        encoded = [c["text"].encode("utf-8") for c in chunks]
+        lengths = np.fromiter((len(b) for b in encoded), dtype=np.int64, count=len(encoded))
+        first_row = len(self.ids)
+
+        self.blob = np.concatenate([self.blob, np.frombuffer(b"".join(encoded), dtype=np.uint8)])
+        self.offsets = np.concatenate([self.offsets, self.offsets[-1] + np.cumsum(lengths)])
+        self.ids = np.concatenate([self.ids, np.asarray(ids, dtype=np.int64)])
+        self.chunk_index = np.concatenate(
+            [self.chunk_index, np.asarray([c.get("index", 0) for c in chunks], dtype=np.int32)]
+        )
+        new_hashes = np.asarray([int(c["text_hash"], 16) for c in chunks], dtype=np.uint64)
+        self.hashes = np.concatenate([self.hashes, new_hashes])
+        for name in STRING_COLUMNS:
+            self.codes[name] = np.concatenate(
+                [self.codes[name], self._intern(name, (c.get(name) or "" for c in chunks))]
+            )
+
+        rows = np.full(int(self.ids[-1]) + 1, -1, dtype=np.int64)
+        rows[:len(self.rows)] = self.rows
+        rows[ids] = np.arange(first_row, len(self.ids), dtype=np.int64)
+        self.rows = rows
+        if self._row_by_hash is not None:
+            self._row_by_hash.update(zip(new_hashes.tolist(), range(first_row, len(self.ids))))
+
+    def remove_range(self, start: int, end: int) -> set[str]:
+        """Drop chunks with vector IDs in [start, end); returns their text hashes."""
+        drop = (self.ids >= start) & (self.ids < end)
+        if not drop.any():
+            return set()
+        keep = ~drop
+        removed = {f"{h:016x}" for h in self.hashes[drop].tolist()}
+
+        lengths = np.diff(self.offsets)
+        self.blob = self.blob[np.repeat(keep, lengths)]
+        self.offsets = np.concatenate([[0], np.cumsum(lengths[keep])]).astype(np.int64)
+        self.ids = self.ids[keep]
+        self.chunk_index = self.chunk_index[keep]
+        self.hashes = self.hashes[keep]
+        if self.vectors is not None:
+            self.vectors = self.vectors[keep]
+        self.codes = {name: codes[keep] for name, codes in self.codes.items()}
+
+        rows = np.full(len(self.rows), -1, dtype=np.int64)
+        rows[self.ids] = np.arange(len(self.ids), dtype=np.int64)
+        self.rows = rows
+        self._row_by_hash = None
+        return removed
+
+    @classmethod
+    def from_records(cls, records: dict[int, dict]) -> "ChunkStore":
+        """Build a store from {vector_id: chunk dict} (the old metadata.pkl layout)."""
+        store = cls()
+        ids = sorted(records)
+        store.append(np.asarray(ids, dtype=np.int64), [records[i] for i in ids])
+        return store
+
+    # ── Persistence ──────────────────────────────────────────
+    def _arrays(self) -> dict[str, np.ndarray]:
+        arrays = {
+            "ids": self.ids, "offsets": self.offsets, "text": self.blob,
+            "chunk_index": self.chunk_index, "hashes": self.hashes, "rows": self.rows,
+        }
+        arrays.update({f"col_{name}": codes for name, codes in self.codes.items()})
+        if self.vectors is not None:
+            arrays["vectors"] = self.vectors
+        return arrays
+
+    def save(self, directory: Path):
+        """Write the arrays as .npy files plus the interned strings into `directory`."""
+        directory.mkdir(parents=True, exist_ok=True)
+        for name, array in self._arrays().items():
+            np.save(directory / f"{name}.npy", np.ascontiguousarray(array))
+        with open(directory / "vocab.json", "w", encoding="utf-8") as f:
+            json.dump(self.vocab, f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, directory: Path, mmap: bool = True) -> "ChunkStore":
+        """Open a saved store; with `mmap` the arrays are mapped read-only instead of read."""
+        store = cls()
+        mode = "r" if mmap else None
+        arrays = {path.stem: np.load(path, mmap_mode=mode) for path in directory.glob("*.npy")}
+        store.ids, store.offsets, store.blob = arrays["ids"], arrays["offsets"], arrays["text"]
+        store.chunk_index, store.hashes, store.rows = arrays["chunk_index"], arrays["hashes"], arrays["rows"]
+        store.vectors = arrays.get("vectors")
+        with open(directory / "vocab.json", "r", encoding="utf-8") as f:
+            vocab = json.load(f)
+        for name in STRING_COLUMNS:
+            store.vocab[name] = vocab.get(name) or [""]
+            store.codes[name] = arrays.get(f"col_{name}", np.zeros(len(store.ids), dtype=np.int32))
+        return store
+
+    def nbytes(self) -> int:
+        """Total size of the arrays (resident only for pages actually touched when mapped)."""
+        return sum(a.nbytes for a in self._arrays().values())
@@ -0,0 +1,176 @@
+"""
+NyayaSahaya — Section-number lookup for direct citation queries.
+
+Questions like "what is IPC 420" or "BNS section 103" name the provision they
+want. parse_citations() recognises such citations with a few regexes, and
+CitationIndex maps (act, section) → vector IDs using the act / section
+metadata the statute chunker records. The cited section's chunks can then be
+fetched without embedding the question or searching FAISS.
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+# Canonical act key → how the act is written in questions and in act headings.
+# Checked in order, so more specific names come before names they contain.
+ACT_ALIASES: dict[str, tuple[str, ...]] = {
+    "BNSS": ("bnss", "bharatiya nagarik suraksha sanhita"),
+    "BNS": ("bns", "bharatiya nyaya sanhita"),
+    "BSA": ("bsa", "bharatiya sakshya adhiniyam"),
+    "IPC": ("ipc", "indian penal code", "penal code"),
+    "CrPC": ("crpc", r"cr\.p\.c\.?", "code of criminal procedure"),
+    "CPC": ("cpc", "code of civil procedure"),
+    "Evidence Act": ("iea", "evidence act"),
+    "IT Act": ("it act", "information technology act"),
+    "RTI Act": ("rti act", "rti", "right to information act"),
+    "NI Act": ("ni act", "negotiable instruments act"),
+    "Contract Act": ("contract act",),
+    "HMA": ("hma", "hindu marriage act"),
+    "HSA": ("hsa", "hindu succession act"),
+    "SMA": ("special marriage act",),
+    "NDPS": ("ndps", "narcotic drugs and psychotropic substances"),
+    "POCSO": ("pocso", "protection of children from sexual offences"),
+    "MV Act": ("mv act", "motor vehicles act"),
+    "DV Act": ("dv act", "pwdva", "domestic violence act"),
+    "SC/ST Act": (r"sc\s*/?\s*st act", "atrocities act", "scheduled castes and scheduled tribes"),
+    "PC Act": ("pc act", "prevention of corruption act"),
+    "Consumer Protection Act": ("cpa", "consumer protection act"),
+    "TPA": ("tpa", "transfer of property act"),
+    "Arbitration Act": ("arbitration and conciliation act", "arbitration act"),
+    "Arms Act": ("arms act",),
+    "Constitution": ("constitution",),
+}
+
+_ALIAS_RES = {key: re.compile(r"\b(?:" + "|".join(aliases) + r")(?!\w)") for key, aliases in ACT_ALIASES.items()}
+_ANY_ACT = "|".join(f"(?:{a})" for aliases in ACT_ALIASES.values() for a in aliases)
+
+_NUMBER = r"(\d{1,3}[a-z]{0,2}(?:\(\w{1,4}\))?)(?![\w(])"
+_SECTION_WORD = r"(?:section|sec\.?|s\.|u/s\.?|பிரிவு)"
+_SECTION_RE = re.compile(rf"\b{_SECTION_WORD}\s*{_NUMBER}")
+_ARTICLE_RE = re.compile(rf"\b(?:article|art\.)\s*{_NUMBER}")
+# "ipc 420", "ipc section 420", "420 ipc", "420 of the ipc"
+_ACT_FIRST_RE = re.compile(rf"\b({_ANY_ACT})\s+(?:{_SECTION_WORD}\s*)?{_NUMBER}")
+_NUMBER_FIRST_RE = re.compile(rf"(?<![\w(]){_NUMBER}\s+(?:of\s+(?:the\s+)?)?({_ANY_ACT})(?!\w)")
+# "498-A" / "498 A" → "498A", as lexical_index does for BM25. Only a capital after a
+# space, so "is IPC 420 a bailable offence" keeps its article
+_SECTION_SUFFIX = re.compile(r"\b(\d+)(?:-([a-zA-Z])|\s([A-Z]))\b")
+
+
+class Citation(NamedTuple):
+    act: Optional[str]  # canonical act key, None when the question names no act
+    section: str  # "420", "2(D)", "Article 21"
+
+    def __str__(self) -> str:
+        section = self.section if self.section.startswith("Article") else f"Section {self.section}"
+        return f"{self.act} {section}" if self.act else section
+
+
+def act_key(name: str) -> Optional[str]:
+    """Canonical key for an act heading or name ("INDIAN PENAL CODE (IPC)" → "IPC"), or None."""
+    text = name.lower().replace("_", " ")
+    for key, pattern in _ALIAS_RES.items():
+        if pattern.search(text):
+            return key
+    return None
+
+
+def _normalize_section(number: str) -> str:
+    return number.upper().replace(" ", "")
+
+
+def _act_citation(act: Optional[str], number: str) -> Citation:
+    """A citation of section `number` of `act`; the Constitution's are articles."""
+    if act == "Constitution":
+        return Citation(act, f"Article {_normalize_section(number)}")
+    return Citation(act, _normalize_section(number))
+
+
+def parse_citations(question: str) -> list[Citation]:
+    """Citations named in a question, in order of appearance and without duplicates."""
+    text = _SECTION_SUFFIX.sub(lambda m: m.group(1) + (m.group(2) or m.group(3)), question).lower()
+    found: list[tuple[int, Citation]] = []
+    numbers: list[tuple[int, int]] = []  # spans of the section numbers matched with an act or as articles
+    for match in _ACT_FIRST_RE.finditer(text):
+        found.append((match.start(), _act_citation(act_key(match.group(1)), match.group(2))))
+        numbers.append(match.span(2))
+    for match in _NUMBER_FIRST_RE.finditer(text):
+        found.append((match.start(), _act_citation(act_key(match.group(2)), match.group(1))))
+        numbers.append(match.span(1))
+    for match in _ARTICLE_RE.finditer(text):
+        found.append((match.start(), Citation("Constitution", f"Article {_normalize_section(match.group(1))}")))
+        numbers.append(match.span(1))
+    # "section 420" on its own (also next to other citations, as in "section 498A
+    # of IPC and section 304B"): attribute it to the only act the question names, if any
+    acts = {key for key, pattern in _ALIAS_RES.items() if pattern.search(text)}
+    act = acts.pop() if len(acts) == 1 else None
+    for match in _SECTION_RE.finditer(text):
+        start, end = match.span(1)
+        if not any(start < e and s < end for s, e in numbers):
+            found.append((match.start(), Citation(act, _normalize_section(match.group(1)))))
+    citations = []
+    for _, citation in sorted(found):
+        if citation not in citations:
+            citations.append(citation)
+    return citations
+
+
+class CitationIndex:
+    """(act key, section) → vector IDs of the chunks holding that section."""
+
+    def __init__(self, entries: Optional[dict[str, dict[str, list[int]]]] = None):
+        self.entries: dict[str, dict[str, list[int]]] = entries or {}  # act -> section -> IDs, in document order
+
+    @classmethod
+    def from_chunks(cls, chunks) -> "CitationIndex":
+        """Build from a ChunkStore's act / section / source columns."""
+        entries: dict[str, dict[str, list[int]]] = {}
+        section_vocab, act_vocab, source_vocab = (chunks.vocab[n] for n in ("section", "act", "source"))
+        section_codes = chunks.codes["section"]
+        cited = np.isin(section_codes, [code for code, value in enumerate(section_vocab) if value])
+        keys_by_code: dict[tuple[int, int], Optional[str]] = {}
+        for row in np.flatnonzero(cited).tolist():
+            value = section_vocab[section_codes[row]]
+            act_code, source_code = int(chunks.codes["act"][row]), int(chunks.codes["source"][row])
+            if (act_code, source_code) not in keys_by_code:
+                keys_by_code[(act_code, source_code)] = (
+                    act_key(act_vocab[act_code]) if act_vocab[act_code] else act_key(source_vocab[source_code])
+                )
+            act = keys_by_code[(act_code, source_code)] or act_vocab[act_code] or source_vocab[source_code]
+            sections = entries.setdefault(act, {})
+            vector_id = int(chunks.ids[row])
+            for section in value.split(", "):
+                section = _normalize_section(section) if not section.startswith("Article") else section
+                names = [section]
+                if "(" in section:
+                    names.append(section.split("(")[0])  # "2(D)" is also found as section 2
+                for name in names:
+                    ids = sections.setdefault(name, [])
+                    if vector_id not in ids:
+                        ids.append(vector_id)
+        return cls(entries)
+
+    def lookup(self, citation: Citation) -> list[int]:
+        """
+        Vector IDs for a citation. Citations without an act never match: "Section 438"
+        could be an indexed IPC section when the question is about the CrPC.
+        """
+        if citation.act is None:
+            return []
+        return list(self.entries.get(citation.act, {}).get(citation.section, []))
+
+    def __len__(self) -> int:
+        return sum(len(sections) for sections in self.entries.values())
+
+    # ── Persistence ──────────────────────────────────────────
+    def save(self, path: Path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path: Path) -> "CitationIndex":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
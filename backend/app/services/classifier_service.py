@@ -1,35 +1,105 @@
 """
 NyayaSahaya — Legal issue classifier service.
+
+Descriptions are classified locally by nearest centroid over the embedding
+model (see LocalClassifier); the LLM is only asked when the local classifier
+is not confident enough, or when CLASSIFIER_MODE=llm.
 """
 
 import json
 import logging
+from typing import Awaitable, Optional
+
+from app.config import get_settings
 from app.services.llm_service import LLMService
 from app.services.language_service import LanguageService
-from app.utils.constants import CLASSIFIER_PROMPT, LEGAL_CATEGORIES, DISCLAIMER
+from app.services.local_classifier import LocalClassifier
+from app.utils.constants import (
+    CATEGORY_DESCRIPTIONS,
+    CLASSIFIER_PARSE_ERROR,
+    CLASSIFIER_PROMPT,
+    DISCLAIMER,
+    LEGAL_CATEGORIES,
+    LOCAL_CLASSIFIER_EXPLANATION,
+)
 
 logger = logging.getLogger(__name__)
 
 
+def confidence_label(probability: float) -> str:
+    """High / Medium / Low, as the LLM reports confidence."""
+    if probability >= 0.8:
+        return "High"
+    if probability >= 0.6:
+        return "Medium"
+    return "Low"
+
+
 class ClassifierService:
-    """Classifies legal issues into predefined categories using LLM."""
+    """Classifies legal issues into predefined categories, locally with an LLM fallback."""
 
     def __init__(self):
         self.llm = LLMService()
         self.language = LanguageService()
+        self.settings = get_settings()
+        self.local = LocalClassifier() if self.settings.classifier_mode == "local" else None
 
-    async def classify(self, description: str) -> dict:
+    @property
+    def translates_tamil(self) -> bool:
+        """Whether Tamil descriptions are classified in English (a multilingual
+        embedding model in cross-lingual mode classifies Tamil directly)."""
+        return self.local is None or self.settings.tamil_retrieval_mode != "crosslingual"
+
+    async def classify(
+        self,
+        description: str,
+        detected_lang: Optional[str] = None,
+        translation: Optional[Awaitable[str]] = None,
+    ) -> dict:
         """
         Classify a legal issue description.
-        Returns category, confidence, and explanation.
+        Returns category, confidence, explanation and the method used ("local" or "llm").
+        Callers that already know the language, or are already translating a
+        Tamil description, pass `detected_lang` / `translation` to reuse them.
         """
-        detected_lang = self.language.detect_language(description)
+        detected_lang = detected_lang or self.language.detect_language(description)
 
         # Translate to English for classification if Tamil
         classify_text = description
-        if detected_lang == "ta":
-            classify_text = await self.language.translate(description, "ta", "en")
+        if detected_lang == "ta" and self.translates_tamil:
+            if translation is None:
+                translation = self.language.translate(description, "ta", "en")
+            classify_text = await translation
+
+        result = None
+        if self.local is not None:
+            category, probability = await self.local.classify(classify_text)
+            if probability >= self.settings.classifier_min_confidence:
+                result = {
+                    "category": category,
+                    "confidence": confidence_label(probability),
+                    "explanation": LOCAL_CLASSIFIER_EXPLANATION.format(
+                        category=category, description=CATEGORY_DESCRIPTIONS[category]
+                    ),
+                    "method": "local",
+                }
+            else:
+                logger.info(f"Local classifier unsure ({category}, p={probability:.2f}); asking the LLM")
+        if result is None:
+            result = await self._classify_llm(classify_text)
 
+        # Translate explanation back to Tamil if needed
+        if detected_lang == "ta" and result.get("explanation"):
+            result["explanation"] = await self.language.translate(
+                result["explanation"], "en", "ta"
+            )
+
+        result["detected_language"] = detected_lang
+        result["disclaimer"] = DISCLAIMER
+        return result
+
+    async def _classify_llm(self, classify_text: str) -> dict:
+        """One LLM classification call, validated against LEGAL_CATEGORIES."""
         prompt = CLASSIFIER_PROMPT.format(description=classify_text)
 
         response = await self.llm.generate_json(
@@ -44,20 +114,12 @@ class ClassifierService:
             result = {
                 "category": "Civil",
                 "confidence": "Low",
-                "explanation": "Could not parse classification result.",
+                "explanation": CLASSIFIER_PARSE_ERROR,
             }
 
         # Validate category
         if result.get("category") not in LEGAL_CATEGORIES:
             result["category"] = "Civil"
             result["confidence"] = "Low"
-
-        # Translate explanation back to Tamil if needed
-        if detected_lang == "ta" and result.get("explanation"):
-            result["explanation"] = await self.language.translate(
-                result["explanation"], "en", "ta"
-            )
-
-        result["detected_language"] = detected_lang
-        result["disclaimer"] = DISCLAIMER
+        result["method"] = "llm"
         return result
@@ -3,6 +3,9 @@ NyayaSahaya — Legal complaint draft generation service.
 """
 
 import logging
+from typing import Optional
+
+from app.services.draft_store import DraftStore, details_key
 from app.services.llm_service import LLMService
 from app.utils.constants import COMPLAINT_PROMPT_EN, COMPLAINT_PROMPT_TA, DISCLAIMER
 
@@ -14,6 +17,7 @@ class ComplaintService:
 
     def __init__(self):
         self.llm = LLMService()
+        self.drafts = DraftStore()
 
     async def generate_complaint(
         self,
@@ -25,7 +29,7 @@ class ComplaintService:
         date: str,
         language: str = "en",
     ) -> dict:
-        """Generate a formal legal complaint letter."""
+        """Generate a formal legal complaint letter and keep it in the draft store."""
 
         template = COMPLAINT_PROMPT_EN if language == "en" else COMPLAINT_PROMPT_TA
 
@@ -50,8 +54,54 @@ class ComplaintService:
             max_tokens=2500,
         )
 
+        details = {
+            "complainant_name": complainant_name,
+            "complainant_address": complainant_address,
+            "opponent_name": opponent_name,
+            "issue_description": issue_description,
+            "location": location,
+            "date": date,
+            "language": language,
+        }
         return {
+            "draft_id": self.drafts.put(draft, language, details),
             "draft_text": draft,
             "language": language,
+            "complainant_name": complainant_name,
             "disclaimer": DISCLAIMER,
         }
+
+    async def resolve_draft(
+        self,
+        draft_id: Optional[str] = None,
+        draft_text: Optional[str] = None,
+        language: str = "en",
+        details: Optional[dict] = None,
+    ) -> dict:
+        """
+        The draft to render as a PDF, generating one only as a last resort:
+        1. `draft_text`, the user's (possibly edited) copy, as-is
+        2. the stored draft for `draft_id`, if it was generated from `details`
+           (when sent) rather than an earlier version of the form
+        3. the latest stored draft generated from the same form `details`
+        4. a newly generated draft for `details`
+        Raises LookupError if none of these applies.
+        """
+        if draft_text:
+            return {"draft_text": draft_text, "language": language}
+        if draft_id:
+            draft = self.drafts.get(draft_id)
+            if draft is not None and (details is None or draft["details_key"] == details_key(details)):
+                return draft
+            if draft is not None:
+                logger.info("Form details changed since the draft was generated; not using it for the PDF")
+        if details is None:
+            raise LookupError(
+                "Draft not found or expired; generate it again." if draft_id
+                else "Send a draft_id, the draft_text or the complaint details."
+            )
+        draft = self.drafts.find(details)
+        if draft is not None:
+            return draft
+        logger.info("No stored draft for these details; generating one for the PDF")
+        return await self.generate_complaint(**details)
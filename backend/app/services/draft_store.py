@@ -0,0 +1,99 @@
+"""
+NyayaSahaya — Short-lived store of generated complaint drafts.
+
+/complaint/draft returns a draft ID alongside the text. /complaint/pdf renders
+the stored draft for that ID instead of asking the LLM for a new (and
+different) one. Drafts expire after COMPLAINT_DRAFT_TTL_SECONDS and the oldest
+are dropped beyond COMPLAINT_DRAFT_MAX_ENTRIES; they hold personal details, so
+they are kept in memory only.
+"""
+
+import hashlib
+import json
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from typing import Optional
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+def details_key(details: dict) -> str:
+    """Hash of the form details a draft was generated from."""
+    return hashlib.sha256(json.dumps(details, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+class DraftStore:
+    """Process-wide TTL store of complaint drafts, by draft ID and by form details."""
+
+    _instance: Optional["DraftStore"] = None
+    _initialized: bool = False
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+        settings = get_settings()
+        self.ttl = settings.complaint_draft_ttl_seconds
+        self.max_entries = settings.complaint_draft_max_entries
+        # draft_id -> {"draft_id", "draft_text", "language", "complainant_name", "details_key", "created_at"},
+        # oldest first
+        self._drafts: OrderedDict[str, dict] = OrderedDict()
+        self._by_details: dict[str, str] = {}  # details hash -> latest draft_id
+        self.hits = 0
+        self.misses = 0
+        self._initialized = True
+
+    def _evict(self):
+        """Drop expired drafts, then the oldest beyond max_entries."""
+        now = time.time()
+        while self._drafts:
+            draft_id, draft = next(iter(self._drafts.items()))
+            if now - draft["created_at"] <= self.ttl and len(self._drafts) <= self.max_entries:
+                break
+            del self._drafts[draft_id]
+            if self._by_details.get(draft["details_key"]) == draft_id:
+                del self._by_details[draft["details_key"]]
+
+    def put(self, draft_text: str, language: str, details: dict) -> str:
+        """Store a generated draft; returns its ID."""
+        draft_id = uuid.uuid4().hex
+        key = details_key(details)
+        self._drafts[draft_id] = {
+            "draft_id": draft_id,
+            "draft_text": draft_text,
+            "language": language,
+            "complainant_name": details.get("complainant_name"),
+            "details_key": key,
+            "created_at": time.time(),
+        }
+        self._by_details[key] = draft_id
+        self._evict()
+        return draft_id
+
+    def get(self, draft_id: str) -> Optional[dict]:
+        """The draft with this ID, or None if unknown or expired."""
+        self._evict()
+        draft = self._drafts.get(draft_id)
+        if draft is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return draft
+
+    def find(self, details: dict) -> Optional[dict]:
+        """The latest draft generated from exactly these form details, or None."""
+        draft_id = self._by_details.get(details_key(details))
+        return self.get(draft_id) if draft_id else None
+
+    @property
+    def stats(self) -> dict:
+        self._evict()
+        return {"drafts": len(self._drafts), "hits": self.hits, "misses": self.misses}
@@ -4,8 +4,12 @@ Embeddings run 100% locally on CPU — no API quota used.
 Gemini is only used for LLM answer generation.
 """
 
+import asyncio
 import logging
-import pickle
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -14,12 +18,19 @@ import numpy as np
 from sentence_transformers import SentenceTransformer
 
 from app.config import get_settings
+from app.services.chunk_store import ChunkStore
+from app.services.query_batcher import QueryBatcher
+from app.services.vector_store import IndexProgress, VectorStore, search_parameters
+from app.utils.memory import process_memory_mb
 
 logger = logging.getLogger(__name__)
 
+# Chunks per encode() call while indexing, so progress can be reported
+_EMBED_BATCH = 256
+
 
 class EmbeddingService:
-    """Manages text embeddings via Gemini and the FAISS vector index."""
+    """Manages local text embeddings and the published FAISS vector store."""
 
     _instance: Optional["EmbeddingService"] = None
     _initialized: bool = False
@@ -34,84 +45,262 @@ class EmbeddingService:
             return
         settings = get_settings()
         model_name = settings.local_embedding_model
+        self.model_name = model_name
         logger.info(f"Loading local embedding model: {model_name}")
         self.model = SentenceTransformer(model_name)
         self.dimension = self.model.get_sentence_embedding_dimension()
         logger.info(f"Embedding dimension: {self.dimension}")
-        self.index: Optional[faiss.IndexFlatL2] = None
-        self.metadata: list[dict] = []  # parallel list of chunk metadata
-        self.index_path = Path(settings.vector_store_dir) / "index.faiss"
-        self.meta_path = Path(settings.vector_store_dir) / "metadata.pkl"
+        self.index_factory = settings.faiss_index_factory
+        self.metric = settings.faiss_metric
+        self.nprobe = settings.faiss_nprobe
+        self.ef_search = settings.faiss_ef_search
+        self.mmap = settings.faiss_mmap
+        self.rerank_candidates = settings.faiss_rerank_candidates
+        self.min_similarity = settings.retrieval_min_similarity
+        self.similarity_dropoff = settings.retrieval_similarity_dropoff
+        self.hybrid = settings.hybrid_retrieval
+        self.hybrid_candidates = settings.hybrid_candidates
+        self.rrf_k = settings.hybrid_rrf_k
+        self.bm25_min_ratio = settings.hybrid_bm25_min_ratio
+        # BM25 runs here while FAISS searches on the calling thread
+        self._lexical_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="bm25")
+        # Queries from concurrent requests are embedded together on one thread
+        self.query_batcher: Optional[QueryBatcher] = None
+        if settings.embed_batching:
+            self.query_batcher = QueryBatcher(
+                self._encode_queries, settings.embed_batch_max_size, settings.embed_batch_max_wait_ms / 1000
+            )
+        self.store_dir = Path(settings.vector_store_dir)
+        self.manifest_path = self.store_dir / "manifest.json"
+        self.store = self._new_store()  # the published snapshot that queries read
+        self.load_report: dict = {}  # how the index was loaded at startup, for /health
+        self._write_lock = threading.Lock()  # one writer at a time; readers never wait
         self._initialized = True
 
+    def _new_store(self) -> VectorStore:
+        return VectorStore(
+            self.dimension,
+            self.index_factory,
+            self.embed_texts,
+            keep_vectors=self.rerank_candidates > 0,
+            metric=self.metric,
+        )
+
     # ── Embedding ────────────────────────────────────────────
-    def embed_texts(self, texts: list[str]) -> np.ndarray:
+    def embed_texts(self, texts: list[str], progress: Optional[IndexProgress] = None) -> np.ndarray:
         """Generate embeddings locally using SentenceTransformer (no API, no quota)."""
-        vectors = self.model.encode(texts, batch_size=64, show_progress_bar=False, convert_to_numpy=True)
-        return vectors.astype("float32")
+        if progress is None:
+            vectors = self.model.encode(texts, batch_size=64, show_progress_bar=False, convert_to_numpy=True)
+            return vectors.astype("float32")
+        parts = []
+        for start in range(0, len(texts), _EMBED_BATCH):
+            batch = texts[start:start + _EMBED_BATCH]
+            parts.append(self.model.encode(batch, batch_size=64, show_progress_bar=False, convert_to_numpy=True))
+            progress.advance(len(batch))
+        return np.vstack(parts).astype("float32")
 
     def embed_query(self, text: str) -> np.ndarray:
         """Generate embedding for a single query locally."""
         vector = self.model.encode([text], convert_to_numpy=True)
         return vector[0].astype("float32")
 
+    def _encode_queries(self, texts: list[str]) -> np.ndarray:
+        """One forward pass over a micro-batch of queries (see QueryBatcher)."""
+        vectors = self.model.encode(texts, batch_size=len(texts), show_progress_bar=False, convert_to_numpy=True)
+        return vectors.astype("float32")
+
+    async def embed_query_async(self, text: str) -> np.ndarray:
+        """
+        Embed a query off the event loop. With EMBED_BATCHING, queries arriving
+        within EMBED_BATCH_MAX_WAIT_MS of each other share one encode() call.
+        """
+        if self.query_batcher is None:
+            return await asyncio.to_thread(self.embed_query, text)
+        return await self.query_batcher.embed(text)
+
     # ── Index management ─────────────────────────────────────
+    # Writers update a copy of the published snapshot and publish it, with the
+    # next version number, in a single assignment. Readers take `self.store`
+    # once per request and never wait on the write lock.
+    def _write(self, update, progress: Optional[IndexProgress] = None, fresh: bool = False):
+        with self._write_lock:
+            # A fresh store reuses nothing from the published one, so don't copy it
+            work = self._new_store() if fresh else self.store.copy()
+            work.progress = progress or IndexProgress()
+            result = update(work)
+            work.progress = IndexProgress()
+            current = self.store
+            if fresh or work.next_id != current.next_id or work.files != current.files:
+                work.version = current.version + 1
+                # Build the citation index and BM25 postings now, not on the first queries
+                work.citations
+                work.lexical.warm()
+                self.store = work
+        return result
+
+    def snapshot(self) -> VectorStore:
+        """The currently published store; treat it as read-only."""
+        return self.store
+
     def create_index(self):
-        """Create a fresh FAISS index."""
-        self.index = faiss.IndexFlatL2(self.dimension)
-        self.metadata = []
+        """Publish a fresh, empty index."""
+        self._write(lambda store: store.reset(), fresh=True)
 
     def add_chunks(self, chunks: list[dict]):
         """
-        Add document chunks to the index.
+        Add document chunks to the index, skipping text that is already indexed.
         Each chunk: {"text": str, "source": str, "index": int}
         """
-        if self.index is None:
-            self.create_index()
-
-        texts = [c["text"] for c in chunks]
-        vectors = self.embed_texts(texts)
-        self.index.add(vectors)
-        self.metadata.extend(chunks)
-        logger.info(f"Added {len(chunks)} chunks to FAISS index (total: {self.index.ntotal})")
-
-    def search(self, query: str, top_k: int = 5) -> list[dict]:
-        """Search the FAISS index and return top-k matching chunks."""
-        if self.index is None or self.index.ntotal == 0:
+        added = self._write(lambda store: store.add_chunks(chunks))
+        logger.info(f"Added {added} chunks to FAISS index (total: {self.total_vectors})")
+
+    def index_file(self, path: Path, progress: Optional[IndexProgress] = None) -> dict:
+        """(Re-)index one document; see VectorStore.index_file."""
+        return self._write(lambda store: store.index_file(path), progress)
+
+    def sync_documents(self, paths: list[Path], full: bool = False, progress: Optional[IndexProgress] = None) -> dict:
+        """Incrementally (or fully) re-index `paths`; see VectorStore.sync."""
+        if full or self.store.index is None or self.store.needs_rebuild:
+            return self._write(lambda store: store.sync(paths, full=True), progress, fresh=True)
+        return self._write(lambda store: store.sync(paths), progress)
+
+    def search(
+        self,
+        query: str,
+        top_k: int = 5,
+        nprobe: Optional[int] = None,
+        ef_search: Optional[int] = None,
+    ) -> list[dict]:
+        """Search the index (FAISS, plus BM25 when hybrid) and return top-k matching chunks."""
+        if self.total_vectors == 0:
             return []
 
-        query_vec = self.embed_query(query).reshape(1, -1)
-        distances, indices = self.index.search(query_vec, min(top_k, self.index.ntotal))
+        return self.search_by_vector(
+            self.embed_query(query), top_k=top_k, nprobe=nprobe, ef_search=ef_search, query_text=query
+        )
+
+    def search_by_vector(
+        self,
+        query_vec: np.ndarray,
+        top_k: int = 5,
+        nprobe: Optional[int] = None,
+        ef_search: Optional[int] = None,
+        store: Optional[VectorStore] = None,
+        min_similarity: Optional[float] = None,
+        dropoff: Optional[float] = None,
+        query_text: Optional[str] = None,
+    ) -> list[dict]:
+        """
+        Search the FAISS index with an already-computed query embedding.
+        `nprobe` / `ef_search` override the configured defaults for IVF / HNSW indexes,
+        `min_similarity` / `dropoff` the relevance cutoff applied to cosine scores.
+        Pass `store` (from snapshot()) to pin a request to one index version.
+        With `query_text` and hybrid retrieval on, BM25 is searched in parallel
+        and both rankings are fused by reciprocal rank (see VectorStore.fuse).
+        """
+        return self.search_by_vectors(
+            query_vec.reshape(1, -1), top_k, nprobe, ef_search, store, min_similarity, dropoff,
+            [query_text] if query_text else None,
+        )[0]
 
-        results = []
-        for dist, idx in zip(distances[0], indices[0]):
-            if idx < len(self.metadata) and idx >= 0:
-                chunk = self.metadata[idx].copy()
-                chunk["score"] = float(dist)
-                results.append(chunk)
-        return results
+    def search_by_vectors(
+        self,
+        query_vecs: np.ndarray,
+        top_k: int = 5,
+        nprobe: Optional[int] = None,
+        ef_search: Optional[int] = None,
+        store: Optional[VectorStore] = None,
+        min_similarity: Optional[float] = None,
+        dropoff: Optional[float] = None,
+        query_texts: Optional[list[str]] = None,
+    ) -> list[list[dict]]:
+        """search_by_vector() for each row of `query_vecs` with a single multi-row FAISS search."""
+        store = store or self.store
+        if store.index is None:
+            return [[] for _ in range(len(query_vecs))]
+        lexical = None
+        if self.hybrid and query_texts:
+            lexical = [
+                self._lexical_pool.submit(store.search_lexical, text, self.hybrid_candidates, self.bm25_min_ratio)
+                for text in query_texts
+            ]
+        params = search_parameters(store.index, nprobe or self.nprobe, ef_search or self.ef_search)
+        cutoff = {
+            "min_score": self.min_similarity if min_similarity is None else min_similarity,
+            "dropoff": self.similarity_dropoff if dropoff is None else dropoff,
+        }
+        if lexical is None:
+            return store.search_batch(query_vecs, top_k, params, rerank=self.rerank_candidates, **cutoff)
+        # With BM25 the relevance cutoff applies after fusion, so keyword hits cannot refill top_k
+        dense = store.search_batch(query_vecs, max(top_k, self.hybrid_candidates), params, rerank=self.rerank_candidates)
+        return [
+            store.fuse(d, future.result(), top_k, self.rrf_k, query_vec=q, **cutoff)
+            for d, future, q in zip(dense, lexical, query_vecs)
+        ]
 
     # ── Persistence ──────────────────────────────────────────
     def save_index(self):
-        """Save the FAISS index and metadata to disk."""
-        if self.index is None:
-            return
-        self.index_path.parent.mkdir(parents=True, exist_ok=True)
-        faiss.write_index(self.index, str(self.index_path))
-        with open(self.meta_path, "wb") as f:
-            pickle.dump(self.metadata, f)
-        logger.info(f"Saved FAISS index ({self.index.ntotal} vectors) to {self.index_path}")
+        """Save the FAISS index, chunk store and manifest to disk."""
+        with self._write_lock:
+            store = self.store
+            if store.index is None:
+                return
+            store.save(self.store_dir, self.model_name)
+        logger.info(f"Saved FAISS index ({store.total_vectors} vectors) to {self.index_path}")
 
     def load_index_if_exists(self):
-        """Load a previously saved index from disk."""
-        if self.index_path.exists() and self.meta_path.exists():
-            self.index = faiss.read_index(str(self.index_path))
-            with open(self.meta_path, "rb") as f:
-                self.metadata = pickle.load(f)
-            logger.info(f"Loaded FAISS index ({self.index.ntotal} vectors) from {self.index_path}")
-        else:
+        """Load a previously saved index from disk and log load time and memory."""
+        legacy = (self.store_dir / "index.faiss").exists() and (self.store_dir / "metadata.pkl").exists()
+        if not (self.manifest_path.exists() or legacy):
             logger.info("No existing FAISS index found; starting fresh.")
+            return
+
+        before = process_memory_mb()
+        start = time.perf_counter()
+        store = self._new_store()
+        store.load(self.store_dir, self.model_name, mmap=self.mmap)
+        with self._write_lock:
+            self.store = store
+        self.load_report = {
+            "pid": os.getpid(),
+            "vectors": store.total_vectors,
+            "mmap": store.mapped,
+            "load_seconds": round(time.perf_counter() - start, 3),
+            "memory_before": before,
+            "memory_after": process_memory_mb(),
+        }
+        logger.info(
+            f"Loaded FAISS index ({store.total_vectors} vectors, {'mmap' if store.mapped else 'in memory'}) "
+            f"from {self.index_path} in {self.load_report['load_seconds']}s; "
+            f"worker {self.load_report['pid']} memory {before} -> {self.load_report['memory_after']}"
+        )
+
+    # ── Published-store accessors ────────────────────────────
+    @property
+    def index_path(self) -> Path:
+        return self.store.index_path or self.store_dir / "index.faiss"
+
+    @property
+    def index_version(self) -> str:
+        return str(self.store.version)
+
+    @property
+    def index(self) -> Optional[faiss.Index]:
+        return self.store.index
+
+    @property
+    def chunks(self) -> ChunkStore:
+        return self.store.chunks
+
+    @property
+    def files(self) -> dict[str, dict]:
+        return self.store.files
+
+    @property
+    def needs_rebuild(self) -> bool:
+        """True when the loaded index cannot be updated incrementally."""
+        return self.store.needs_rebuild
 
     @property
     def total_vectors(self) -> int:
-        return self.index.ntotal if self.index else 0
+        return self.store.total_vectors
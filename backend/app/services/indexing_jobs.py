@@ -0,0 +1,137 @@
+"""
+NyayaSahaya — Background indexing jobs.
+PDF parsing, chunking, embedding and index writes run on a worker thread pool
+instead of inside the request handler; clients poll the job for progress.
+"""
+
+import logging
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+from app.config import get_settings
+from app.services.vector_store import IndexProgress
+
+logger = logging.getLogger(__name__)
+
+
+class IndexingJob(IndexProgress):
+    """State of one indexing job; also receives progress from the vector store."""
+
+    def __init__(self, kind: str, description: str):
+        self.job_id = uuid.uuid4().hex
+        self.kind = kind
+        self.description = description
+        self.status = "queued"  # queued → running → completed | failed
+        self.current_phase = "queued"
+        self.chunks_total = 0
+        self.chunks_embedded = 0
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self._embed_seconds = 0.0
+        self._embed_started: Optional[float] = None
+        self.result: Optional[dict] = None
+        self.error: Optional[str] = None
+
+    # ── IndexProgress ────────────────────────────────────────
+    def phase(self, name: str):
+        if self._embed_started is not None:
+            self._embed_seconds += time.time() - self._embed_started
+            self._embed_started = None
+        if name == "embedding":
+            self._embed_started = time.time()
+        self.current_phase = name
+
+    def add_total(self, chunks: int):
+        self.chunks_total += chunks
+
+    def advance(self, chunks: int):
+        self.chunks_embedded += chunks
+
+    # ── Reporting ────────────────────────────────────────────
+    @property
+    def chunks_per_second(self) -> float:
+        seconds = self._embed_seconds
+        if self._embed_started is not None:
+            seconds += time.time() - self._embed_started
+        return round(self.chunks_embedded / seconds, 1) if seconds > 0 else 0.0
+
+    def to_dict(self) -> dict:
+        end = self.finished_at or time.time()
+        return {
+            "job_id": self.job_id,
+            "kind": self.kind,
+            "description": self.description,
+            "status": self.status,
+            "phase": self.current_phase,
+            "chunks_total": self.chunks_total,
+            "chunks_embedded": self.chunks_embedded,
+            "chunks_per_second": self.chunks_per_second,
+            "elapsed_seconds": round(end - self.started_at, 2) if self.started_at else 0.0,
+            "result": self.result,
+            "error": self.error,
+        }
+
+
+class IndexingJobManager:
+    """Process-wide queue of indexing jobs run on a small thread pool."""
+
+    _instance: Optional["IndexingJobManager"] = None
+    _initialized: bool = False
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+        settings = get_settings()
+        self._executor = ThreadPoolExecutor(
+            max_workers=settings.indexing_workers, thread_name_prefix="indexer"
+        )
+        self._jobs: dict[str, IndexingJob] = {}
+        self._lock = threading.Lock()
+        self._max_finished = settings.indexing_job_history
+        self._initialized = True
+
+    def submit(self, kind: str, description: str, work: Callable[[IndexingJob], dict]) -> IndexingJob:
+        """Queue `work(job)`; its return value becomes the job's result."""
+        job = IndexingJob(kind, description)
+        with self._lock:
+            self._jobs[job.job_id] = job
+            self._prune()
+        self._executor.submit(self._run, job, work)
+        return job
+
+    def get(self, job_id: str) -> Optional[IndexingJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _run(self, job: IndexingJob, work: Callable[[IndexingJob], dict]):
+        job.status = "running"
+        job.started_at = time.time()
+        try:
+            job.result = work(job)
+            job.status = "completed"
+            job.phase("done")
+        except Exception as e:
+            logger.error(f"Indexing job {job.job_id} ({job.description}) failed: {e}")
+            job.error = str(e)
+            job.status = "failed"
+            job.phase("failed")
+        finally:
+            job.finished_at = time.time()
+
+    def _prune(self):
+        """Forget the oldest finished jobs beyond the configured history size."""
+        finished = [j for j in self._jobs.values() if j.finished_at is not None]
+        for job in sorted(finished, key=lambda j: j.finished_at)[:-self._max_finished or None]:
+            del self._jobs[job.job_id]
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
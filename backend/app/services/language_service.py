@@ -3,42 +3,111 @@ NyayaSahaya — Language detection and translation service.
 """
 
 import logging
-from langdetect import detect, LangDetectException
+import re
+
 from app.services.llm_service import LLMService
-from app.utils.constants import TRANSLATION_PROMPT
+from app.services.translation_memory import TranslationMemory
+from app.utils.constants import TRANSLATION_PROMPT, TANGLISH_MARKERS
+from app.config import get_settings
+
+try:
+    from langdetect import DetectorFactory, LangDetectException, detect
+    DetectorFactory.seed = 0  # make the optional fallback deterministic
+except ImportError:  # langdetect is optional
+    detect = None
 
 logger = logging.getLogger(__name__)
 
+_WORD_RE = re.compile(r"[a-z]+")
+
+
+def _script_counts(text: str) -> tuple[int, int, int]:
+    """Count Tamil-block, Latin-letter and other-letter characters."""
+    tamil = latin = other = 0
+    for ch in text:
+        code = ord(ch)
+        if 0x0B80 <= code <= 0x0BFF:
+            tamil += 1
+        elif ch.isascii():
+            if ch.isalpha():
+                latin += 1
+        elif ch.isalpha():
+            other += 1
+    return tamil, latin, other
+
+
+def _is_transliterated_tamil(text: str) -> bool:
+    """Heuristic for Tamil written in Latin script (Tanglish)."""
+    words = _WORD_RE.findall(text.lower())
+    if not words:
+        return False
+    hits = sum(1 for w in words if w in TANGLISH_MARKERS)
+    return hits >= 2 and hits / len(words) >= 0.25
+
+
+def detect_language(text: str, tamil_ratio: float = 0.3, use_fallback: bool = False) -> str:
+    """
+    Deterministic Tamil/English detection from Unicode blocks.
+
+    Text is Tamil when Tamil-script letters (U+0B80–U+0BFF) make up at least
+    `tamil_ratio` of its Tamil + Latin letters, so Tamil questions quoting
+    "FIR" or "IPC 420" still count as Tamil. Latin-only text is Tamil when it
+    reads as transliterated Tamil ("enakku bail venum"). langdetect is
+    consulted only for text in neither script, and only if enabled.
+    """
+    tamil, latin, other = _script_counts(text)
+
+    if tamil + latin > 0:
+        if tamil / (tamil + latin) >= tamil_ratio:
+            return "ta"
+        if tamil == 0 and _is_transliterated_tamil(text):
+            return "ta"
+        return "en"
+
+    if other and use_fallback and detect is not None:
+        try:
+            return "ta" if detect(text) == "ta" else "en"
+        except LangDetectException:
+            pass
+    return "en"
+
 
 class LanguageService:
     """Detect input language and translate responses."""
 
     def __init__(self):
         self.llm = LLMService()
+        self.memory = TranslationMemory()
+        settings = get_settings()
+        self.tamil_ratio = settings.tamil_script_ratio
+        self.use_fallback = settings.langdetect_fallback
 
     def detect_language(self, text: str) -> str:
         """
         Detect whether input is Tamil or English.
         Returns 'ta' or 'en'.
         """
-        try:
-            lang = detect(text)
-            if lang == "ta":
-                return "ta"
-            return "en"
-        except LangDetectException:
-            return "en"
+        return detect_language(text, self.tamil_ratio, self.use_fallback)
 
     async def translate(self, text: str, source_lang: str, target_lang: str) -> str:
-        """Translate text between Tamil and English using the LLM."""
+        """
+        Translate text between Tamil and English. Text translated before (or
+        seeded, like the disclaimer) comes from the translation memory; only
+        new text is sent to the LLM.
+        """
+        remembered = self.memory.lookup(text, source_lang, target_lang)
+        if remembered is not None:
+            return remembered
         lang_names = {"en": "English", "ta": "Tamil"}
         prompt = TRANSLATION_PROMPT.format(
             source_lang=lang_names.get(source_lang, "English"),
             target_lang=lang_names.get(target_lang, "Tamil"),
             text=text,
         )
-        return await self.llm.generate(
+        translation = await self.llm.generate(
             system_prompt="You are a professional Tamil-English legal translator.",
             user_prompt=prompt,
             temperature=0.2,
         )
+        self.memory.store(text, source_lang, target_lang, translation)
+        return translation
@@ -0,0 +1,205 @@
+"""
+NyayaSahaya — BM25 lexical index over the indexed chunks.
+
+Dense MiniLM retrieval is weak on exact identifiers such as "Section 498A",
+"BNSS 173" or "NDPS". A BM25 index over the same chunks catches them, and the
+two rankings are combined with reciprocal-rank fusion.
+
+Like ChunkStore, the index is a few flat NumPy arrays saved as .npy files and
+memory-mapped on load: per-row term lists (cheap to append to and drop rows
+from) plus an inverted term → rows view, rebuilt lazily after a write, that
+queries read. Arrays are never modified in place.
+"""
+
+import json
+import math
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Iterable, Optional
+
+import numpy as np
+
+# \w alone splits Tamil words at vowel signs (combining marks), so include the whole block
+_TOKEN = re.compile(r"[\w\u0B80-\u0BFF]+")
+# "498-A" / "498 A" → "498a", so section numbers match however they are written
+_SECTION_SUFFIX = re.compile(r"\b(\d+)[\s-]([a-z])\b")
+_STOPWORDS = frozenset(
+    "a an and are as at be by can do for from has have how i if in is it its me my "
+    "not of on or shall that the their there this to under was what when which who will with".split()
+)
+
+_EMPTY_I64 = np.empty(0, dtype=np.int64)
+_EMPTY_I32 = np.empty(0, dtype=np.int32)
+
+
+def tokenize(text: str) -> list[str]:
+    """Lower-cased word tokens without stopwords; works for Tamil script too."""
+    text = _SECTION_SUFFIX.sub(r"\1\2", text.lower())
+    return [t for t in _TOKEN.findall(text) if t not in _STOPWORDS]
+
+
+def reciprocal_rank_fusion(rankings: Iterable[list], k: int = 60) -> list[tuple]:
+    """Fuse ranked key lists: each key scores sum(1 / (k + rank)), best first."""
+    scores: dict = {}
+    for ranking in rankings:
+        for rank, key in enumerate(ranking, start=1):
+            scores[key] = scores.get(key, 0.0) + 1.0 / (k + rank)
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
+
+
+class LexicalIndex:
+    """BM25 over chunk texts, keyed by FAISS vector ID."""
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1, self.b = k1, b
+        self.ids = _EMPTY_I64  # vector ID of each row
+        self.offsets = np.zeros(1, dtype=np.int64)  # row i's terms are terms[offsets[i]:offsets[i + 1]]
+        self.terms = _EMPTY_I32  # term IDs
+        self.freqs = _EMPTY_I32  # occurrences of each term in its row
+        self.lengths = _EMPTY_I32  # tokens per row
+        self.vocab: list[str] = []
+        self._term_ids: Optional[dict[str, int]] = None
+        # Inverted view: term t's postings are post_rows/post_freqs[post_offsets[t]:post_offsets[t + 1]]
+        self._postings: Optional[tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def copy(self) -> "LexicalIndex":
+        """A copy that can be written without affecting this index (arrays are shared)."""
+        other = LexicalIndex(self.k1, self.b)
+        other.ids, other.offsets, other.terms = self.ids, self.offsets, self.terms
+        other.freqs, other.lengths = self.freqs, self.lengths
+        other.vocab = list(self.vocab)
+        other._postings = self._postings
+        if self._term_ids is not None:
+            other._term_ids = dict(self._term_ids)
+        return other
+
+    # ── Reading ──────────────────────────────────────────────
+    def _lookup(self) -> dict[str, int]:
+        if self._term_ids is None:
+            self._term_ids = {term: i for i, term in enumerate(self.vocab)}
+        return self._term_ids
+
+    def _inverted(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        if self._postings is None:
+            order = np.argsort(self.terms, kind="stable")
+            rows = np.repeat(np.arange(len(self.ids), dtype=np.int64), np.diff(self.offsets))
+            offsets = np.searchsorted(self.terms[order], np.arange(len(self.vocab) + 1)).astype(np.int64)
+            self._postings = (offsets, rows[order], self.freqs[order])
+        return self._postings
+
+    def warm(self):
+        """Build the term lookup and inverted view now, rather than in the first search()."""
+        self._lookup()
+        self._inverted()
+
+    def search(self, query: str, k: int, min_ratio: float = 0.0) -> list[tuple[int, float]]:
+        """
+        Top-k (vector ID, BM25 score) pairs for a query, best first. Hits
+        scoring below `min_ratio` times the best score are dropped.
+        """
+        n = len(self.ids)
+        lookup = self._lookup()
+        term_ids = {lookup[t] for t in tokenize(query) if t in lookup}
+        if n == 0 or k <= 0 or not term_ids:
+            return []
+
+        post_offsets, post_rows, post_freqs = self._inverted()
+        lengths = np.asarray(self.lengths, dtype=np.float32)
+        norm = self.k1 * (1 - self.b + self.b * lengths / max(float(lengths.mean()), 1.0))
+        scores = np.zeros(n, dtype=np.float32)
+        for t in term_ids:
+            start, end = post_offsets[t], post_offsets[t + 1]
+            if start == end:
+                continue
+            rows, tf = post_rows[start:end], post_freqs[start:end].astype(np.float32)
+            idf = math.log(1 + (n - (end - start) + 0.5) / ((end - start) + 0.5))
+            scores[rows] += idf * tf * (self.k1 + 1) / (tf + norm[rows])
+
+        hit_rows = np.flatnonzero(scores)
+        if len(hit_rows) > k:
+            hit_rows = hit_rows[np.argpartition(-scores[hit_rows], k - 1)[:k]]
+        hit_rows = hit_rows[np.argsort(-scores[hit_rows], kind="stable")]
+        if len(hit_rows) == 0:
+            return []
+        floor = min_ratio * float(scores[hit_rows[0]])
+        return [(int(self.ids[r]), float(scores[r])) for r in hit_rows if scores[r] >= floor]
+
+    # ── Writing ──────────────────────────────────────────────
+    def append(self, ids: np.ndarray, texts: list[str]):
+        """Index texts under vector IDs larger than any stored so far."""
+        if not texts:
+            return
+        lookup = self._lookup()
+        terms, freqs, counts, lengths = [], [], [], []
+        for text in texts:
+            tokens = tokenize(text)
+            tf = Counter(tokens)
+            for term, count in tf.items():
+                term_id = lookup.get(term)
+                if term_id is None:
+                    term_id = lookup[term] = len(self.vocab)
+                    self.vocab.append(term)
+                terms.append(term_id)
+                freqs.append(count)
+            counts.append(len(tf))
+            lengths.append(len(tokens))
+
+        self.ids = np.concatenate([self.ids, np.asarray(ids, dtype=np.int64)])
+        self.offsets = np.concatenate([self.offsets, self.offsets[-1] + np.cumsum(counts, dtype=np.int64)])
+        self.terms = np.concatenate([self.terms, np.asarray(terms, dtype=np.int32)])
+        self.freqs = np.concatenate([self.freqs, np.asarray(freqs, dtype=np.int32)])
+        self.lengths = np.concatenate([self.lengths, np.asarray(lengths, dtype=np.int32)])
+        self._postings = None
+
+    def remove_range(self, start: int, end: int):
+        """Drop rows with vector IDs in [start, end)."""
+        keep = (self.ids < start) | (self.ids >= end)
+        if keep.all():
+            return
+        counts = np.diff(self.offsets)
+        entries = np.repeat(keep, counts)
+        self.ids = self.ids[keep]
+        self.offsets = np.concatenate([[0], np.cumsum(counts[keep])]).astype(np.int64)
+        self.terms = self.terms[entries]
+        self.freqs = self.freqs[entries]
+        self.lengths = self.lengths[keep]
+        self._postings = None
+
+    @classmethod
+    def from_chunks(cls, chunks) -> "LexicalIndex":
+        """Build the index over every row of a ChunkStore."""
+        index = cls()
+        index.append(np.asarray(chunks.ids), [chunks.text(row) for row in range(len(chunks))])
+        return index
+
+    # ── Persistence ──────────────────────────────────────────
+    def save(self, directory: Path):
+        """Write the term lists, the inverted view and the vocabulary into `directory`."""
+        directory.mkdir(parents=True, exist_ok=True)
+        post_offsets, post_rows, post_freqs = self._inverted()
+        arrays = {
+            "ids": self.ids, "offsets": self.offsets, "terms": self.terms, "freqs": self.freqs,
+            "lengths": self.lengths, "post_offsets": post_offsets, "post_rows": post_rows,
+            "post_freqs": post_freqs,
+        }
+        for name, array in arrays.items():
+            np.save(directory / f"{name}.npy", np.ascontiguousarray(array))
+        with open(directory / "vocab.json", "w", encoding="utf-8") as f:
+            json.dump(self.vocab, f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, directory: Path, mmap: bool = True) -> "LexicalIndex":
+        """Open a saved index; with `mmap` the arrays are mapped read-only instead of read."""
+        index = cls()
+        mode = "r" if mmap else None
+        arrays = {path.stem: np.load(path, mmap_mode=mode) for path in directory.glob("*.npy")}
+        index.ids, index.offsets, index.terms = arrays["ids"], arrays["offsets"], arrays["terms"]
+        index.freqs, index.lengths = arrays["freqs"], arrays["lengths"]
+        index._postings = (arrays["post_offsets"], arrays["post_rows"], arrays["post_freqs"])
+        with open(directory / "vocab.json", "r", encoding="utf-8") as f:
+            index.vocab = json.load(f)
+        return index
@@ -1,9 +1,18 @@
 """
 NyayaSahaya — Google Gemini LLM wrapper service.
 Uses the new google-genai SDK.
+
+All instances share one process-wide client and a concurrency semaphore, and
+every call goes through the SDK's native async API so a slow completion never
+blocks the event loop.
 """
 
+import asyncio
 import logging
+import time
+from functools import lru_cache
+from typing import AsyncIterator, Optional
+
 from google import genai
 from google.genai import types
 from app.config import get_settings
@@ -11,13 +20,86 @@ from app.config import get_settings
 logger = logging.getLogger(__name__)
 
 
+@lru_cache()
+def get_client() -> genai.Client:
+    """Return the shared Gemini client (one per process)."""
+    settings = get_settings()
+    return genai.Client(api_key=settings.gemini_api_key)
+
+
+class _LLMStats:
+    """Process-wide counters for LLM calls (queue depth, in-flight, outcomes)."""
+
+    def __init__(self):
+        self.waiting = 0
+        self.in_flight = 0
+        self.completed = 0
+        self.failed = 0
+        self.timeouts = 0
+        self.total_latency = 0.0
+
+    def snapshot(self) -> dict:
+        finished = self.completed + self.failed + self.timeouts
+        return {
+            "waiting": self.waiting,
+            "in_flight": self.in_flight,
+            "completed": self.completed,
+            "failed": self.failed,
+            "timeouts": self.timeouts,
+            "avg_latency_ms": round(self.total_latency / finished * 1000, 1) if finished else 0.0,
+        }
+
+
 class LLMService:
     """Thin wrapper around the Google Gemini API."""
 
+    _semaphore: Optional[asyncio.Semaphore] = None
+    stats = _LLMStats()
+
     def __init__(self):
         settings = get_settings()
-        self.client = genai.Client(api_key=settings.gemini_api_key)
+        self.client = get_client()
         self.model_name = settings.gemini_model
+        self.timeout = settings.llm_timeout_seconds
+        if LLMService._semaphore is None:
+            LLMService._semaphore = asyncio.Semaphore(settings.llm_max_concurrency)
+
+    async def _generate_content(self, prompt: str, config: types.GenerateContentConfig) -> str:
+        """Run one async generation under the shared semaphore and timeout."""
+        stats = LLMService.stats
+        await self._acquire()
+        stats.in_flight += 1
+        start = time.perf_counter()
+        try:
+            response = await asyncio.wait_for(
+                self.client.aio.models.generate_content(
+                    model=self.model_name,
+                    contents=prompt,
+                    config=config,
+                ),
+                timeout=self.timeout,
+            )
+            stats.completed += 1
+            return response.text.strip()
+        except asyncio.TimeoutError:
+            stats.timeouts += 1
+            raise RuntimeError(f"LLM call timed out after {self.timeout}s")
+        except Exception:
+            stats.failed += 1
+            raise
+        finally:
+            stats.total_latency += time.perf_counter() - start
+            stats.in_flight -= 1
+            LLMService._semaphore.release()
+
+    async def _acquire(self):
+        """Wait for a concurrency slot, tracking queue depth."""
+        stats = LLMService.stats
+        stats.waiting += 1
+        try:
+            await LLMService._semaphore.acquire()
+        finally:
+            stats.waiting -= 1
 
     async def generate(
         self,
@@ -29,15 +111,13 @@ class LLMService:
         """Send a generation request and return the text response."""
         try:
             full_prompt = f"{system_prompt}\n\n{user_prompt}"
-            response = self.client.models.generate_content(
-                model=self.model_name,
-                contents=full_prompt,
-                config=types.GenerateContentConfig(
+            return await self._generate_content(
+                full_prompt,
+                types.GenerateContentConfig(
                     temperature=temperature,
                     max_output_tokens=max_tokens,
                 ),
             )
-            return response.text.strip()
         except Exception as e:
             logger.error(f"LLM generation error: {e}")
             raise RuntimeError(f"LLM service error: {e}")
@@ -51,16 +131,14 @@ class LLMService:
         """Generate a response expected to be JSON."""
         try:
             full_prompt = f"{system_prompt}\n\n{user_prompt}"
-            response = self.client.models.generate_content(
-                model=self.model_name,
-                contents=full_prompt,
-                config=types.GenerateContentConfig(
+            text = await self._generate_content(
+                full_prompt,
+                types.GenerateContentConfig(
                     temperature=temperature,
                     max_output_tokens=800,
                     response_mime_type="application/json",
                 ),
             )
-            text = response.text.strip()
             # Strip markdown code fences if Gemini wraps them
             if text.startswith("```"):
                 text = text.split("\n", 1)[1] if "\n" in text else text[3:]
@@ -70,3 +148,53 @@ class LLMService:
         except Exception as e:
             logger.error(f"LLM JSON generation error: {e}")
             raise RuntimeError(f"LLM service error: {e}")
+
+    async def generate_stream(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float = 0.3,
+        max_tokens: int = 1500,
+    ) -> AsyncIterator[str]:
+        """Stream the text response chunk by chunk as Gemini produces it."""
+        stats = LLMService.stats
+        await self._acquire()
+        stats.in_flight += 1
+        start = time.perf_counter()
+        deadline = start + self.timeout
+        try:
+            full_prompt = f"{system_prompt}\n\n{user_prompt}"
+            stream = await asyncio.wait_for(
+                self.client.aio.models.generate_content_stream(
+                    model=self.model_name,
+                    contents=full_prompt,
+                    config=types.GenerateContentConfig(
+                        temperature=temperature,
+                        max_output_tokens=max_tokens,
+                    ),
+                ),
+                timeout=self.timeout,
+            )
+            iterator = stream.__aiter__()
+            while True:
+                try:
+                    chunk = await asyncio.wait_for(
+                        iterator.__anext__(), timeout=max(deadline - time.perf_counter(), 0.001)
+                    )
+                except StopAsyncIteration:
+                    break
+                if chunk.text:
+                    yield chunk.text
+            stats.completed += 1
+        except asyncio.TimeoutError:
+            stats.timeouts += 1
+            logger.error(f"LLM stream timed out after {self.timeout}s")
+            raise RuntimeError(f"LLM service error: timed out after {self.timeout}s")
+        except Exception as e:
+            stats.failed += 1
+            logger.error(f"LLM streaming error: {e}")
+            raise RuntimeError(f"LLM service error: {e}")
+        finally:
+            stats.total_latency += time.perf_counter() - start
+            stats.in_flight -= 1
+            LLMService._semaphore.release()
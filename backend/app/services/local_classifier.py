@@ -0,0 +1,75 @@
+"""
+NyayaSahaya — Local legal-issue classifier (nearest centroid over embeddings).
+
+Each category's centroid is the mean embedding of its labelled examples
+(CLASSIFIER_EXAMPLES) and description, computed once with the embedding
+model EmbeddingService has already loaded. Classifying a description is then
+one query embedding and six dot products: milliseconds on CPU, no API quota.
+Similarities are turned into probabilities with a softmax so callers can fall
+back to the LLM when the best category is not clearly ahead.
+"""
+
+import logging
+from typing import Optional
+
+import numpy as np
+
+from app.config import get_settings
+from app.services.embedding_service import EmbeddingService
+from app.utils.constants import CATEGORY_DESCRIPTIONS, CLASSIFIER_EXAMPLES, LEGAL_CATEGORIES
+
+logger = logging.getLogger(__name__)
+
+
+def _unit_rows(vectors: np.ndarray) -> np.ndarray:
+    vectors = np.asarray(vectors, dtype="float32")
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+class LocalClassifier:
+    """Nearest-centroid classifier over the shared sentence-transformers model."""
+
+    _instance: Optional["LocalClassifier"] = None
+    _initialized: bool = False
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+        settings = get_settings()
+        self.embeddings = EmbeddingService()
+        self.temperature = settings.classifier_temperature
+        self.categories = list(LEGAL_CATEGORIES)
+        self.centroids = self.fit(CLASSIFIER_EXAMPLES)
+        self._initialized = True
+
+    def fit(self, examples: dict[str, list[str]]) -> np.ndarray:
+        """Unit-length centroid per category (rows in LEGAL_CATEGORIES order)."""
+        texts, labels = [], []
+        for row, category in enumerate(self.categories):
+            for text in [CATEGORY_DESCRIPTIONS[category], *examples.get(category, [])]:
+                texts.append(text)
+                labels.append(row)
+        vectors = _unit_rows(self.embeddings.embed_texts(texts))
+        labels = np.asarray(labels)
+        centroids = np.stack([vectors[labels == row].mean(axis=0) for row in range(len(self.categories))])
+        logger.info(f"Local classifier: {len(texts)} examples, {len(self.categories)} categories")
+        return _unit_rows(centroids)
+
+    def probabilities(self, query_vec: np.ndarray) -> np.ndarray:
+        """Softmax over cosine similarity to each centroid, in LEGAL_CATEGORIES order."""
+        similarities = self.centroids @ _unit_rows(query_vec).reshape(-1)
+        logits = similarities / self.temperature
+        weights = np.exp(logits - logits.max())
+        return weights / weights.sum()
+
+    async def classify(self, text: str) -> tuple[str, float]:
+        """The most likely category and its probability."""
+        probs = self.probabilities(await self.embeddings.embed_query_async(text))
+        best = int(np.argmax(probs))
+        return self.categories[best], float(probs[best])
@@ -0,0 +1,86 @@
+"""
+NyayaSahaya — Micro-batching of query embeddings.
+
+Every question needs one embedding, and on CPU a forward pass over a dozen
+short queries costs little more than a pass over one. QueryBatcher collects
+queries from concurrent requests, waits up to EMBED_BATCH_MAX_WAIT_MS for more
+to arrive (or until EMBED_BATCH_MAX_SIZE are queued) and encodes them in a
+single call on its own thread. Each caller awaits just its own vector, and the
+event loop never runs the model itself.
+"""
+
+import asyncio
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class QueryBatcher:
+    """Queues query texts and encodes them in batches on a dedicated thread."""
+
+    def __init__(self, encode: Callable[[list[str]], np.ndarray], max_batch: int = 32, max_wait: float = 0.005):
+        self.encode = encode  # texts -> float32 array, one row per text
+        self.max_batch = max(1, max_batch)
+        self.max_wait = max_wait  # seconds to wait for company after the first query arrives
+        self._queue: "queue.SimpleQueue[tuple[str, Future]]" = queue.SimpleQueue()
+        self.batches = 0
+        self.queries = 0
+        self._thread = threading.Thread(target=self._run, name="query-embed", daemon=True)
+        self._thread.start()
+
+    def submit(self, text: str) -> Future:
+        """Queue a query; the returned future resolves to its embedding."""
+        future: Future = Future()
+        self._queue.put((text, future))
+        return future
+
+    async def embed(self, text: str) -> np.ndarray:
+        """Embedding of one query, encoded together with whatever else arrived meanwhile."""
+        return await asyncio.wrap_future(self.submit(text))
+
+    def _collect(self) -> list[tuple[str, Future]]:
+        """Block for the first query, then take more until the batch is full or the wait is over."""
+        batch = [self._queue.get()]
+        deadline = time.perf_counter() + self.max_wait
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.perf_counter()
+            try:
+                batch.append(self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait())
+            except queue.Empty:
+                break
+        # Requests that gave up (client disconnected, timeout) are not encoded
+        return [(text, future) for text, future in batch if future.set_running_or_notify_cancel()]
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            if not batch:
+                continue
+            texts = list(dict.fromkeys(text for text, _ in batch))  # identical queries are encoded once
+            try:
+                vectors = self.encode(texts)
+            except Exception as e:
+                logger.error(f"Query embedding failed for a batch of {len(texts)}: {e}")
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+            rows = dict(zip(texts, vectors))
+            self.batches += 1
+            self.queries += len(batch)
+            for text, future in batch:
+                future.set_result(rows[text])
+
+    @property
+    def stats(self) -> dict:
+        return {
+            "batches": self.batches,
+            "queries": self.queries,
+            "avg_batch_size": round(self.queries / self.batches, 2) if self.batches else 0.0,
+        }
@@ -2,15 +2,50 @@
 NyayaSahaya — RAG (Retrieval-Augmented Generation) pipeline service.
 """
 
+import asyncio
 import logging
+import time
+from typing import AsyncIterator, Awaitable
+
+import numpy as np
+
 from app.services.llm_service import LLMService
 from app.services.embedding_service import EmbeddingService
 from app.services.language_service import LanguageService
-from app.utils.constants import RAG_SYSTEM_PROMPT, RAG_USER_PROMPT, DISCLAIMER
+from app.services.answer_cache import AnswerCache
+from app.services.citation_index import parse_citations
+from app.services.reranker import RerankerService
+from app.utils.constants import (
+    RAG_SYSTEM_PROMPT,
+    RAG_USER_PROMPT,
+    DISCLAIMER,
+    NO_INDEXED_DOCUMENTS_MESSAGE,
+    NO_RELEVANT_PROVISIONS_MESSAGE,
+)
 from app.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Translations still running after their request moved on (parallel Tamil retrieval);
+# referenced here so they are not garbage-collected before they finish
+_background_translations: set[asyncio.Task] = set()
+
+
+def _finish_in_background(task: asyncio.Task):
+    """Let an abandoned translation complete (its result lands in the translation memory)."""
+    _background_translations.add(task)
+
+    def done(t: asyncio.Task):
+        _background_translations.discard(t)
+        if not t.cancelled() and t.exception() is not None:
+            logger.warning(f"Background translation failed: {t.exception()}")
+
+    task.add_done_callback(done)
+
+
+def _elapsed_ms(start: float) -> float:
+    return round((time.perf_counter() - start) * 1000, 1)
+
 
 class RAGService:
     """End-to-end RAG pipeline: retrieve → augment → generate."""
@@ -19,70 +54,399 @@ class RAGService:
         self.llm = LLMService()
         self.embeddings = EmbeddingService()
         self.language = LanguageService()
+        self.cache = AnswerCache()
+        self.reranker = RerankerService()
         self.settings = get_settings()
 
-    async def answer_question(self, question: str, force_language: str | None = None) -> dict:
+    @staticmethod
+    def _context(results: list[dict]) -> tuple[str, list[dict]]:
+        """The prompt context for retrieved chunks (each labelled with its source) and their source entries."""
+        context_parts = []
+        sources = []
+        for r in results:
+            label = r.get("source", "Unknown")
+            if r.get("section"):
+                section = r["section"] if r["section"].startswith("Article") else f"Section {r['section']}"
+                label += f" — {r['act']}, {section}" if r.get("act") else f" — {section}"
+            context_parts.append(f"[Source: {label}]\n{r['text']}")
+            sources.append({
+                "text": r["text"][:300] + ("..." if len(r["text"]) > 300 else ""),
+                "source": r.get("source", "Unknown"),
+                "score": r.get("score"),
+            })
+        return "\n\n---\n\n".join(context_parts), sources
+
+    async def _prepare(
+        self,
+        question: str,
+        force_language: str | None = None,
+        text_only: bool = False,
+        timings: dict | None = None,
+        translation: Awaitable[str] | None = None,
+    ) -> dict:
         """
-        Full RAG flow:
+        Retrieval half of the RAG flow:
         1. Detect language
-        2. If Tamil, translate query to English for retrieval
-        3. Search FAISS for relevant chunks
-        4. Generate answer via LLM with context
-        5. If original language was Tamil, instruct LLM to respond in Tamil
+        2. If the question cites sections ("IPC 420"), fetch them directly and skip to 5
+        3. If Tamil, translate query to English for retrieval (unless the
+           embedding model is multilingual and cross-lingual mode is on; in
+           parallel mode, only if the translation arrives within its budget)
+        4. Check the semantic answer cache, then search FAISS (and BM25) for relevant
+           chunks, re-ranking a wider candidate set with a cross-encoder if enabled
+        5. Build the prompts (instructing the LLM to respond in Tamil if needed)
+
+        Returns the detected language, sources and the citations looked up,
+        plus either the prompts for generation or a ready-made answer (cache
+        hit, nothing retrieved, or the cited text itself when `text_only`).
+        Milliseconds spent per stage are recorded in `timings`. A Tamil
+        question's translation already in flight can be passed as `translation`.
         """
+        timings = {} if timings is None else timings
         # 1 ─ Language detection
         detected_lang = force_language or self.language.detect_language(question)
+        snapshot = self.embeddings.snapshot()
+        index_version = str(snapshot.version)
 
-        # 2 ─ Prepare English query for retrieval
-        retrieval_query = question
-        if detected_lang == "ta":
-            retrieval_query = await self.language.translate(question, "ta", "en")
+        # 2 ─ Cited sections come straight from the citation index
+        cited = self._cited(question, detected_lang, index_version, snapshot, text_only)
+        if cited is not None:
+            return cited
 
-        # 3 ─ Retrieve relevant chunks
-        top_k = self.settings.top_k_results
-        results = self.embeddings.search(retrieval_query, top_k=top_k)
+        # 3 ─ Prepare English query for retrieval (4 ─ and embed it)
+        if detected_lang == "ta" and self.settings.tamil_retrieval_mode == "parallel":
+            retrieval_query, query_vec = await self._translate_within_budget(question, timings, translation)
+            start = time.perf_counter()
+        else:
+            retrieval_query = await self._retrieval_query(question, detected_lang, timings, translation)
+            start = time.perf_counter()
+            query_vec = await self.embeddings.embed_query_async(retrieval_query)
 
+        # 4 ─ Answer cache, then retrieve relevant chunks from the same index snapshot
+        cached = self._cached(query_vec, detected_lang, index_version)
+        if cached is not None:
+            timings["retrieval_ms"] = _elapsed_ms(start)
+            return cached
+
+        # FAISS and BM25 are CPU-bound: keep them off the event loop
+        results = await asyncio.to_thread(
+            self.embeddings.search_by_vector,
+            query_vec, store=snapshot, query_text=retrieval_query, **self._search_limits(),
+        )
+        timings["retrieval_ms"] = _elapsed_ms(start)
+        return await self._finish(question, detected_lang, snapshot, query_vec, retrieval_query, results, timings)
+
+    def _cited(self, question: str, detected_lang: str, index_version: str, snapshot, text_only: bool) -> dict | None:
+        """The prepared result for a question citing indexed sections, or None."""
+        if not self.settings.citation_lookup:
+            return None
+        citations = parse_citations(question)
+        results = snapshot.lookup_citations(citations) if citations else []
         if not results:
-            no_data_msg = (
-                "I don't have enough legal documents indexed yet to answer your question. "
-                "Please upload relevant Indian law documents first."
+            return None
+        cited = list(dict.fromkeys(r["citation"] for r in results))
+        context, sources = self._context(results)
+        if text_only:
+            return {
+                "detected_language": detected_lang,
+                "index_version": index_version,
+                "citations": cited,
+                "sources": sources,
+                "answer": context,
+            }
+        return self._prompts(question, detected_lang, index_version, context, sources, citations=cited)
+
+    @property
+    def translates_tamil(self) -> bool:
+        """Whether Tamil questions are translated for retrieval."""
+        return self.settings.tamil_retrieval_mode != "crosslingual"
+
+    async def _retrieval_query(
+        self, question: str, detected_lang: str, timings: dict, translation: Awaitable[str] | None = None
+    ) -> str:
+        """The question as searched: translated to English for Tamil unless retrieval is cross-lingual."""
+        if detected_lang != "ta" or not self.translates_tamil:
+            return question
+        start = time.perf_counter()
+        if translation is None:
+            translation = self.language.translate(question, "ta", "en")
+        retrieval_query = await translation
+        timings["translation_ms"] = _elapsed_ms(start)
+        return retrieval_query
+
+    async def _translate_within_budget(
+        self, question: str, timings: dict, translation: Awaitable[str] | None = None
+    ) -> tuple[str, np.ndarray]:
+        """
+        The retrieval query and its embedding for a Tamil question, without
+        waiting on the LLM for long. The question is translated and, at the same
+        time, embedded as written; BM25 still matches the Latin-script terms it
+        contains ("IPC 498A", "FIR"). If the translation arrives within
+        TAMIL_TRANSLATION_BUDGET_MS (always, when the translation memory has it)
+        the English query is searched, otherwise the Tamil text is and the
+        translation finishes in the background for next time.
+        """
+        start = time.perf_counter()
+        translation = asyncio.ensure_future(translation or self.language.translate(question, "ta", "en"))
+        direct = asyncio.ensure_future(self.embeddings.embed_query_async(question))
+        done, _ = await asyncio.wait({translation}, timeout=self.settings.tamil_translation_budget_ms / 1000)
+        timings["translation_ms"] = _elapsed_ms(start)
+
+        if translation in done and translation.exception() is None:
+            direct.cancel()
+            retrieval_query = translation.result()
+            return retrieval_query, await self.embeddings.embed_query_async(retrieval_query)
+
+        if translation in done:
+            logger.warning(f"Translation failed ({translation.exception()}); searching the Tamil question as written")
+        else:
+            logger.info(
+                f"Translation exceeded {self.settings.tamil_translation_budget_ms} ms; "
+                "searching the Tamil question as written"
             )
+            _finish_in_background(translation)
+        return question, await direct
+
+    def _cached(self, query_vec, detected_lang: str, index_version: str) -> dict | None:
+        """The prepared result for a cached answer, or None."""
+        cached = self.cache.lookup(query_vec, detected_lang, index_version)
+        if cached is None:
+            return None
+        return {
+            "detected_language": detected_lang,
+            "index_version": index_version,
+            "sources": cached["sources"],
+            "answer": cached["answer"],
+        }
+
+    def _search_limits(self) -> dict:
+        """top_k / dropoff for the search: a wide candidate set when the cross-encoder picks the final chunks."""
+        if self.reranker.enabled:
+            # The similarity floor still applies, but not the drop-off cut (cosine scores span at most 2)
+            return {"top_k": self.reranker.candidates, "dropoff": 2.0}
+        return {"top_k": self.settings.top_k_results}
+
+    async def _finish(
+        self, question: str, detected_lang: str, snapshot, query_vec, retrieval_query: str, results: list[dict], timings: dict
+    ) -> dict:
+        """Re-rank the retrieved chunks if enabled, then build the prompts (or the nothing-found answer)."""
+        index_version = str(snapshot.version)
+        if self.reranker.enabled and results:
+            start = time.perf_counter()
+            results, _ = await self.reranker.rerank(retrieval_query, results)
+            timings["rerank_ms"] = _elapsed_ms(start)
+
+        if not results:
+            if snapshot.total_vectors == 0:
+                no_data_msg = NO_INDEXED_DOCUMENTS_MESSAGE
+            else:
+                # Nothing cleared the relevance cutoff
+                no_data_msg = NO_RELEVANT_PROVISIONS_MESSAGE
             if detected_lang == "ta":
                 no_data_msg = await self.language.translate(no_data_msg, "en", "ta")
             return {
-                "answer": no_data_msg,
                 "detected_language": detected_lang,
+                "index_version": index_version,
                 "sources": [],
-                "disclaimer": DISCLAIMER,
+                "answer": no_data_msg,
             }
 
-        # 4 ─ Build context from retrieved chunks
-        context_parts = []
-        sources = []
-        for r in results:
-            context_parts.append(f"[Source: {r.get('source', 'Unknown')}]\n{r['text']}")
-            sources.append({
-                "text": r["text"][:300] + ("..." if len(r["text"]) > 300 else ""),
-                "source": r.get("source", "Unknown"),
-                "score": r.get("score"),
-            })
+        context, sources = self._context(results)
+        return self._prompts(
+            question, detected_lang, index_version, context, sources,
+            cache_key=(query_vec, detected_lang, index_version),
+        )
 
-        context = "\n\n---\n\n".join(context_parts)
+    async def _prepare_batch(self, questions: list[tuple[str, str | None]], text_only: bool = False) -> list[dict]:
+        """
+        _prepare() for many (question, forced language) pairs against one index
+        snapshot: all retrieval queries are embedded in one embed_texts() call
+        and searched with one multi-row FAISS search. A question that fails
+        gets {"error": ...} instead of a prepared result.
+        """
+        snapshot = self.embeddings.snapshot()
+        index_version = str(snapshot.version)
+        languages = [force or self.language.detect_language(q) for q, force in questions]
+        prepared: list[dict | None] = [
+            self._cited(q, lang, index_version, snapshot, text_only) for (q, _), lang in zip(questions, languages)
+        ]
+        pending = [i for i, p in enumerate(prepared) if p is None]
+        if not pending:
+            return prepared
+
+        # A failed translation fails only its own question. Translations are LLM
+        # calls too, so they run under BATCH_QUERY_CONCURRENCY like generation
+        semaphore = asyncio.Semaphore(self.settings.batch_query_concurrency)
+
+        async def retrieval_query(i: int) -> str:
+            async with semaphore:
+                return await self._retrieval_query(questions[i][0], languages[i], {})
+
+        queries = await asyncio.gather(*(retrieval_query(i) for i in pending), return_exceptions=True)
+        for i, query in zip(pending, queries):
+            if isinstance(query, Exception):
+                prepared[i] = {"error": str(query)}
+        pending = [(i, q) for i, q in zip(pending, queries) if not isinstance(q, Exception)]
+        if not pending:
+            return prepared
+        vectors = await asyncio.to_thread(self.embeddings.embed_texts, [q for _, q in pending])
 
-        # 5 ─ Construct prompts
+        to_search = []
+        for (i, query), vector in zip(pending, vectors):
+            prepared[i] = self._cached(vector, languages[i], index_version)
+            if prepared[i] is None:
+                to_search.append((i, query, vector))
+        if to_search:
+            found = await asyncio.to_thread(
+                self.embeddings.search_by_vectors, np.stack([v for _, _, v in to_search]), store=snapshot,
+                query_texts=[q for _, q, _ in to_search], **self._search_limits(),
+            )
+            finished = await asyncio.gather(*(
+                self._finish(questions[i][0], languages[i], snapshot, vector, query, results, {})
+                for (i, query, vector), results in zip(to_search, found)
+            ), return_exceptions=True)
+            for (i, _, _), result in zip(to_search, finished):
+                prepared[i] = {"error": str(result)} if isinstance(result, Exception) else result
+        return prepared
+
+    @staticmethod
+    def _prompts(question: str, detected_lang: str, index_version: str, context: str, sources: list[dict], **extra) -> dict:
+        """Construct the generation prompts over a context; `extra` keys are added to the result."""
         lang_instruction = ""
         if detected_lang == "ta":
             lang_instruction = "\n\nIMPORTANT: The user asked in Tamil. You MUST respond entirely in Tamil."
 
-        system_prompt = RAG_SYSTEM_PROMPT.format(context=context) + lang_instruction
-        user_prompt = RAG_USER_PROMPT.format(question=question)
+        return {
+            "detected_language": detected_lang,
+            "index_version": index_version,
+            "sources": sources,
+            "system_prompt": RAG_SYSTEM_PROMPT.format(context=context) + lang_instruction,
+            "user_prompt": RAG_USER_PROMPT.format(question=question),
+            **extra,
+        }
+
+    def _remember(self, prepared: dict, answer: str):
+        """Store a freshly generated answer in the semantic cache (citation lookups aren't cached)."""
+        if "cache_key" not in prepared:
+            return
+        vector, language, index_version = prepared["cache_key"]
+        self.cache.store(vector, language, index_version, {
+            "answer": answer,
+            "sources": prepared["sources"],
+        })
+
+    async def answer_question(
+        self,
+        question: str,
+        force_language: str | None = None,
+        text_only: bool = False,
+        translation: Awaitable[str] | None = None,
+    ) -> dict:
+        """
+        Full RAG flow: retrieve, then generate the whole answer in one call.
+        With `text_only`, a question citing sections gets their text back without an LLM call.
+        """
+        timings: dict = {}
+        prepared = await self._prepare(question, force_language, text_only, timings, translation)
 
-        # 6 ─ Generate answer
-        answer = await self.llm.generate(system_prompt, user_prompt)
+        answer = prepared.get("answer")
+        if answer is None:
+            start = time.perf_counter()
+            answer = await self.llm.generate(prepared["system_prompt"], prepared["user_prompt"])
+            timings["generation_ms"] = _elapsed_ms(start)
+            self._remember(prepared, answer)
 
         return {
             "answer": answer,
-            "detected_language": detected_lang,
-            "sources": sources,
+            "detected_language": prepared["detected_language"],
+            "index_version": prepared["index_version"],
+            "citations": prepared.get("citations", []),
+            "sources": prepared["sources"],
+            "timings": timings,
             "disclaimer": DISCLAIMER,
         }
+
+    async def stream_answer(
+        self, question: str, force_language: str | None = None, text_only: bool = False
+    ) -> AsyncIterator[dict]:
+        """
+        Streaming RAG flow. Yields events in order:
+        - {"event": "sources", ...} as soon as retrieval finishes
+        - {"event": "token", "text": ...} for each generated text fragment
+        - {"event": "done", "disclaimer": ..., "timings": ...} once generation completes
+        """
+        timings: dict = {}
+        prepared = await self._prepare(question, force_language, text_only, timings)
+        yield {
+            "event": "sources",
+            "detected_language": prepared["detected_language"],
+            "index_version": prepared["index_version"],
+            "citations": prepared.get("citations", []),
+            "sources": prepared["sources"],
+            "timings": dict(timings),
+        }
+
+        if prepared.get("answer") is not None:
+            yield {"event": "token", "text": prepared["answer"]}
+        else:
+            start = time.perf_counter()
+            parts = []
+            async for text in self.llm.generate_stream(prepared["system_prompt"], prepared["user_prompt"]):
+                parts.append(text)
+                yield {"event": "token", "text": text}
+            timings["generation_ms"] = _elapsed_ms(start)
+            self._remember(prepared, "".join(parts).strip())
+
+        yield {"event": "done", "disclaimer": DISCLAIMER, "timings": timings}
+
+    async def answer_batch(self, items: list[dict], text_only: bool = False) -> AsyncIterator[dict]:
+        """
+        Bulk Q&A over {"id", "question", "language"} items. Identical questions
+        (ignoring case and spacing, same forced language) are answered once;
+        retrieval runs as one batch (see _prepare_batch) and generation is fanned
+        out under BATCH_QUERY_CONCURRENCY. Yields one result per item as its
+        answer completes, with "error" instead of "answer" if its question failed.
+        """
+        groups: dict[tuple[str, str | None], list[dict]] = {}
+        for item in items:
+            key = (" ".join(item["question"].split()).casefold(), item.get("language"))
+            groups.setdefault(key, []).append(item)
+        keys = list(groups)
+        start = time.perf_counter()
+        prepared = await self._prepare_batch([(groups[k][0]["question"], k[1]) for k in keys], text_only)
+        logger.info(f"Batch of {len(items)} questions ({len(keys)} distinct) retrieved in {_elapsed_ms(start)} ms")
+
+        semaphore = asyncio.Semaphore(self.settings.batch_query_concurrency)
+
+        async def generate(key: tuple, prep: dict) -> tuple[tuple, dict]:
+            if "error" in prep or prep.get("answer") is not None:
+                return key, prep
+            async with semaphore:
+                try:
+                    answer = await self.llm.generate(prep["system_prompt"], prep["user_prompt"])
+                except Exception as e:
+                    return key, {"error": str(e)}
+            self._remember(prep, answer)
+            return key, {**prep, "answer": answer}
+
+        tasks = [asyncio.ensure_future(generate(k, p)) for k, p in zip(keys, prepared)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                key, prep = await next_done
+                for item in groups[key]:
+                    if "error" in prep:
+                        yield {"id": item["id"], "question": item["question"], "error": prep["error"]}
+                        continue
+                    yield {
+                        "id": item["id"],
+                        "question": item["question"],
+                        "answer": prep["answer"],
+                        "detected_language": prep["detected_language"],
+                        "index_version": prep["index_version"],
+                        "citations": prep.get("citations", []),
+                        "sources": prep["sources"],
+                        "disclaimer": DISCLAIMER,
+                    }
+        finally:
+            # The client went away (or all done): don't keep generating for nobody
+            for task in tasks:
+                task.cancel()
@@ -0,0 +1,109 @@
+"""
+NyayaSahaya — Cross-encoder re-ranking of retrieved chunks (local, CPU).
+
+Retrieval fetches a wide candidate set cheaply; a small cross-encoder then
+reads each (question, chunk) pair together and only the best few chunks reach
+the prompt. Scoring runs on a dedicated thread under a time budget: when the
+budget runs out the candidates keep their retrieval order, so a slow CPU
+never holds up an answer for long. The budget counts from when scoring starts,
+not from when the request asks for it: under concurrent requests a job waits
+for the thread first, so every request still gets its full budget instead of
+queued ones quietly falling back to retrieval order.
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class _RerankStats:
+    """Process-wide counters for re-ranking calls."""
+
+    def __init__(self):
+        self.completed = 0
+        self.over_budget = 0
+        self.total_latency = 0.0
+
+    def snapshot(self) -> dict:
+        calls = self.completed + self.over_budget
+        return {
+            "completed": self.completed,
+            "over_budget": self.over_budget,
+            "avg_latency_ms": round(self.total_latency / calls * 1000, 1) if calls else 0.0,
+        }
+
+
+class RerankerService:
+    """Re-scores retrieved chunks against the question with a cross-encoder."""
+
+    _instance: Optional["RerankerService"] = None
+    _initialized: bool = False
+    stats = _RerankStats()
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+        settings = get_settings()
+        self.enabled = settings.rerank_enabled
+        self.candidates = settings.rerank_candidates
+        self.top_n = settings.rerank_top_n
+        self.budget = settings.rerank_budget_ms / 1000
+        self.batch_size = settings.rerank_batch_size
+        self.model = None
+        if self.enabled:
+            from sentence_transformers import CrossEncoder
+
+            logger.info(f"Loading re-ranking model: {settings.rerank_model}")
+            self.model = CrossEncoder(settings.rerank_model, device="cpu")
+        # One scoring job at a time; the event loop only awaits it
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rerank")
+        self._initialized = True
+
+    def _score(self, question: str, texts: list[str]) -> Optional[list[float]]:
+        """Cross-encoder scores for each text, or None if they take longer than the budget."""
+        deadline = time.perf_counter() + self.budget
+        scores: list[float] = []
+        for start in range(0, len(texts), self.batch_size):
+            if time.perf_counter() > deadline:
+                return None  # stop using CPU; the caller falls back to retrieval order
+            pairs = [(question, text) for text in texts[start:start + self.batch_size]]
+            scores.extend(self.model.predict(pairs, batch_size=self.batch_size, show_progress_bar=False).tolist())
+        return scores
+
+    async def rerank(self, question: str, chunks: list[dict], top_n: Optional[int] = None) -> tuple[list[dict], bool]:
+        """
+        The best `top_n` chunks by cross-encoder score (stored as each chunk's
+        `rerank_score`; `score` stays the retrieval similarity), and whether
+        re-ranking finished within the budget. Otherwise the first `top_n`
+        chunks are returned in their retrieval order.
+        """
+        top_n = top_n or self.top_n
+        if self.model is None or len(chunks) <= 1:
+            return chunks[:top_n], False
+
+        start = time.perf_counter()
+        # Not wait_for: the job stops itself at the budget (after at most one more batch)
+        scores = await asyncio.get_running_loop().run_in_executor(
+            self._pool, self._score, question, [c["text"] for c in chunks]
+        )
+        RerankerService.stats.total_latency += time.perf_counter() - start
+        if scores is None:
+            RerankerService.stats.over_budget += 1
+            logger.info(f"Re-ranking {len(chunks)} candidates exceeded {self.budget * 1000:.0f} ms; using retrieval order")
+            return chunks[:top_n], False
+
+        RerankerService.stats.completed += 1
+        for chunk, score in zip(chunks, scores):
+            chunk["rerank_score"] = float(score)
+        return sorted(chunks, key=lambda c: c["rerank_score"], reverse=True)[:top_n], True
@@ -0,0 +1,256 @@
+"""
+NyayaSahaya — Translation memory.
+
+The same strings are translated over and over: fixed messages, classifier
+explanations, questions many people ask. Each translation is stored in a
+SQLite file keyed by (source language, target language, hash of the
+whitespace-normalised text), with an in-memory LRU in front of it, so only
+text never seen before costs an LLM round trip. The Tamil versions of fixed
+English strings (TAMIL_TRANSLATIONS) are seeded at startup and never evicted.
+
+Only the hash of the source text is stored. Translations of user text expire
+after TRANSLATION_MEMORY_TTL_SECONDS; the seeded ones never do. Writes, and
+the last-used times of hits (batched), go through a single writer thread so
+the event loop only ever runs a primary-key SELECT.
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+from app.config import get_settings
+from app.utils.constants import TAMIL_TRANSLATIONS
+
+logger = logging.getLogger(__name__)
+
+# expires_at is NULL for pinned rows
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS translations (
+    key TEXT PRIMARY KEY,
+    source_lang TEXT NOT NULL,
+    target_lang TEXT NOT NULL,
+    translation TEXT NOT NULL,
+    pinned INTEGER NOT NULL DEFAULT 0,
+    last_used REAL NOT NULL,
+    expires_at REAL
+);
+CREATE INDEX IF NOT EXISTS translations_eviction ON translations (pinned, last_used);
+CREATE INDEX IF NOT EXISTS translations_expiry ON translations (expires_at);
+"""
+
+# Trim the table every this many new rows rather than on every insert
+_EVICT_EVERY = 100
+# Write the last-used times of hits once this many are pending
+_TOUCH_EVERY = 100
+
+
+def normalize_text(text: str) -> str:
+    """Collapse runs of whitespace so reformatted copies of a string share an entry."""
+    return " ".join(text.split())
+
+
+def memory_key(text: str, source_lang: str, target_lang: str) -> str:
+    return hashlib.sha256(f"{source_lang}\0{target_lang}\0{normalize_text(text)}".encode("utf-8")).hexdigest()
+
+
+class TranslationMemory:
+    """Process-wide translation store: in-memory LRU over an on-disk SQLite table."""
+
+    _instance: Optional["TranslationMemory"] = None
+    _initialized: bool = False
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+        settings = get_settings()
+        self.enabled = settings.translation_memory_enabled
+        self.max_entries = settings.translation_memory_max_entries
+        self.ttl = settings.translation_memory_ttl_seconds
+        self.hot_entries = min(self.max_entries, 1000)
+        self.path = Path(settings.data_dir) / "translation_memory.sqlite3"
+        # key -> (translation, expires_at or None if pinned), most recent last
+        self._hot: OrderedDict[str, tuple[str, Optional[float]]] = OrderedDict()
+        self._touched: dict[str, float] = {}  # key -> last hit, not yet written
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None  # reads, from any thread under _lock
+        self._writer_db: Optional[sqlite3.Connection] = None  # writes, from the writer thread only
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="translation-memory")
+        self._inserts = 0
+        self.hits = 0
+        self.misses = 0
+        if self.enabled:
+            self._open()
+            self.seed(TAMIL_TRANSLATIONS, "en", "ta")
+        self._initialized = True
+
+    def _open(self):
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(self.path, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")  # uvicorn workers share the file
+            columns = {row[1] for row in db.execute("PRAGMA table_info(translations)")}
+            if "text" in columns:
+                # Earlier versions stored the source text itself: drop it, off the disk too
+                logger.info("Translation memory: dropping entries stored with their source text")
+                db.execute("DROP TABLE translations")
+                db.commit()
+                db.execute("VACUUM")
+                db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            db.executescript(_SCHEMA)
+            db.execute("DELETE FROM translations WHERE expires_at <= ?", (time.time(),))
+            db.commit()
+            self._db = db
+            self._writer_db = sqlite3.connect(self.path, check_same_thread=False)
+        except sqlite3.Error as e:
+            logger.warning(f"Translation memory at {self.path} unavailable, keeping it in memory only: {e}")
+
+    def _remember(self, key: str, translation: str, expires_at: Optional[float]):
+        self._hot[key] = (translation, expires_at)
+        self._hot.move_to_end(key)
+        while len(self._hot) > self.hot_entries:
+            self._hot.popitem(last=False)
+
+    def lookup(self, text: str, source_lang: str, target_lang: str) -> Optional[str]:
+        """The stored, unexpired translation of `text`, or None."""
+        if not self.enabled:
+            return None
+        key = memory_key(text, source_lang, target_lang)
+        now = time.time()
+        with self._lock:
+            translation = None
+            hot = self._hot.get(key)
+            if hot is not None:
+                translation, expires_at = hot
+                if expires_at is not None and expires_at <= now:
+                    del self._hot[key]
+                    translation = None
+                else:
+                    self._hot.move_to_end(key)
+            if translation is None and self._db is not None:
+                try:
+                    row = self._db.execute(
+                        "SELECT translation, expires_at FROM translations "
+                        "WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+                        (key, now),
+                    ).fetchone()
+                    if row is not None:
+                        translation = row[0]
+                        self._remember(key, *row)
+                except sqlite3.Error as e:
+                    logger.warning(f"Translation memory lookup failed: {e}")
+            if translation is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            if self._db is not None:
+                self._touched[key] = now
+                if len(self._touched) >= _TOUCH_EVERY:
+                    self._writer.submit(self._write, None)
+            return translation
+
+    def store(self, text: str, source_lang: str, target_lang: str, translation: str, pinned: bool = False):
+        """Remember a translation. Pinned entries (the seeds) never expire and are never evicted."""
+        if not self.enabled or not translation:
+            return
+        key = memory_key(text, source_lang, target_lang)
+        now = time.time()
+        expires_at = None if pinned else now + self.ttl
+        with self._lock:
+            self._remember(key, translation, expires_at)
+        if self._db is not None:
+            self._writer.submit(self._write, (key, source_lang, target_lang, translation, int(pinned), now, expires_at))
+
+    def _write(self, row: Optional[tuple]):
+        """Writer thread: insert `row` (if any) along with the pending last-used times."""
+        db = self._writer_db
+        if db is None:  # closed
+            return
+        with self._lock:
+            touched, self._touched = self._touched, {}
+        try:
+            if row is not None:
+                db.execute(
+                    """INSERT INTO translations (key, source_lang, target_lang, translation, pinned, last_used, expires_at)
+                       VALUES (?, ?, ?, ?, ?, ?, ?)
+                       ON CONFLICT (key) DO UPDATE SET
+                           translation = excluded.translation,
+                           pinned = MAX(pinned, excluded.pinned),
+                           last_used = excluded.last_used,
+                           expires_at = CASE WHEN MAX(pinned, excluded.pinned) THEN NULL ELSE excluded.expires_at END""",
+                    row,
+                )
+                self._inserts += 1
+                if self._inserts % _EVICT_EVERY == 0:
+                    self._evict()
+            if touched:
+                db.executemany(
+                    "UPDATE translations SET last_used = MAX(last_used, ?) WHERE key = ?",
+                    [(used, key) for key, used in touched.items()],
+                )
+            db.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Translation memory write failed: {e}")
+
+    def _evict(self):
+        """Drop expired rows, then the least recently used unpinned rows beyond max_entries."""
+        db = self._writer_db
+        db.execute("DELETE FROM translations WHERE expires_at <= ?", (time.time(),))
+        (count,) = db.execute("SELECT COUNT(*) FROM translations").fetchone()
+        excess = count - self.max_entries
+        if excess > 0:
+            db.execute(
+                """DELETE FROM translations WHERE key IN (
+                       SELECT key FROM translations WHERE pinned = 0 ORDER BY last_used LIMIT ?)""",
+                (excess,),
+            )
+            logger.info(f"Translation memory: evicted up to {excess} least recently used entries")
+
+    def flush(self):
+        """Wait until every queued write, and the pending last-used times, are on disk."""
+        if self._db is not None:
+            self._writer.submit(self._write, None).result()
+
+    def close(self):
+        """Flush and close the database (the in-memory LRU keeps working)."""
+        self.flush()
+        with self._lock:
+            for db in (self._db, self._writer_db):
+                if db is not None:
+                    db.close()
+            self._db = self._writer_db = None
+
+    def seed(self, translations: dict[str, str], source_lang: str, target_lang: str):
+        """Pin known translations of fixed strings."""
+        for text, translation in translations.items():
+            self.store(text, source_lang, target_lang, translation, pinned=True)
+
+    def __len__(self) -> int:
+        with self._lock:
+            if self._db is None:
+                return len(self._hot)
+            try:
+                return self._db.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+            except sqlite3.Error:
+                return len(self._hot)
+
+    @property
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "entries": len(self) if self.enabled else 0,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+        }
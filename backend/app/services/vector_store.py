@@ -0,0 +1,718 @@
+"""
+NyayaSahaya — FAISS vector store (one index generation + chunk metadata + manifest).
+
+EmbeddingService publishes one VectorStore at a time as an immutable snapshot:
+index, metadata and version always belong together. Writers never modify the
+published store: they work on a copy() and publish it with a new version when
+done, so queries keep being answered from the previous snapshot while
+indexing runs and never see a half-built index.
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import pickle
+import secrets
+import shutil
+from pathlib import Path
+from typing import Callable, Optional
+
+import faiss
+import numpy as np
+
+from app.services.chunk_store import ChunkStore
+from app.services.citation_index import Citation, CitationIndex
+from app.services.lexical_index import LexicalIndex, reciprocal_rank_fusion
+from app.utils.text_processor import chunk_text, chunking_signature, read_document
+
+logger = logging.getLogger(__name__)
+
+
+# "cosine": vectors are L2-normalised and compared by inner product, so scores
+# are similarities in [-1, 1]. "l2": raw vectors and squared L2 distances
+# (indexes saved before the metric was configurable).
+METRICS = {"cosine": faiss.METRIC_INNER_PRODUCT, "l2": faiss.METRIC_L2}
+
+
+def build_faiss_index(
+    dimension: int, factory: str, train_vectors: Optional[np.ndarray] = None, metric: str = "cosine"
+) -> faiss.Index:
+    """
+    Create an index from a FAISS factory string ("Flat", "HNSW32", "IVF256,PQ32", ...).
+    Indexes that need training are trained on `train_vectors`; if there are too
+    few vectors to train, fall back to an exact flat index.
+    """
+    index = faiss.index_factory(dimension, factory, METRICS[metric])
+    if index.is_trained or train_vectors is None or len(train_vectors) == 0:
+        return index
+    try:
+        index.train(train_vectors)
+    except RuntimeError as e:
+        logger.warning(f"Could not train '{factory}' on {len(train_vectors)} vectors ({e}); using Flat instead")
+        index = faiss.IndexFlat(dimension, METRICS[metric])
+    return index
+
+
+def normalize(vectors: np.ndarray) -> np.ndarray:
+    """Row-wise L2-normalised float32 copy of `vectors`."""
+    vectors = np.array(vectors, dtype="float32", ndmin=2)
+    faiss.normalize_L2(vectors)
+    return vectors
+
+
+def file_hash(path: Path) -> str:
+    """SHA-256 of a file's bytes, used to detect changed documents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def text_hash(text: str) -> str:
+    """Short hash of whitespace-normalised chunk text, used to skip duplicate chunks."""
+    normalized = " ".join(text.split())
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def search_parameters(
+    index: faiss.Index, nprobe: Optional[int] = None, ef_search: Optional[int] = None
+) -> Optional[faiss.SearchParameters]:
+    """Per-query search parameters for IVF (nprobe) and HNSW (efSearch) indexes."""
+    inner = faiss.downcast_index(index)
+    if isinstance(inner, (faiss.IndexIDMap, faiss.IndexIDMap2)):
+        inner = faiss.downcast_index(inner.index)  # stores wrap every index in IndexIDMap2
+    if hasattr(inner, "hnsw"):
+        return faiss.SearchParametersHNSW(efSearch=ef_search) if ef_search else None
+    try:
+        faiss.extract_index_ivf(index)
+    except RuntimeError:
+        return None
+    return faiss.SearchParametersIVF(nprobe=nprobe) if nprobe else None
+
+
+def exact_scores(vectors: np.ndarray, query_vec: np.ndarray, metric: int) -> np.ndarray:
+    """
+    Full-precision scores of `vectors` against one query, in the index's own
+    convention: squared L2 distance (lower is better) or inner product (higher is better).
+    """
+    query_vec = query_vec.reshape(-1)
+    if metric == faiss.METRIC_INNER_PRODUCT:
+        return vectors @ query_vec
+    diff = vectors - query_vec
+    return np.einsum("ij,ij->i", diff, diff)
+
+
+def relevance_floor(best: float, min_score: Optional[float], dropoff: Optional[float]) -> float:
+    """Lowest similarity still relevant when the best hit scores `best` (None = no limit)."""
+    return max(-1.0 if min_score is None else min_score, best - (2.0 if dropoff is None else dropoff))
+
+
+def relevant_hits(hits: list[tuple[int, float]], min_score: float, dropoff: float) -> list[tuple[int, float]]:
+    """
+    Dynamic k over (id, similarity) pairs sorted best-first: keep hits while
+    they score at least `min_score` and no more than `dropoff` below the best,
+    so weakly related chunks are not sent to the LLM just to fill top_k.
+    """
+    if not hits:
+        return hits
+    floor = relevance_floor(hits[0][1], min_score, dropoff)
+    kept = []
+    for hit in hits:
+        if hit[1] < floor:
+            break
+        kept.append(hit)
+    return kept
+
+
+class IndexProgress:
+    """Receives indexing progress callbacks; the default implementation ignores them."""
+
+    def phase(self, name: str):
+        pass
+
+    def add_total(self, chunks: int):
+        pass
+
+    def advance(self, chunks: int):
+        pass
+
+
+EmbedFn = Callable[[list[str], IndexProgress], np.ndarray]
+
+
+class VectorStore:
+    """An ID-mapped FAISS index with its chunk store, BM25 and citation indexes and per-file manifest."""
+
+    def __init__(
+        self, dimension: int, index_factory: str, embed: EmbedFn, keep_vectors: bool = False, metric: str = "cosine"
+    ):
+        self.dimension = dimension
+        self.index_factory = index_factory
+        self.built_factory = index_factory  # what the index really is: "Flat" if training fell back
+        self.embed = embed
+        self.metric = metric  # a key of METRICS
+        self.keep_vectors = keep_vectors  # store float32 embeddings next to the chunks for re-ranking
+        self.index: Optional[faiss.Index] = None  # IndexIDMap2 over the factory index
+        self.chunks = ChunkStore()  # vector ID -> chunk text and metadata
+        self.lexical = LexicalIndex()  # BM25 over the same chunks, for hybrid retrieval
+        self._citations: Optional[CitationIndex] = None  # (act, section) -> IDs; rebuilt after a write
+        self.files: dict[str, dict] = {}  # filename -> {"sha256", "start_id", "count", "shared"}
+        self.next_id = 0
+        self.needs_rebuild = False
+        self.version = 0  # bumped each time a modified copy is published
+        self.mapped = False  # index opened read-only from a memory-mapped file
+        self.index_path: Optional[Path] = None  # file the index was loaded from / saved to
+        self.progress = IndexProgress()
+
+    def copy(self) -> "VectorStore":
+        """A writable copy; the original stays untouched while the copy is updated."""
+        other = VectorStore(self.dimension, self.index_factory, self.embed, self.keep_vectors, self.metric)
+        other.index = None
+        other.built_factory = self.built_factory
+        if self.index is not None and self.mapped:
+            # Mapped storage is a read-only view that clone_index would share; copy the bytes
+            other.index = faiss.deserialize_index(faiss.serialize_index(self.index))
+        elif self.index is not None:
+            other.index = faiss.clone_index(self.index)
+        other.chunks = self.chunks.copy()
+        other.lexical = self.lexical.copy()
+        other._citations = self._citations  # replaced, never modified, once the copy is written
+        other.files = copy.deepcopy(self.files)
+        other.next_id = self.next_id
+        other.needs_rebuild = self.needs_rebuild
+        other.version = self.version
+        return other
+
+    @property
+    def total_vectors(self) -> int:
+        return self.index.ntotal if self.index is not None else 0
+
+    @property
+    def citations(self) -> CitationIndex:
+        """The citation index over the current chunks, built on first use after a write."""
+        if self._citations is None:
+            self._citations = CitationIndex.from_chunks(self.chunks)
+        return self._citations
+
+    # ── Writing ──────────────────────────────────────────────
+    def reset(self, train_vectors: Optional[np.ndarray] = None):
+        """Start over with an empty index (trained on `train_vectors` if needed)."""
+        if train_vectors is not None and self.metric == "cosine":
+            train_vectors = normalize(train_vectors)
+        self.index = self._build_index(train_vectors)
+        self.chunks = ChunkStore()
+        self.lexical = LexicalIndex()
+        self._citations = None
+        self.files = {}
+        self.next_id = 0
+        self.needs_rebuild = False
+
+    def _build_index(self, train_vectors: Optional[np.ndarray]) -> faiss.IndexIDMap2:
+        """An empty ID-mapped index from the factory, noting in built_factory if it fell back to Flat."""
+        index = build_faiss_index(self.dimension, self.index_factory, train_vectors, self.metric)
+        self.built_factory = "Flat" if isinstance(index, faiss.IndexFlat) else self.index_factory
+        return faiss.IndexIDMap2(index)
+
+    def _embed(self, chunks: list[dict]) -> np.ndarray:
+        self.progress.add_total(len(chunks))
+        self.progress.phase("embedding")
+        return self.embed([c["text"] for c in chunks], self.progress)
+
+    def add_vectors(self, chunks: list[dict], vectors: np.ndarray) -> int:
+        """Add embedded chunks under fresh sequential IDs; returns the first ID used."""
+        if self.metric == "cosine":
+            vectors = normalize(vectors)
+        if self.index is None:
+            self.reset()
+        if not self.index.is_trained:
+            # First batch into an empty IVF/PQ index: train on it
+            self.index = self._build_index(vectors)
+        self.progress.phase("indexing")
+        start_id = self.next_id
+        ids = np.arange(start_id, start_id + len(chunks), dtype="int64")
+        self.index.add_with_ids(vectors, ids)
+        self.chunks.append(ids, chunks, vectors if self.keep_vectors else None)
+        self.lexical.append(ids, [c["text"] for c in chunks])
+        self._citations = None
+        self.next_id += len(chunks)
+        return start_id
+
+    def dedupe(self, chunks: list[dict], seen: Optional[set] = None) -> tuple[list[dict], list[str]]:
+        """
+        Split chunks into those whose text is not indexed yet and the hashes of
+        those already indexed (by this or any other file).
+        """
+        seen = set() if seen is None else seen
+        unique, shared = [], []
+        for chunk in chunks:
+            chunk["text_hash"] = text_hash(chunk["text"])
+            if chunk["text_hash"] in seen or self.chunks.has_hash(chunk["text_hash"]):
+                shared.append(chunk["text_hash"])
+            else:
+                seen.add(chunk["text_hash"])
+                unique.append(chunk)
+        return unique, shared
+
+    def add_chunks(self, chunks: list[dict]) -> int:
+        """Embed and add chunks not already indexed; returns the number added."""
+        chunks, _ = self.dedupe(chunks)
+        if chunks:
+            self.add_vectors(chunks, self._embed(chunks))
+        return len(chunks)
+
+    def remove_file(self, name: str) -> int:
+        """
+        Remove every vector belonging to an indexed file; returns the number removed.
+        Files that reused one of its chunks are marked stale so they get re-indexed
+        (their hash is kept as `previous_sha256` in case the chunks come back).
+        """
+        entry = self.files.pop(name, None)
+        if entry is None or entry["count"] == 0:
+            return 0
+        start, end = entry["start_id"], entry["start_id"] + entry["count"]
+        removed = self.index.remove_ids(faiss.IDSelectorRange(start, end))
+        removed_hashes = self.chunks.remove_range(start, end)
+        self.lexical.remove_range(start, end)
+        self._citations = None
+        for other in self.files.values():
+            if removed_hashes.intersection(other.get("shared", ())):
+                other["previous_sha256"] = other["sha256"] or other.get("previous_sha256", "")
+                other["sha256"] = ""
+        return removed
+
+    def _index_file(self, path: Path, content_hash: str) -> int:
+        """Replace the vectors of one file with its current contents; returns chunks embedded."""
+        if path.name in self.files:
+            self.remove_file(path.name)
+
+        self.progress.phase("chunking")
+        chunks, shared = self.dedupe(chunk_text(read_document(path), source=path.name))
+        start_id = self.next_id
+        if chunks:
+            start_id = self.add_vectors(chunks, self._embed(chunks))
+        self.files[path.name] = {
+            "sha256": content_hash,
+            "start_id": start_id,
+            "count": len(chunks),
+            "shared": shared,
+        }
+        return len(chunks)
+
+    def _reindex_stale(self, paths: dict[str, Path]) -> list[str]:
+        """
+        Re-index files whose shared chunks were removed along with another file.
+        A stale file whose shared chunks have all been indexed again meanwhile
+        (typically by the file that removed them) just gets its hash back. Each
+        file is re-indexed at most once per call: files holding each other's
+        chunks would otherwise keep marking one another stale forever.
+        """
+        refreshed: list[str] = []
+        while True:
+            progressed = False
+            for name in [n for n, e in self.files.items() if not e["sha256"] and n in paths]:
+                entry = self.files[name]
+                if entry.get("previous_sha256") and all(self.chunks.has_hash(h) for h in entry.get("shared", ())):
+                    entry["sha256"] = entry.pop("previous_sha256")
+                    progressed = True
+                elif name not in refreshed:
+                    self._index_file(paths[name], file_hash(paths[name]))
+                    refreshed.append(name)
+                    progressed = True
+            if not progressed:
+                left = [n for n, e in self.files.items() if not e["sha256"] and n in paths]
+                if left:
+                    logger.warning(f"Still missing shared chunks after re-indexing: {left}; the next sync will retry")
+                return refreshed
+
+    def index_file(self, path: Path) -> dict:
+        """
+        (Re-)index one document, replacing any previous vectors for the same
+        filename. Chunks whose text is already indexed are not embedded again,
+        so re-uploading identical content (under any name) adds nothing. If the
+        index type cannot remove vectors (HNSW), the index is rebuilt over the
+        indexed files in the same directory plus this one instead.
+        Returns {"chunks_embedded", "duplicate_chunks", "duplicate_of", "unchanged"}:
+        `duplicate_of` names another file with the same content, `unchanged` is
+        True when this file was already indexed with this content.
+        """
+        path = Path(path)
+        content_hash = file_hash(path)
+        duplicate_of = next(
+            (n for n, e in self.files.items() if e["sha256"] == content_hash and n != path.name), None
+        )
+        entry = self.files.get(path.name)
+        if entry is not None and entry["sha256"] == content_hash:
+            return {"chunks_embedded": 0, "duplicate_chunks": entry["count"] + len(entry.get("shared", [])),
+                    "duplicate_of": duplicate_of, "unchanged": True}
+
+        # Listed before _index_file, which drops this file's entry before removing its vectors
+        indexed = [path.parent / n for n in self.files if n != path.name and (path.parent / n).is_file()]
+        try:
+            embedded = self._index_file(path, content_hash)
+            self._reindex_stale({p.name: p for p in path.parent.iterdir() if p.is_file()})
+        except RuntimeError as e:
+            logger.warning(f"Incremental update not supported by this index ({e}); rebuilding")
+            self.build(indexed + [path])
+            embedded = self.files[path.name]["count"]
+        return {
+            "chunks_embedded": embedded,
+            "duplicate_chunks": len(self.files[path.name]["shared"]),
+            "duplicate_of": duplicate_of,
+            "unchanged": False,
+        }
+
+    def build(self, paths: list[Path]) -> int:
+        """Rebuild the index from scratch over `paths` (training IVF/PQ on the whole corpus)."""
+        self.progress.phase("chunking")
+        self.chunks = ChunkStore()
+        seen: set = set()
+        per_file = []
+        for path in paths:
+            path = Path(path)
+            chunks, shared = self.dedupe(chunk_text(read_document(path), source=path.name), seen)
+            per_file.append((path, file_hash(path), chunks, shared))
+        all_chunks = [c for _, _, chunks, _ in per_file for c in chunks]
+        vectors = self._embed(all_chunks) if all_chunks else None
+
+        self.reset(vectors)
+        if all_chunks:
+            self.add_vectors(all_chunks, vectors)
+
+        start_id = 0
+        for path, content_hash, chunks, shared in per_file:
+            self.files[path.name] = {
+                "sha256": content_hash,
+                "start_id": start_id,
+                "count": len(chunks),
+                "shared": shared,
+            }
+            start_id += len(chunks)
+        logger.info(f"Built '{self.built_factory}' FAISS index over {len(all_chunks)} unique chunks")
+        return len(all_chunks)
+
+    def sync(self, paths: list[Path], full: bool = False) -> dict:
+        """
+        Bring the index in line with `paths` using the per-file content hashes
+        in the manifest: only new or changed files are embedded, and vectors of
+        changed or deleted files are removed. Falls back to a full rebuild when
+        asked to, when the index predates the manifest or was built with another
+        model/factory, or when the index type cannot remove vectors (HNSW).
+        """
+        paths = [Path(p) for p in paths]
+        current = {p.name: p for p in paths}
+        stats = {"added": [], "updated": [], "removed": [], "unchanged": 0, "chunks_embedded": 0, "full_rebuild": False}
+
+        if full or self.index is None or self.needs_rebuild:
+            stats["chunks_embedded"] = self.build(paths)
+            stats["added"] = list(current)
+            stats["full_rebuild"] = True
+            return stats
+
+        try:
+            self.progress.phase("scanning")
+            for name in [n for n in self.files if n not in current]:
+                self.remove_file(name)
+                stats["removed"].append(name)
+            for name, path in current.items():
+                entry = self.files.get(name)
+                content_hash = file_hash(path)
+                if entry is not None and entry["sha256"] == content_hash:
+                    stats["unchanged"] += 1
+                    continue
+                stats["updated" if entry is not None else "added"].append(name)
+                stats["chunks_embedded"] += self._index_file(path, content_hash)
+            for name in self._reindex_stale(current):
+                if name not in stats["updated"] and name not in stats["added"]:
+                    stats["updated"].append(name)
+                    stats["unchanged"] -= 1
+                stats["chunks_embedded"] += self.files[name]["count"]
+        except RuntimeError as e:
+            logger.warning(f"Incremental update not supported by this index ({e}); rebuilding")
+            return self.sync(paths, full=True)
+        return stats
+
+    # ── Reading ──────────────────────────────────────────────
+    def search(
+        self,
+        query_vec: np.ndarray,
+        top_k: int,
+        params: Optional[faiss.SearchParameters] = None,
+        rerank: int = 0,
+        min_score: Optional[float] = None,
+        dropoff: Optional[float] = None,
+    ) -> list[dict]:
+        """
+        Return up to top-k chunks for a query embedding, each with its `score`:
+        cosine similarity (higher is better) or, for "l2" stores, distance.
+        With `rerank` > 0 and full-precision vectors stored, that many candidates
+        are fetched from the (quantized) index and re-scored exactly.
+        On cosine stores `min_score` / `dropoff` cut the list short once hits
+        stop being relevant (see relevant_hits).
+        """
+        return self.search_batch(query_vec.reshape(1, -1), top_k, params, rerank, min_score, dropoff)[0]
+
+    def search_batch(
+        self,
+        query_vecs: np.ndarray,
+        top_k: int,
+        params: Optional[faiss.SearchParameters] = None,
+        rerank: int = 0,
+        min_score: Optional[float] = None,
+        dropoff: Optional[float] = None,
+    ) -> list[list[dict]]:
+        """search() for each row of `query_vecs`, with one multi-row FAISS search."""
+        if self.index is None or self.index.ntotal == 0:
+            return [[] for _ in range(len(query_vecs))]
+
+        rerank = rerank if self.chunks.vectors is not None else 0
+        query_vecs = normalize(query_vecs) if self.metric == "cosine" else np.ascontiguousarray(query_vecs, dtype="float32")
+        fetch = min(max(top_k, rerank), self.index.ntotal)
+        distances, indices = self.index.search(query_vecs, fetch, params=params)
+
+        batch = []
+        for query_vec, row_distances, row_indices in zip(query_vecs, distances, indices):
+            hits = [(int(i), float(d)) for d, i in zip(row_distances, row_indices) if i >= 0]
+
+            if rerank and hits:
+                rows = np.array([self.chunks.row(i) for i, _ in hits])
+                hits = [h for h, row in zip(hits, rows) if row >= 0]
+                rows = rows[rows >= 0]
+                scores = exact_scores(np.asarray(self.chunks.vectors[rows]), query_vec, self.index.metric_type)
+                order = np.argsort(-scores if self.index.metric_type == faiss.METRIC_INNER_PRODUCT else scores)
+                hits = [(hits[k][0], float(scores[k])) for k in order]
+
+            if self.metric == "cosine" and (min_score is not None or dropoff is not None):
+                hits = relevant_hits(
+                    hits[:top_k],
+                    -1.0 if min_score is None else min_score,
+                    2.0 if dropoff is None else dropoff,
+                )
+
+            results = []
+            for idx, score in hits[:top_k]:
+                chunk = self.chunks.get(idx)
+                if chunk is not None:
+                    chunk["score"] = score
+                    results.append(chunk)
+            batch.append(results)
+        return batch
+
+    def search_lexical(self, query: str, k: int, min_ratio: float = 0.0) -> list[tuple[int, float]]:
+        """Top-k (vector ID, BM25 score) pairs for a query; see LexicalIndex.search."""
+        return self.lexical.search(query, k, min_ratio)
+
+    def dense_scores(self, vector_ids: list[int], query_vec: np.ndarray) -> list[Optional[float]]:
+        """
+        Scores of specific vectors against one query, as search() reports them:
+        from the stored full-precision vectors if kept, else reconstructed from
+        the index. None where the index cannot reconstruct (IVF without a direct map).
+        """
+        if self.index is None or not vector_ids:
+            return [None] * len(vector_ids)
+        query_vec = normalize(query_vec)[0] if self.metric == "cosine" else np.asarray(query_vec, dtype="float32").reshape(-1)
+        scores: list[Optional[float]] = []
+        for vector_id in vector_ids:
+            row = self.chunks.row(vector_id)
+            if self.chunks.vectors is not None and row >= 0:
+                vector = np.asarray(self.chunks.vectors[row], dtype="float32")
+            else:
+                try:
+                    vector = self.index.reconstruct(int(vector_id))
+                except RuntimeError:
+                    scores.append(None)
+                    continue
+            scores.append(float(exact_scores(vector.reshape(1, -1), query_vec, self.index.metric_type)[0]))
+        return scores
+
+    def fuse(
+        self,
+        dense: list[dict],
+        lexical: list[tuple[int, float]],
+        top_k: int,
+        rrf_k: int = 60,
+        query_vec: Optional[np.ndarray] = None,
+        min_score: Optional[float] = None,
+        dropoff: Optional[float] = None,
+    ) -> list[dict]:
+        """
+        Merge dense results (from search, without a relevance cutoff) and BM25
+        hits by reciprocal-rank fusion. Chunk texts are unique, so text hashes
+        identify chunks across both lists. Chunks keep their dense `score` (looked
+        up for BM25-only hits when `query_vec` is given) and get the fused score
+        as `rrf_score`. On cosine stores `min_score` / `dropoff` then apply to the
+        fused list as in search(): a chunk BM25 found only for a shared word is
+        dropped unless it is semantically close enough too.
+        """
+        chunks = {c["text_hash"]: c for c in dense}
+        lexical_keys, lexical_only = [], []
+        for vector_id, _ in lexical:
+            chunk = self.chunks.get(vector_id)
+            if chunk is None:
+                continue
+            if chunk["text_hash"] not in chunks:
+                chunks[chunk["text_hash"]] = chunk
+                lexical_only.append((vector_id, chunk))
+            lexical_keys.append(chunk["text_hash"])
+        if lexical_only and query_vec is not None:
+            scores = self.dense_scores([vector_id for vector_id, _ in lexical_only], query_vec)
+            for (_, chunk), score in zip(lexical_only, scores):
+                chunk["score"] = score
+
+        ranked = []
+        for key, rrf_score in reciprocal_rank_fusion([[c["text_hash"] for c in dense], lexical_keys], rrf_k):
+            chunk = chunks[key]
+            chunk["rrf_score"] = rrf_score
+            ranked.append(chunk)
+        if self.metric == "cosine" and (min_score is not None or dropoff is not None):
+            ranked = [c for c in ranked if c.get("score") is not None]
+            if ranked:
+                floor = relevance_floor(max(c["score"] for c in ranked), min_score, dropoff)
+                ranked = [c for c in ranked if c["score"] >= floor]
+        return ranked[:top_k]
+
+    def lookup_citations(self, citations: list[Citation]) -> list[dict]:
+        """Chunks holding the cited sections, in citation then document order; no search involved."""
+        results, seen = [], set()
+        for citation in citations:
+            for vector_id in self.citations.lookup(citation):
+                chunk = self.chunks.get(vector_id)
+                if chunk is not None and vector_id not in seen:
+                    seen.add(vector_id)
+                    chunk["citation"] = str(citation)
+                    results.append(chunk)
+        return results
+
+    # ── Persistence ──────────────────────────────────────────
+    def save(self, store_dir: Path, model_name: str):
+        """
+        Write the index and chunk store into a new snapshot-* directory under
+        `store_dir`, then atomically replace manifest.json to point at it.
+        A crash mid-save never leaves a truncated or mismatched store behind,
+        and files that readers have memory-mapped are never overwritten.
+        """
+        store_dir.mkdir(parents=True, exist_ok=True)
+        snapshot = f"snapshot-{self.version}-{secrets.token_hex(4)}"
+        self.chunks.save(store_dir / snapshot)
+        self.lexical.save(store_dir / snapshot / "bm25")
+        self.citations.save(store_dir / snapshot / "citations.json")
+        faiss.write_index(self.index, str(store_dir / snapshot / "index.faiss"))
+
+        tmp_manifest = store_dir / ".manifest.json.tmp"
+        with open(tmp_manifest, "w", encoding="utf-8") as f:
+            json.dump({
+                "embedding_model": model_name,
+                "dimension": self.dimension,
+                "index_factory": self.built_factory,
+                "metric": self.metric,
+                "chunking": chunking_signature(),
+                "version": self.version,
+                "snapshot": snapshot,
+                "next_id": self.next_id,
+                "files": self.files,
+            }, f, indent=2)
+        os.replace(tmp_manifest, store_dir / "manifest.json")
+        self.index_path = store_dir / snapshot / "index.faiss"
+
+        # Older snapshots (and pre-snapshot layouts) are no longer referenced.
+        # Mapped files can't be deleted on Windows while a reader has them open; skip those.
+        for old in [*store_dir.glob("snapshot-*"), *store_dir.glob("chunks-*")]:
+            if old.name != snapshot:
+                shutil.rmtree(old, ignore_errors=True)
+        for legacy in ("index.faiss", "metadata.pkl"):
+            try:
+                (store_dir / legacy).unlink(missing_ok=True)
+            except OSError:
+                pass
+
+    @staticmethod
+    def read_manifest(store_dir: Path) -> dict:
+        manifest_path = store_dir / "manifest.json"
+        if not manifest_path.exists():
+            return {}
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def load(self, store_dir: Path, model_name: str, mmap: bool = False):
+        """
+        Load a saved store, flagging it for a rebuild if it cannot be updated incrementally.
+        With `mmap` the index's vector storage is memory-mapped read-only, so
+        processes serving the same store share it through the page cache.
+        """
+        manifest = self.read_manifest(store_dir)
+        snapshot = manifest.get("snapshot")
+        self.index_path = store_dir / snapshot / "index.faiss" if snapshot else store_dir / "index.faiss"
+        flags = 0
+        if mmap:
+            if hasattr(faiss, "IO_FLAG_MMAP_IFC"):
+                flags = faiss.IO_FLAG_MMAP_IFC | faiss.IO_FLAG_READ_ONLY
+            else:
+                logger.warning("This faiss build cannot memory-map flat index storage; loading into memory")
+        self.index = faiss.read_index(str(self.index_path), flags)
+        self.mapped = bool(flags)
+
+        chunk_dir = store_dir / (snapshot or manifest.get("chunk_store", ""))
+        if snapshot or "chunk_store" in manifest:
+            self.chunks = ChunkStore.load(chunk_dir)
+        else:
+            # Pickled metadata from before the columnar store; converted on the next save
+            with open(store_dir / "metadata.pkl", "rb") as f:
+                records = pickle.load(f)
+            if isinstance(records, list):
+                # Pre-manifest format: positional metadata over a plain index
+                records = dict(enumerate(records))
+            for chunk in records.values():
+                chunk.setdefault("text_hash", text_hash(chunk["text"]))
+            self.chunks = ChunkStore.from_records(records)
+        if (chunk_dir / "bm25").is_dir():
+            self.lexical = LexicalIndex.load(chunk_dir / "bm25")
+        else:
+            # Saved before hybrid retrieval; the BM25 index is written with the next save
+            self.lexical = LexicalIndex.from_chunks(self.chunks)
+        # Older snapshots have no citations.json; the index is then built on first lookup
+        citations_path = chunk_dir / "citations.json"
+        self._citations = CitationIndex.load(citations_path) if citations_path.exists() else None
+
+        built_with = manifest.get("embedding_model")
+        factory = self.built_factory = manifest.get("index_factory", "Flat")
+        metric = manifest.get("metric", "l2")
+        self.files = manifest.get("files", {})
+        self.next_id = manifest.get("next_id", self.index.ntotal)
+        self.version = manifest.get("version", 0)
+        self.needs_rebuild = "files" not in manifest or not isinstance(self.index, faiss.IndexIDMap2)
+        if self.keep_vectors and self.chunks.vectors is None and len(self.chunks):
+            logger.warning(
+                "Re-ranking is enabled but this index was saved without full-precision vectors; "
+                "the next re-index will rebuild it."
+            )
+            self.needs_rebuild = True
+        # Stores saved before the chunking settings were recorded were chunked recursively
+        chunking, current = manifest.get("chunking"), chunking_signature()
+        if chunking != current and (chunking or not current.startswith("recursive/")):
+            logger.warning(
+                f"Documents were chunked as '{chunking or 'recursive'}' but the settings give '{current}'; "
+                "the next re-index will rebuild it."
+            )
+            self.needs_rebuild = True
+        if metric != self.metric:
+            logger.warning(
+                f"FAISS index was built with the '{metric}' metric but FAISS_METRIC is '{self.metric}'; "
+                "searching it as saved until the next re-index rebuilds it."
+            )
+            self.metric = metric
+            self.needs_rebuild = True
+        if factory != self.index_factory:
+            logger.warning(
+                f"FAISS index was built as '{factory}' but FAISS_INDEX_FACTORY is '{self.index_factory}'; "
+                "the next re-index will rebuild it."
+            )
+            self.needs_rebuild = True
+        if self.index.d != self.dimension or (built_with and built_with != model_name):
+            logger.warning(
+                f"FAISS index was built with {built_with or 'an unknown model'} (dim {self.index.d}) "
+                f"but the configured model is {model_name} (dim {self.dimension}). "
+                "Re-index the documents so queries and vectors share one embedding space."
+            )
+            self.needs_rebuild = True
@@ -17,11 +17,161 @@ LEGAL_CATEGORIES = [
     "Welfare",
 ]
 
+CATEGORY_DESCRIPTIONS = {
+    "Criminal": "Theft, assault, murder, fraud, cybercrime, FIR-related",
+    "Civil": "Property disputes, contracts, torts, injunctions",
+    "Family": "Divorce, custody, maintenance, domestic violence, marriage",
+    "Consumer": "Product defects, service deficiency, unfair trade practices",
+    "Land": "Land acquisition, title disputes, tenant rights, encroachment",
+    "Welfare": "Government schemes, social security, labor rights, RTI",
+}
+
+LOCAL_CLASSIFIER_EXPLANATION = "The issue is closest to {category} matters ({description})."
+
+NO_INDEXED_DOCUMENTS_MESSAGE = (
+    "I don't have enough legal documents indexed yet to answer your question. "
+    "Please upload relevant Indian law documents first."
+)
+NO_RELEVANT_PROVISIONS_MESSAGE = (
+    "I couldn't find any provisions in the indexed legal documents that match your question. "
+    "Try rephrasing it, or mention the Act or section you have in mind."
+)
+CLASSIFIER_PARSE_ERROR = "Could not parse classification result."
+
+# Tamil versions of the fixed English strings above, seeded into the translation
+# memory so they never cost an LLM round trip
+_CATEGORY_EXPLANATIONS_TA = {
+    "Criminal": "இந்தப் பிரச்சினை குற்றவியல் விவகாரங்களுக்கு (திருட்டு, தாக்குதல், கொலை, மோசடி, இணையக் குற்றம், FIR தொடர்பானவை) மிக நெருக்கமானது.",
+    "Civil": "இந்தப் பிரச்சினை உரிமையியல் (சிவில்) விவகாரங்களுக்கு (சொத்துத் தகராறுகள், ஒப்பந்தங்கள், தீங்கியல், தடை உத்தரவுகள்) மிக நெருக்கமானது.",
+    "Family": "இந்தப் பிரச்சினை குடும்ப விவகாரங்களுக்கு (விவாகரத்து, குழந்தைக் காப்பு, ஜீவனாம்சம், குடும்ப வன்முறை, திருமணம்) மிக நெருக்கமானது.",
+    "Consumer": "இந்தப் பிரச்சினை நுகர்வோர் விவகாரங்களுக்கு (பொருள் குறைபாடுகள், சேவைக் குறைபாடு, நியாயமற்ற வர்த்தக நடைமுறைகள்) மிக நெருக்கமானது.",
+    "Land": "இந்தப் பிரச்சினை நில விவகாரங்களுக்கு (நில கையகப்படுத்தல், உரிமைத் தகராறுகள், குத்தகைதாரர் உரிமைகள், ஆக்கிரமிப்பு) மிக நெருக்கமானது.",
+    "Welfare": "இந்தப் பிரச்சினை நலத்திட்ட விவகாரங்களுக்கு (அரசுத் திட்டங்கள், சமூகப் பாதுகாப்பு, தொழிலாளர் உரிமைகள், தகவல் அறியும் உரிமை) மிக நெருக்கமானது.",
+}
+TAMIL_TRANSLATIONS = {
+    DISCLAIMER: (
+        "⚠️ இந்த AI பொதுவான சட்டத் தகவல்களை மட்டுமே வழங்குகிறது; இது தொழில்முறை சட்ட "
+        "ஆலோசனைக்கு மாற்றாகாது. குறிப்பிட்ட சட்ட விஷயங்களுக்குத் தகுதிவாய்ந்த "
+        "வழக்கறிஞரை அணுகவும்."
+    ),
+    NO_INDEXED_DOCUMENTS_MESSAGE: (
+        "உங்கள் கேள்விக்குப் பதிலளிக்கப் போதுமான சட்ட ஆவணங்கள் இன்னும் குறியிடப்படவில்லை. "
+        "முதலில் தொடர்புடைய இந்தியச் சட்ட ஆவணங்களைப் பதிவேற்றவும்."
+    ),
+    NO_RELEVANT_PROVISIONS_MESSAGE: (
+        "குறியிடப்பட்ட சட்ட ஆவணங்களில் உங்கள் கேள்விக்குப் பொருந்தும் விதிகள் எதுவும் கிடைக்கவில்லை. "
+        "கேள்வியை வேறு விதமாகக் கேட்டுப் பாருங்கள், அல்லது நீங்கள் கருதும் சட்டம் அல்லது பிரிவைக் குறிப்பிடுங்கள்."
+    ),
+    CLASSIFIER_PARSE_ERROR: "வகைப்படுத்தல் முடிவைப் புரிந்துகொள்ள முடியவில்லை.",
+    **{
+        LOCAL_CLASSIFIER_EXPLANATION.format(category=c, description=CATEGORY_DESCRIPTIONS[c]): ta
+        for c, ta in _CATEGORY_EXPLANATIONS_TA.items()
+    },
+}
+
+# Labelled issue descriptions for the local (embedding) classifier; each
+# category's centroid is the mean embedding of its examples and description.
+CLASSIFIER_EXAMPLES = {
+    "Criminal": [
+        "Someone stole my motorcycle from outside my house last night.",
+        "My neighbour attacked me with a stick and I was injured.",
+        "The police are refusing to register my FIR.",
+        "I lost money in an online fraud after sharing an OTP.",
+        "A person is threatening to kill me over the phone.",
+        "My photos were morphed and posted on social media.",
+        "I was arrested and need to know how to get bail.",
+        "Someone cheated me by promising a government job for money.",
+        "A chain snatcher grabbed my gold chain on the road.",
+        "My shop was broken into and cash was stolen.",
+        "en phone-a thiruditanga, police complaint eppadi kudukka?",
+        "என் வீட்டில் திருட்டு நடந்தது, காவல் நிலையத்தில் புகார் கொடுக்க வேண்டும்.",
+    ],
+    "Civil": [
+        "My business partner broke our written contract and owes me money.",
+        "A builder took an advance and did not complete the work as agreed.",
+        "My friend borrowed five lakh rupees and refuses to repay the loan.",
+        "The cheque given to me for a payment bounced.",
+        "A newspaper published false statements that damaged my reputation.",
+        "I want a court injunction to stop my neighbour's construction.",
+        "My employer has not paid the amount due under my service agreement.",
+        "The company did not refund my security deposit under the contract.",
+        "I want to recover money from a customer who did not pay my invoice.",
+        "kadan vaangittu thiruppi tharala, case podalama?",
+        "ஒப்பந்தத்தை மீறி என் பணத்தை திருப்பித் தரவில்லை.",
+    ],
+    "Family": [
+        "I want a divorce from my husband.",
+        "My wife left home with our child and I want custody.",
+        "My husband does not pay maintenance for me and the children.",
+        "My husband and in-laws beat me and demand more dowry.",
+        "How do we register our marriage under the Special Marriage Act?",
+        "My father died without a will; how is his property shared among the children?",
+        "We want to adopt a child legally.",
+        "My parents are forcing me to marry against my will.",
+        "My elderly parents want maintenance from their son.",
+        "purushan veetla adikiraan, divorce venum",
+        "என் கணவர் என்னை அடிக்கிறார், விவாகரத்து வேண்டும்.",
+        "குழந்தையின் பராமரிப்பு யாரிடம் இருக்க வேண்டும்?",
+    ],
+    "Consumer": [
+        "The new refrigerator I bought stopped working within a week and the shop refuses to replace it.",
+        "An online store delivered a fake product and will not refund me.",
+        "The hospital overcharged me and gave poor treatment.",
+        "My flight was cancelled and the airline is not giving a refund.",
+        "The builder delayed handing over my flat by three years.",
+        "My insurance company rejected a valid claim.",
+        "The mobile service provider charged me for services I never used.",
+        "A restaurant served spoiled food and refused to take responsibility.",
+        "The bank charged hidden fees on my account without informing me.",
+        "online-la vaangina phone work aagala, refund tharala",
+        "வாங்கிய பொருள் குறைபாடுடையது, கடை மாற்றித் தர மறுக்கிறது.",
+    ],
+    "Land": [
+        "My neighbour has encroached on part of my land and built a wall.",
+        "The government is acquiring my agricultural land without proper compensation.",
+        "My landlord is evicting me without notice.",
+        "My landlord refuses to return my rent deposit after I vacated.",
+        "There is a dispute over the title of the plot I bought.",
+        "Someone forged documents to sell my property.",
+        "The patta for my land is in someone else's name.",
+        "My tenant has not paid rent for six months and refuses to vacate.",
+        "My brothers are refusing to partition our ancestral land.",
+        "en nilathula pakkathu veettukaran suvar kattittaan",
+        "என் நிலத்தை அரசு கையகப்படுத்துகிறது, இழப்பீடு குறைவாக உள்ளது.",
+    ],
+    "Welfare": [
+        "How do I apply for the old age pension scheme?",
+        "My ration card application has been pending for months.",
+        "My employer has not paid my wages and provident fund.",
+        "How do I file an RTI application to get information from a government office?",
+        "I was denied benefits under a government housing scheme.",
+        "How can I get free legal aid?",
+        "My factory is not paying minimum wages or overtime.",
+        "I was injured at work and need employee compensation.",
+        "How do I get a scholarship for my child from the government?",
+        "ration card vaanga eppadi apply pannanum?",
+        "முதியோர் ஓய்வூதியத்திற்கு எப்படி விண்ணப்பிப்பது?",
+    ],
+}
+
 SUPPORTED_LANGUAGES = {
     "en": "English",
     "ta": "Tamil",
 }
 
+# Common Tamil words as typed in Latin script ("Tanglish"); used to spot
+# transliterated Tamil input without a language model.
+TANGLISH_MARKERS = frozenset({
+    "enna", "enakku", "ennoda", "naan", "nan", "neenga", "ninga", "avan", "aval", "avanga",
+    "eppadi", "epdi", "enga", "yen", "yaar", "yaaru", "evlo", "ethana",
+    "venum", "vendum", "illa", "illai", "irukku", "iruku", "irukka", "irukkanga",
+    "pannanum", "panna", "pannunga", "panradhu", "sollunga", "sonna", "solla",
+    "kudukka", "kudunga", "vanthu", "vandhu", "podanum", "poda", "pola", "mudiyuma",
+    "mudiyathu", "theriyum", "theriyala", "kooda", "appo", "ippo", "inga", "anga",
+    "veedu", "veetla", "kaasu", "panam", "kalyanam", "purushan", "pondatti", "amma", "appa",
+    "sattam", "vakeel", "vakil", "pugar", "kaaval", "nilayam", "ungal", "unga", "namma",
+})
+
 # ── Prompt templates ─────────────────────────────────────────
 
 RAG_SYSTEM_PROMPT = """You are Needhi, an expert AI legal assistant specializing in Indian law.
@@ -46,12 +196,7 @@ Please provide a clear, simplified answer based on the legal context above. If r
 CLASSIFIER_PROMPT = """You are a legal issue classifier for Indian law. Classify the following legal issue into exactly ONE category.
 
 CATEGORIES:
-- Criminal: Theft, assault, murder, fraud, cybercrime, FIR-related
-- Civil: Property disputes, contracts, torts, injunctions
-- Family: Divorce, custody, maintenance, domestic violence, marriage
-- Consumer: Product defects, service deficiency, unfair trade practices
-- Land: Land acquisition, title disputes, tenant rights, encroachment
-- Welfare: Government schemes, social security, labor rights, RTI
+""" + "\n".join(f"- {c}: {d}" for c, d in CATEGORY_DESCRIPTIONS.items()) + """
 
 ISSUE DESCRIPTION:
 {description}
@@ -0,0 +1,40 @@
+"""
+NyayaSahaya — Process memory readings for startup and health reports.
+"""
+
+import os
+import sys
+
+
+def process_memory_mb() -> dict:
+    """
+    Resident memory of this process in MB. On Linux, RSS is split into
+    private (anonymous) pages and file-backed pages; file-backed pages from
+    memory-mapped index files are shared by every worker mapping them.
+    Returns {} where no reading is available.
+    """
+    try:
+        with open(f"/proc/{os.getpid()}/status", "r") as f:
+            fields = dict(line.split(":", 1) for line in f if ":" in line)
+    except OSError:
+        fields = {}
+    if "VmRSS" in fields:
+        kb = {k: int(fields[k].split()[0]) for k in ("VmRSS", "RssAnon", "RssFile") if k in fields}
+        return {
+            "rss_mb": round(kb["VmRSS"] / 1024, 1),
+            "private_mb": round(kb.get("RssAnon", 0) / 1024, 1),
+            "file_backed_mb": round(kb.get("RssFile", 0) / 1024, 1),
+        }
+    try:
+        import psutil
+    except ImportError:
+        psutil = None
+    if psutil is not None:
+        return {"rss_mb": round(psutil.Process().memory_info().rss / 2**20, 1)}
+    if sys.platform != "win32":
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in bytes on macOS, kilobytes elsewhere
+        return {"peak_rss_mb": round(peak / (2**20 if sys.platform == "darwin" else 1024), 1)}
+    return {}
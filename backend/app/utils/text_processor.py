@@ -2,20 +2,217 @@
 NyayaSahaya — Text processing utilities for chunking legal documents.
 """
 
+import re
 from pathlib import Path
+from typing import Optional
+
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from app.config import get_settings
 
+# ── Statute structure ────────────────────────────────────────
+# Headings as they appear in sample_docs: summarised acts ("CHAPTER II — ...",
+# "SECTION 498A — ...", "ARTICLE 21 — ...") and bare acts such as IPC_Complete
+# ("CHAPTER XXA" on its own line, "498A. Title.—Whoever ..."). Bare-act
+# headings may carry an amendment footnote marker like "1[".
+_FOOTNOTE = r"(?:\d+\[)?"
+# "HINDU MARRIAGE ACT, 1955 — KEY PROVISIONS" starts the sections of another act
+_ACT_RE = re.compile(r"([A-Z][A-Z0-9 ,'()&-]*?\b(?:ACT|CODE|SANHITA|ADHINIYAM)\b,?\s*\d{4})\b")
+_CHAPTER_RE = re.compile(_FOOTNOTE + r"CHAPTER\s+([IVXLC]+[A-Z]?|\d+[A-Z]?)\b")
+# "SECTION 2(d) — ...", "Section 7: ..." but not prose such as "Section 377 of the IPC ..."
+_SECTION_RE = re.compile(
+    _FOOTNOTE + r"(SECTION|Section|ARTICLE|Article)\s+(\d+[A-Z]{0,2}(?:\(\w{1,4}\))*)\s*(?=$|[—–:-])"
+)
+_BARE_SECTION_RE = re.compile(_FOOTNOTE + r"(\d{1,3}[A-Z]{0,2})\.\s+\S.{0,200}?\.\s*[—–]")
+_SUBPART_RE = re.compile(r"(?:\d+\[)?(Explanation|Illustrations?)\b")
 
-def chunk_text(text: str, source: str = "unknown") -> list[dict]:
-    """Split a large text into overlapping chunks with metadata."""
-    settings = get_settings()
-    splitter = RecursiveCharacterTextSplitter(
-        chunk_size=settings.chunk_size,
-        chunk_overlap=settings.chunk_overlap,
-        separators=["\n\n", "\n", "SECTION", "Section", ". ", " ", ""],
+# The original splitter, kept as-is for CHUNKING_STRATEGY=recursive
+_RECURSIVE_SEPARATORS = ["\n\n", "\n", "SECTION", "Section", ". ", " ", ""]
+
+
+def chunking_signature() -> str:
+    """Identifies how documents are chunked, so a change of settings forces a re-index."""
+    s = get_settings()
+    if s.chunking_strategy == "statute":
+        return f"statute/{s.chunk_size}/{s.chunk_overlap}/{s.statute_chunk_max_size}"
+    return f"recursive/{s.chunk_size}/{s.chunk_overlap}"
+
+
+def _splitter(
+    chunk_size: int, chunk_overlap: int, separators: Optional[list[str]] = None
+) -> RecursiveCharacterTextSplitter:
+    return RecursiveCharacterTextSplitter(
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        separators=separators or ["\n\n", "\n", ". ", " ", ""],
         length_function=len,
     )
+
+
+def _heading(line: str) -> Optional[tuple[str, str]]:
+    """Classify a line as ("act" | "chapter" | "section", value), or None for body text."""
+    if not line:
+        return None
+    match = _SECTION_RE.match(line)
+    if match:
+        kind, number = match.group(1).upper(), match.group(2).upper()
+        return "section", f"Article {number}" if kind == "ARTICLE" else number
+    match = _BARE_SECTION_RE.match(line)
+    if match:
+        return "section", match.group(1)
+    match = _CHAPTER_RE.match(line)
+    if match:
+        return "chapter", match.group(1).upper()
+    match = _ACT_RE.match(line)
+    if match and len(line) < 200:
+        return "act", match.group(1)
+    return None
+
+
+def split_statute(text: str) -> list[dict]:
+    """
+    Split a statute into sections. Returns blocks of
+    {"text", "act", "chapter", "section", "parts"} where `parts` are the
+    section's paragraphs split at Explanation / Illustration headings, in
+    order. Text outside any section (titles, tables of contents, prose) becomes
+    blocks without a section. Returns [] when no section heading is found.
+    """
+    act = ""  # until an act heading, the document title
+    for line in text.splitlines():
+        if line.strip():
+            if _heading(line.strip()) is None:
+                act = re.split(r"\s+[—–-]\s+", line.strip())[0].strip(" =:")
+            break
+    chapter, blocks, current = "", [], None
+
+    def start(section: str):
+        nonlocal current
+        current = {"act": act, "chapter": chapter, "section": section, "parts": [[]]}
+        blocks.append(current)
+
+    start("")
+    lines = text.splitlines()
+    for i, raw in enumerate(lines):
+        line = raw.strip()
+        heading = _heading(line)
+        if heading is None and i + 1 < len(lines) and line[:1].isdigit():
+            # Bare-act section titles can wrap onto the next line before ".—"
+            match = _BARE_SECTION_RE.match(f"{line} {lines[i + 1].strip()}")
+            heading = ("section", match.group(1)) if match else None
+        if heading is not None:
+            kind, value = heading
+            if kind == "act":
+                act, chapter = value, ""
+                start("")
+            elif kind == "chapter":
+                chapter = value
+                start("")
+            else:
+                start(value)
+        elif current["section"] and _SUBPART_RE.match(line):
+            current["parts"].append([])
+        current["parts"][-1].append(raw.rstrip())
+
+    sections = [b for b in blocks if b["section"]]
+    if not sections:
+        return []
+    result = []
+    for block in blocks:
+        parts = ["\n".join(p).strip() for p in block.pop("parts")]
+        block["parts"] = [p for p in parts if p]
+        block["text"] = "\n".join(block["parts"])
+        if block["text"]:
+            result.append(block)
+    return result
+
+
+def _pack(parts: list[str], max_size: int) -> list[str]:
+    """Greedily join consecutive parts into pieces of at most `max_size` characters."""
+    pieces, current = [], ""
+    for part in parts:
+        if current and len(current) + 1 + len(part) > max_size:
+            pieces.append(current)
+            current = part
+        else:
+            current = f"{current}\n{part}" if current else part
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def _chunk_statute(blocks: list[dict], source: str) -> list[dict]:
+    """
+    One chunk per section. Longer sections are sub-split at Explanation /
+    Illustration and then by size; runs of short sections from the same
+    chapter share a chunk up to CHUNK_SIZE (their numbers joined in `section`),
+    and short heading-only text is carried into the section that follows.
+    """
+    settings = get_settings()
+    max_size = settings.statute_chunk_max_size
+    fallback = _splitter(settings.chunk_size, settings.chunk_overlap)
+    oversize = _splitter(max_size, settings.chunk_overlap)
+    chunks: list[dict] = []
+    group: list[dict] = []  # short sections waiting to be emitted together
+    pending = ""  # e.g. "CHAPTER IV" + its title, prepended to the next section
+
+    def emit(text: str, meta: dict):
+        if text.strip():
+            chunks.append({"text": text.strip(), "source": source, "index": len(chunks), **meta})
+
+    def flush():
+        if group:
+            meta = {k: group[0][k] for k in ("act", "chapter") if group[0][k]}
+            meta["section"] = ", ".join(b["section"] for b in group)
+            emit("\n\n".join(b["text"] for b in group), meta)
+            group.clear()
+
+    for block in blocks:
+        meta = {k: block[k] for k in ("act", "chapter", "section") if block[k]}
+        text = f"{pending}\n{block['text']}" if pending else block["text"]
+        if not block["section"]:
+            # Titles, tables of contents and commentary between sections
+            flush()
+            if len(block["text"]) < settings.chunk_size // 2:
+                pending = text
+                continue
+            for piece in fallback.split_text(text):
+                emit(piece, meta)
+        elif len(text) > max_size:
+            flush()
+            pieces = []
+            for piece in _pack(block["parts"], max_size):
+                pieces.extend(oversize.split_text(piece) if len(piece) > max_size else [piece])
+            # Keep the section heading on every piece so each one still says what it belongs to
+            heading = block["parts"][0].splitlines()[0]
+            pieces = [p if p.startswith(heading) else f"{heading} (contd.)\n{p}" for p in pieces]
+            if pending:
+                pieces[0] = f"{pending}\n{pieces[0]}"
+            for piece in pieces:
+                emit(piece, meta)
+        else:
+            same_chapter = group and (group[0]["act"], group[0]["chapter"]) == (block["act"], block["chapter"])
+            size = sum(len(b["text"]) + 2 for b in group) + len(text)
+            if not same_chapter or size > settings.chunk_size:
+                flush()
+            group.append({**block, "text": text})
+        pending = ""
+    flush()
+    emit(pending, {})
+    return chunks
+
+
+def chunk_text(text: str, source: str = "unknown") -> list[dict]:
+    """
+    Split a document into chunks with metadata. With CHUNKING_STRATEGY=statute,
+    documents with Chapter / Section / Article headings get one chunk per
+    section, tagged with `act`, `chapter` and `section`; other documents (and
+    the "recursive" strategy) use overlapping fixed-size chunks.
+    """
+    settings = get_settings()
+    if settings.chunking_strategy == "statute":
+        blocks = split_statute(text)
+        if blocks:
+            return _chunk_statute(blocks, source)
+    splitter = _splitter(settings.chunk_size, settings.chunk_overlap, _RECURSIVE_SEPARATORS)
     chunks = splitter.split_text(text)
     return [
         {"text": chunk.strip(), "source": source, "index": i}
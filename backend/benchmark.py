@@ -0,0 +1,1242 @@
+"""
+NyayaSahaya — Standalone benchmark script.
+Measures the hot-path components locally (no server needed).
+
+Usage:
+  python benchmark.py language [--iterations N]
+  python benchmark.py crosslingual [--model NAME] [--k K] [--translate]
+  python benchmark.py ann [--factories F1;F2] [--k K] [--queries N] [--output report.md]
+  python benchmark.py chunks [--scales 1,4,16]
+  python benchmark.py load [--workers N]
+  python benchmark.py quantize [--factories F1;F2] [--rerank N] [--k K] [--queries N] [--output report.md]
+  python benchmark.py relevance [--k K] [--min-similarity S] [--dropoff D]
+  python benchmark.py hybrid [--k K] [--candidates N]
+  python benchmark.py chunking [--k K]
+  python benchmark.py citations [--k K]
+  python benchmark.py rerank [--k K] [--candidates N] [--budget-ms MS]
+  python benchmark.py batching [--concurrency 1,8,32] [--requests N] [--max-batch N] [--max-wait-ms MS]
+  python benchmark.py batch [--questions N] [--k K]
+  python benchmark.py classifier [--llm] [--min-confidence P]
+  python benchmark.py translation [--requests N] [--llm-ms MS]
+  python benchmark.py tamil [--model NAME] [--k K] [--llm-ms MS] [--budget-ms MS] [--rounds N]
+  python benchmark.py pdf [--iterations N] [--llm]
+"""
+
+import sys
+import time
+import argparse
+import logging
+import statistics
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent.resolve()
+sys.path.insert(0, str(SCRIPT_DIR))
+import os
+os.chdir(SCRIPT_DIR)
+
+import numpy as np
+from dotenv import load_dotenv
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s | %(message)s", datefmt="%H:%M:%S")
+logger = logging.getLogger(__name__)
+
+
+LANGUAGE_SAMPLES = [
+    ("What is Section 498A of IPC?", "en"),
+    ("How do I file an FIR online in Tamil Nadu?", "en"),
+    ("bail", "en"),
+    ("My landlord refuses to return my security deposit, what can I do?", "en"),
+    ("IPC பிரிவு 498A என்றால் என்ன?", "ta"),
+    ("தமிழ்நாட்டில் ஆன்லைனில் FIR எப்படி பதிவு செய்வது?", "ta"),
+    ("வரதட்சணை புகார்", "ta"),
+    ("என் வீட்டு உரிமையாளர் என் பாதுகாப்புத் தொகையை திருப்பி தர மறுத்தால் என் உரிமைகள் என்ன?", "ta"),
+    ("enakku bail venum, eppadi apply pannanum?", "ta"),
+    ("veetla purushan adikiraan, enna pannanum sollunga", "ta"),
+]
+
+# Parallel English/Tamil questions with the sample_docs files that answer them.
+PARALLEL_QUERIES = [
+    ("What are my bail rights after arrest?",
+     "கைது செய்யப்பட்ட பிறகு எனக்கு ஜாமீன் உரிமைகள் என்ன?",
+     {"Criminal_Procedure_Arrest_Bail_Rights.txt", "Bharatiya_Nagarik_Suraksha_Sanhita_2023_BNSS.txt"}),
+    ("My landlord refuses to return my security deposit.",
+     "என் வீட்டு உரிமையாளர் பாதுகாப்புத் தொகையை திருப்பி தர மறுக்கிறார்.",
+     {"Tenancy_Rights.txt"}),
+    ("How do I complain about a defective product?",
+     "குறைபாடுள்ள பொருள் பற்றி எப்படி புகார் செய்வது?",
+     {"Consumer_Protection_Act.txt"}),
+    ("How can a woman get protection from domestic violence?",
+     "குடும்ப வன்முறையிலிருந்து ஒரு பெண் எப்படி பாதுகாப்பு பெறலாம்?",
+     {"Domestic_Violence_Act.txt"}),
+    ("How do I file an RTI application?",
+     "தகவல் அறியும் உரிமை (RTI) விண்ணப்பத்தை எப்படி தாக்கல் செய்வது?",
+     {"RTI_Act_2005_and_IT_Act_2000.txt"}),
+    ("What are the grounds for divorce under Hindu law?",
+     "இந்து சட்டத்தின் கீழ் விவாகரத்துக்கான காரணங்கள் என்ன?",
+     {"Family_Law_Hindu_Marriage_Succession.txt"}),
+    ("Someone cheated me through an online banking fraud.",
+     "ஆன்லைன் வங்கி மோசடி மூலம் ஒருவர் என்னை ஏமாற்றினார்.",
+     {"Cyber_Crime_Laws_Comprehensive.txt", "RTI_Act_2005_and_IT_Act_2000.txt"}),
+    ("Can elderly parents claim maintenance from their children?",
+     "வயதான பெற்றோர் தங்கள் பிள்ளைகளிடம் பராமரிப்புத் தொகை கோர முடியுமா?",
+     {"Senior_Citizens_Rights_and_Elder_Law.txt"}),
+    ("What is the punishment for ragging in college?",
+     "கல்லூரியில் ராகிங் செய்தால் என்ன தண்டனை?",
+     {"Anti_Ragging_Education_Laws.txt"}),
+    ("How to claim compensation for a road accident?",
+     "சாலை விபத்துக்கு இழப்பீடு எப்படி கோருவது?",
+     {"Insurance_Banking_Motor_Accident_Claims.txt", "Motor_Vehicles_Act_and_POCSO.txt"}),
+    ("What happens if a cheque bounces?",
+     "காசோலை திரும்பினால் என்ன நடக்கும்?",
+     {"Indian_Contract_Act_and_NI_Act.txt"}),
+    ("Is dowry demand a crime?",
+     "வரதட்சணை கேட்பது குற்றமா?",
+     {"Child_Marriage_Dowry_Sexual_Harassment_Juvenile_Justice.txt", "IPC_Complete.txt"}),
+]
+
+# Questions naming a section / statute, with a pattern a relevant chunk must contain.
+SECTION_QUERIES = [
+    ("What is Section 498A of IPC?", r"498\s*-?A\b"),
+    ("What does BNSS 173 say about registering an FIR?", r"\b173\b"),
+    ("What is the punishment for possession under NDPS?", r"\bNDPS\b"),
+    ("Explain Section 302 IPC.", r"\b302\b"),
+    ("Cheque bounce case under Section 138 NI Act", r"\b138\b"),
+    ("Is Section 66A of the IT Act still valid?", r"66\s*-?A\b"),
+    ("Maintenance for wife under Section 125 CrPC", r"\b125\b"),
+    ("How to get anticipatory bail under Section 438?", r"\b438\b"),
+    ("What rights does Article 21 guarantee?", r"Article\s+21\b"),
+    ("What is Section 354 IPC?", r"\b354\b"),
+    ("Divorce by mutual consent under Section 13B", r"13\s*-?B\b"),
+]
+
+# Held-out issue descriptions (not in CLASSIFIER_EXAMPLES) with their category.
+# Questions the legal corpus cannot answer, though they share everyday words with it.
+OFF_TOPIC_QUERIES = [
+    "What is the best time of the year to plant tomatoes?",
+    "How do I reset the password of my wifi router?",
+    "Give me a recipe for masala dosa with coconut chutney.",
+    "Who won the cricket world cup in 2011?",
+    "Which phone has the best camera under 20000 rupees?",
+    "How many days does it take to travel from Chennai to Delhi by train?",
+]
+
+CLASSIFIER_EVAL = [
+    ("Two men robbed me at knifepoint near the bus stand.", "Criminal"),
+    ("Someone hacked my email and is asking my contacts for money.", "Criminal"),
+    ("The police detained my son without telling us why.", "Criminal"),
+    ("A fake loan app is harassing me and my family.", "Criminal"),
+    ("My colleague was beaten up by a gang at the station.", "Criminal"),
+    ("The contractor used poor material and the wall collapsed; I want damages.", "Civil"),
+    ("A supplier took payment for goods and never delivered them to my business.", "Civil"),
+    ("I gave a hand loan to my cousin with a promissory note and he won't pay.", "Civil"),
+    ("Someone is spreading lies about me that hurt my business.", "Civil"),
+    ("My husband wants a divorce but I want to save the marriage.", "Family"),
+    ("How much maintenance can I claim for my two children after separation?", "Family"),
+    ("My in-laws threw me out of the matrimonial home.", "Family"),
+    ("Can a daughter claim a share in her father's ancestral property?", "Family"),
+    ("The washing machine under warranty is not being repaired by the service centre.", "Consumer"),
+    ("The e-commerce site cancelled my order but kept my money.", "Consumer"),
+    ("The coaching centre took full fees and stopped classes.", "Consumer"),
+    ("The car dealer sold me a used car as new.", "Consumer"),
+    ("The owner wants to increase rent by fifty percent without any agreement.", "Land"),
+    ("A relative built a house on my plot while I was abroad.", "Land"),
+    ("The registrar refuses to register my sale deed.", "Land"),
+    ("The highway project took my farm land and the compensation is too low.", "Land"),
+    ("I am a construction worker and my contractor has not paid me for two months.", "Welfare"),
+    ("How do I get a disability certificate and pension?", "Welfare"),
+    ("The panchayat office ignored my RTI request for thirty days.", "Welfare"),
+    ("My widow pension stopped suddenly.", "Welfare"),
+    ("en bike-a yaaro thiruditanga", "Criminal"),
+    ("veetu owner advance thiruppi tharala", "Land"),
+    ("என் மனைவி குழந்தையை அழைத்துக் கொண்டு சென்றுவிட்டார்.", "Family"),
+    ("ஆன்லைனில் வாங்கிய கைபேசி வேலை செய்யவில்லை.", "Consumer"),
+    ("என் சம்பளத்தை முதலாளி தரவில்லை.", "Welfare"),
+]
+
+
+def _load_corpus() -> list[dict]:
+    """Chunk every document in sample_docs exactly as the indexer does."""
+    from app.config import get_settings
+    from app.utils.text_processor import chunk_text, read_document
+
+    docs_dir = Path(get_settings().sample_docs_dir)
+    files = sorted(list(docs_dir.glob("*.txt")) + list(docs_dir.glob("*.pdf")))
+    chunks = []
+    for f in files:
+        chunks.extend(chunk_text(read_document(f), source=f.name))
+    logger.info(f"Corpus: {len(files)} documents, {len(chunks)} chunks")
+    return chunks
+
+
+def _embed_corpus(model_name: str | None = None):
+    """Load the embedding model and embed the whole sample corpus."""
+    from sentence_transformers import SentenceTransformer
+    from app.config import get_settings
+
+    model_name = model_name or get_settings().local_embedding_model
+    logger.info(f"Loading embedding model: {model_name}")
+    model = SentenceTransformer(model_name)
+    chunks = _load_corpus()
+    start = time.time()
+    vectors = model.encode([c["text"] for c in chunks], batch_size=64, convert_to_numpy=True).astype("float32")
+    logger.info(f"Embedded corpus in {time.time() - start:.1f}s")
+    return model, model_name, chunks, vectors
+
+
+def _source_recall(sources_per_query: list[list[str]], expected: list[set]) -> float:
+    """Fraction of queries with at least one retrieved chunk from an expected source."""
+    hits = sum(1 for got, want in zip(sources_per_query, expected) if want & set(got))
+    return hits / len(expected)
+
+
+def _time_per_call(fn, texts: list[str], iterations: int) -> list[float]:
+    """Return per-call latencies in microseconds."""
+    timings = []
+    for _ in range(iterations):
+        for t in texts:
+            start = time.perf_counter()
+            fn(t)
+            timings.append((time.perf_counter() - start) * 1e6)
+    return timings
+
+
+def _report(name: str, timings: list[float]):
+    timings = sorted(timings)
+    p99 = timings[int(len(timings) * 0.99) - 1]
+    logger.info(
+        f"  {name:<12} mean {statistics.mean(timings):9.1f} µs | "
+        f"p50 {statistics.median(timings):9.1f} µs | p99 {p99:9.1f} µs"
+    )
+
+
+def bench_language(args):
+    """Per-call latency and accuracy: Unicode-block detector vs langdetect."""
+    from app.services.language_service import detect_language
+
+    texts = [t for t, _ in LANGUAGE_SAMPLES]
+    detectors = {"unicode": detect_language}
+    try:
+        from langdetect import DetectorFactory, LangDetectException, detect
+        DetectorFactory.seed = 0
+
+        def langdetect_detector(text: str) -> str:
+            try:
+                return "ta" if detect(text) == "ta" else "en"
+            except LangDetectException:
+                return "en"
+
+        detectors["langdetect"] = langdetect_detector
+    except ImportError:
+        logger.info("langdetect not installed; benchmarking the local detector only")
+
+    logger.info(f"Language detection: {len(texts)} samples x {args.iterations} iterations")
+    for name, fn in detectors.items():
+        fn(texts[0])  # warm-up (langdetect loads its profiles lazily)
+        correct = sum(fn(t) == expected for t, expected in LANGUAGE_SAMPLES)
+        _report(name, _time_per_call(fn, texts, args.iterations))
+        logger.info(f"  {'':<12} accuracy {correct}/{len(LANGUAGE_SAMPLES)}")
+
+
+def bench_crosslingual(args):
+    """Recall@k on parallel queries: translate-then-embed vs embedding Tamil directly."""
+    import asyncio
+    import faiss
+
+    model, model_name, chunks, vectors = _embed_corpus(args.model)
+    index = faiss.IndexFlatL2(vectors.shape[1])
+    index.add(vectors)
+
+    english = [q[0] for q in PARALLEL_QUERIES]
+    tamil = [q[1] for q in PARALLEL_QUERIES]
+    expected = [q[2] for q in PARALLEL_QUERIES]
+
+    if args.translate:
+        from app.services.language_service import LanguageService
+        language = LanguageService()
+
+        async def translate_all():
+            return await asyncio.gather(*(language.translate(t, "ta", "en") for t in tamil))
+
+        start = time.time()
+        translated = asyncio.run(translate_all())
+        logger.info(f"LLM translation of {len(tamil)} queries took {time.time() - start:.1f}s")
+        translate_label = "ta → en (LLM) → embed"
+    else:
+        # Reference English text stands in for a perfect translation
+        translated = english
+        translate_label = "reference English → embed"
+
+    def recall(queries: list[str]) -> tuple[float, float]:
+        start = time.perf_counter()
+        q = model.encode(queries, convert_to_numpy=True).astype("float32")
+        _, ids = index.search(q, args.k)
+        elapsed = (time.perf_counter() - start) * 1000 / len(queries)
+        sources = [[chunks[i]["source"] for i in row if i >= 0] for row in ids]
+        return _source_recall(sources, expected), elapsed
+
+    logger.info(f"Recall@{args.k} over {len(PARALLEL_QUERIES)} parallel queries ({model_name}):")
+    for label, queries in ((translate_label, translated), ("ta → embed (cross-lingual)", tamil)):
+        r, ms = recall(queries)
+        logger.info(f"  {label:<30} recall {r:.2f} | {ms:.1f} ms/query (excluding LLM)")
+
+
+def bench_ann(args):
+    """Recall@k (against exact Flat search) and latency for approximate FAISS indexes."""
+    import faiss
+    from app.services.vector_store import build_faiss_index, search_parameters
+
+    model, model_name, chunks, vectors = _embed_corpus(args.model)
+    n, dim = vectors.shape
+    nlist = max(1, int(4 * n ** 0.5))
+    factories = args.factories.split(";") if args.factories else [
+        "HNSW32", f"IVF{nlist},Flat", f"IVF{nlist},PQ{dim // 8}",
+    ]
+
+    # Queries: real questions plus a random sample of chunk embeddings
+    rng = np.random.default_rng(0)
+    sample = vectors[rng.choice(n, size=min(args.queries, n), replace=False)]
+    questions = model.encode([q[0] for q in PARALLEL_QUERIES], convert_to_numpy=True).astype("float32")
+    queries = np.vstack([questions, sample])
+
+    def run(index, params=None) -> tuple[np.ndarray, float]:
+        start = time.perf_counter()
+        for q in queries:
+            _, ids = index.search(q.reshape(1, -1), args.k, params=params)
+        per_query = (time.perf_counter() - start) * 1000 / len(queries)
+        _, ids = index.search(queries, args.k, params=params)
+        return ids, per_query
+
+    flat = faiss.IndexFlatL2(dim)
+    flat.add(vectors)
+    truth, flat_ms = run(flat)
+
+    rows = [("Flat", "-", 1.0, flat_ms, 0.0)]
+    for factory in factories:
+        start = time.time()
+        index = build_faiss_index(dim, factory, vectors, metric="l2")
+        index.add(vectors)
+        build_s = time.time() - start
+        inner = faiss.downcast_index(index)
+        if hasattr(inner, "hnsw"):
+            sweep = [("efSearch", v, search_parameters(index, ef_search=v)) for v in (16, 32, 64, 128)]
+        elif isinstance(inner, faiss.IndexIVF):
+            sweep = [("nprobe", v, search_parameters(index, nprobe=v)) for v in (1, 4, 16, 64) if v <= inner.nlist]
+        else:
+            sweep = [("-", "-", None)]
+        for name, value, params in sweep:
+            ids, ms = run(index, params)
+            recall = np.mean([len(set(a) & set(b)) / args.k for a, b in zip(ids, truth)])
+            rows.append((factory, f"{name}={value}" if name != "-" else "-", recall, ms, build_s))
+
+    lines = [
+        f"# ANN recall@{args.k} vs Flat — {n} vectors, dim {dim}, {len(queries)} queries ({model_name})",
+        "",
+        "| index | search param | recall@k | ms/query | build s |",
+        "|---|---|---|---|---|",
+    ]
+    lines += [f"| {f} | {p} | {r:.3f} | {ms:.3f} | {b:.1f} |" for f, p, r, ms, b in rows]
+    report = "\n".join(lines)
+    print(report)
+    if args.output:
+        Path(args.output).write_text(report + "\n", encoding="utf-8")
+        logger.info(f"Report written to {args.output}")
+
+
+def bench_chunks(args):
+    """Load time, heap allocated at load and lookup latency: pickled dicts vs columnar chunk store."""
+    import pickle
+    import tempfile
+    import tracemalloc
+    from app.services.chunk_store import ChunkStore
+    from app.services.vector_store import text_hash
+
+    base = _load_corpus()
+    for c in base:
+        c["text_hash"] = text_hash(c["text"])
+    rng = np.random.default_rng(0)
+    logger.info("  scale | chunks | pickle load ms | pickle heap MB | columnar load ms | columnar heap MB | lookup µs")
+    for scale in (int(x) for x in args.scales.split(",")):
+        records = {}
+        for i in range(scale * len(base)):
+            chunk = dict(base[i % len(base)])
+            chunk["text"] = f"{chunk['text']} [{i}]"  # distinct strings, as in a real corpus
+            chunk["text_hash"] = f"{i:016x}"
+            records[i] = chunk
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp = Path(tmp)
+            with open(tmp / "metadata.pkl", "wb") as f:
+                pickle.dump(records, f)
+            ChunkStore.from_records(records).save(tmp / "chunks")
+
+            def measure(load):
+                tracemalloc.start()
+                start = time.perf_counter()
+                loaded = load()
+                ms = (time.perf_counter() - start) * 1000
+                heap = tracemalloc.get_traced_memory()[0] / 1e6
+                tracemalloc.stop()
+                return loaded, ms, heap
+
+            _, pickle_ms, pickle_mb = measure(lambda: pickle.load(open(tmp / "metadata.pkl", "rb")))
+            store, col_ms, col_mb = measure(lambda: ChunkStore.load(tmp / "chunks"))
+            ids = rng.integers(0, len(records), size=1000).tolist()
+            start = time.perf_counter()
+            for i in ids:
+                store.get(i)
+            lookup_us = (time.perf_counter() - start) * 1e6 / len(ids)
+            del store
+        logger.info(
+            f"  {scale:>5} | {len(records):>6} | {pickle_ms:>14.1f} | {pickle_mb:>14.1f} | "
+            f"{col_ms:>16.1f} | {col_mb:>16.2f} | {lookup_us:>9.1f}"
+        )
+
+
+def bench_quantize(args):
+    """Memory, latency and recall@k vs flat float32 for quantized indexes, with and without exact re-rank."""
+    import faiss
+    from app.services.vector_store import VectorStore
+
+    model, model_name, chunks, vectors = _embed_corpus(args.model)
+    n, dim = vectors.shape
+    factories = args.factories.split(";") if args.factories else ["Flat", "SQfp16", "SQ8", f"PQ{dim // 8}", f"PQ{dim // 16}"]
+    for i, c in enumerate(chunks):
+        c["text_hash"] = f"{i:016x}"  # one row per chunk, so results map back to corpus positions
+
+    rng = np.random.default_rng(0)
+    sample = vectors[rng.choice(n, size=min(args.queries, n), replace=False)]
+    questions = model.encode([q[0] for q in PARALLEL_QUERIES], convert_to_numpy=True).astype("float32")
+    queries = np.vstack([questions, sample])
+
+    def run(store, rerank) -> tuple[list[set], float]:
+        start = time.perf_counter()
+        found = [{int(r["text_hash"], 16) for r in store.search(q, args.k, rerank=rerank)} for q in queries]
+        return found, (time.perf_counter() - start) * 1000 / len(queries)
+
+    flat = faiss.IndexFlatL2(dim)
+    flat.add(vectors)
+    _, truth = flat.search(queries, args.k)
+    truth = [set(t.tolist()) for t in truth]
+    full_mb = vectors.nbytes / 2**20
+
+    rows = []
+    for factory in factories:
+        store = VectorStore(dim, factory, embed=None, keep_vectors=True, metric="l2")
+        store.reset(vectors)
+        store.add_vectors(chunks, vectors)
+        index_mb = len(faiss.serialize_index(store.index)) / 2**20
+        for rerank in (0, args.rerank) if factory != "Flat" else (0,):
+            found, ms = run(store, rerank)
+            recall = np.mean([len(f & t) / args.k for f, t in zip(found, truth)])
+            rows.append((factory, rerank, index_mb, full_mb if rerank else 0.0, ms, recall))
+
+    lines = [
+        f"# Quantized storage — {n} vectors, dim {dim}, {len(queries)} queries, recall@{args.k} vs Flat float32 ({model_name})",
+        "",
+        "| index | re-rank | index MB (RAM) | float32 MB (disk, mmap) | ms/query | recall@k |",
+        "|---|---|---|---|---|---|",
+    ]
+    lines += [f"| {f} | {r or '-'} | {im:.2f} | {fm:.2f} | {ms:.3f} | {rc:.3f} |" for f, r, im, fm, ms, rc in rows]
+    report = "\n".join(lines)
+    print(report)
+    if args.output:
+        Path(args.output).write_text(report + "\n", encoding="utf-8")
+        logger.info(f"Report written to {args.output}")
+
+
+def bench_relevance(args):
+    """Chunks and context sent to the LLM per question: fixed top-k vs the cosine relevance cutoff."""
+    from app.services.vector_store import VectorStore, text_hash
+
+    model, model_name, chunks, vectors = _embed_corpus(args.model)
+    for c in chunks:
+        c["text_hash"] = text_hash(c["text"])
+    store = VectorStore(vectors.shape[1], "Flat", embed=None, metric="cosine")
+    store.reset()
+    store.add_vectors(chunks, vectors)
+
+    questions = model.encode([q[0] for q in PARALLEL_QUERIES], convert_to_numpy=True).astype("float32")
+    expected = [q[2] for q in PARALLEL_QUERIES]
+    modes = {
+        f"fixed top-{args.k}": {},
+        f"cutoff ≥{args.min_similarity}, drop-off {args.dropoff}": {
+            "min_score": args.min_similarity, "dropoff": args.dropoff,
+        },
+    }
+
+    logger.info(f"Context per question over {len(PARALLEL_QUERIES)} questions ({model_name}):")
+    for label, cutoff in modes.items():
+        results = [store.search(q, args.k, **cutoff) for q in questions]
+        counts = [len(r) for r in results]
+        chars = [sum(len(c["text"]) for c in r) for r in results]
+        recall = _source_recall([[c["source"] for c in r] for r in results], expected)
+        logger.info(
+            f"  {label:<32} chunks {statistics.mean(counts):.1f} (min {min(counts)}, max {max(counts)}) | "
+            f"context {statistics.mean(chars):7.0f} chars | source recall {recall:.2f}"
+        )
+
+
+def bench_hybrid(args):
+    """Recall@k on section-number and natural-language questions: dense only vs BM25 + dense (RRF)."""
+    import re
+    from app.config import get_settings
+    from app.services.vector_store import VectorStore, text_hash
+
+    settings = get_settings()
+    model, model_name, chunks, vectors = _embed_corpus(args.model)
+    for c in chunks:
+        c["text_hash"] = text_hash(c["text"])
+    store = VectorStore(vectors.shape[1], "Flat", embed=None, metric="cosine")
+    store.reset()
+    store.add_vectors(chunks, vectors)
+    cutoff = {"min_score": settings.retrieval_min_similarity, "dropoff": settings.retrieval_similarity_dropoff}
+
+    def dense(q_vec, text):
+        return store.search(q_vec, args.k, **cutoff)
+
+    def hybrid(q_vec, text):
+        # As EmbeddingService does it: the cutoff applies after fusion
+        lexical = store.search_lexical(text, args.candidates, settings.hybrid_bm25_min_ratio)
+        return store.fuse(
+            store.search(q_vec, args.candidates), lexical, args.k, settings.hybrid_rrf_k, query_vec=q_vec, **cutoff
+        )
+
+    section_texts = [q for q, _ in SECTION_QUERIES]
+    patterns = [re.compile(p, re.IGNORECASE) for _, p in SECTION_QUERIES]
+    natural_texts = [q[0] for q in PARALLEL_QUERIES]
+    section_vecs = model.encode(section_texts, convert_to_numpy=True).astype("float32")
+    natural_vecs = model.encode(natural_texts, convert_to_numpy=True).astype("float32")
+    off_topic_vecs = model.encode(OFF_TOPIC_QUERIES, convert_to_numpy=True).astype("float32")
+
+    store.search_lexical("warm up", 1)  # builds the inverted view once, as the first query would
+    start = time.perf_counter()
+    for text in section_texts + natural_texts:
+        store.search_lexical(text, args.candidates, settings.hybrid_bm25_min_ratio)
+    bm25_ms = (time.perf_counter() - start) * 1000 / (len(section_texts) + len(natural_texts))
+
+    logger.info(f"Hybrid retrieval over {len(chunks)} chunks, recall@{args.k} ({model_name}):")
+    for label, fn in (("dense", dense), ("BM25 + dense (RRF)", hybrid)):
+        found = [fn(v, t) for v, t in zip(section_vecs, section_texts)]
+        section_recall = np.mean([any(p.search(c["text"]) for c in r) for p, r in zip(patterns, found)])
+        natural = [[c["source"] for c in fn(v, t)] for v, t in zip(natural_vecs, natural_texts)]
+        natural_recall = _source_recall(natural, [q[2] for q in PARALLEL_QUERIES])
+        off_topic = [fn(v, t) for v, t in zip(off_topic_vecs, OFF_TOPIC_QUERIES)]
+        chunks_used = np.mean([len(r) for r in found] + [len(r) for r in natural])
+        logger.info(
+            f"  {label:<20} section queries {section_recall:.2f} | natural-language queries {natural_recall:.2f} | "
+            f"chunks/question {chunks_used:.1f} | off-topic answered from chunks "
+            f"{sum(1 for r in off_topic if r)}/{len(OFF_TOPIC_QUERIES)}"
+        )
+    logger.info(f"  BM25 search: {bm25_ms:.2f} ms/query")
+
+
+def bench_chunking(args):
+    """Chunk count, embedding time, index size and section-query precision: recursive vs statute-aware chunking."""
+    import re
+    from sentence_transformers import SentenceTransformer
+    from app.config import get_settings
+    from app.services.vector_store import VectorStore, text_hash
+    from app.utils.text_processor import chunk_text, read_document
+
+    settings = get_settings()
+    model_name = args.model or settings.local_embedding_model
+    model = SentenceTransformer(model_name)
+    docs_dir = Path(settings.sample_docs_dir)
+    texts = {f.name: read_document(f) for f in sorted(docs_dir.glob("*.txt")) + sorted(docs_dir.glob("*.pdf"))}
+    questions = model.encode([q for q, _ in SECTION_QUERIES], convert_to_numpy=True).astype("float32")
+    patterns = [re.compile(p, re.IGNORECASE) for _, p in SECTION_QUERIES]
+
+    logger.info(f"Chunking {len(texts)} documents ({model_name}), precision@{args.k} on section queries:")
+    for strategy in ("recursive", "statute"):
+        settings.chunking_strategy = strategy
+        chunks = [c for name, text in texts.items() for c in chunk_text(text, source=name)]
+        for c in chunks:
+            c["text_hash"] = text_hash(c["text"])
+        start = time.perf_counter()
+        vectors = model.encode([c["text"] for c in chunks], batch_size=64, convert_to_numpy=True).astype("float32")
+        embed_s = time.perf_counter() - start
+
+        store = VectorStore(vectors.shape[1], "Flat", embed=None, metric="cosine")
+        store.reset()
+        store.add_vectors(chunks, vectors)
+        size_mb = (store.index.ntotal * store.dimension * 4 + store.chunks.nbytes()) / 2**20
+        found = [store.search(q, args.k) for q in questions]
+        precision = np.mean([sum(bool(p.search(c["text"])) for c in r) / args.k for p, r in zip(patterns, found)])
+        tagged = sum(1 for c in chunks if c.get("section"))
+        avg_chars = np.mean([len(c["text"]) for c in chunks])
+        logger.info(
+            f"  {strategy:<9} chunks {len(chunks):5} ({tagged} with section) | avg {avg_chars:5.0f} chars | "
+            f"embed {embed_s:5.1f}s | store {size_mb:5.2f} MB | precision@{args.k} {precision:.2f}"
+        )
+
+
+def bench_citations(args):
+    """Section-number questions: citation index lookup vs embedding + hybrid search (latency, precision)."""
+    import re
+    from app.config import get_settings
+    from app.services.citation_index import parse_citations
+    from app.services.vector_store import VectorStore, text_hash
+
+    settings = get_settings()
+    model, model_name, chunks, vectors = _embed_corpus(args.model)
+    for c in chunks:
+        c["text_hash"] = text_hash(c["text"])
+    store = VectorStore(vectors.shape[1], "Flat", embed=None, metric="cosine")
+    store.reset()
+    store.add_vectors(chunks, vectors)
+    start = time.perf_counter()
+    sections = len(store.citations)
+    logger.info(f"Citation index: {sections} sections, built in {(time.perf_counter() - start) * 1000:.1f} ms")
+    questions = [q for q, _ in SECTION_QUERIES]
+    patterns = [re.compile(p, re.IGNORECASE) for _, p in SECTION_QUERIES]
+    cutoff = {"min_score": settings.retrieval_min_similarity, "dropoff": settings.retrieval_similarity_dropoff}
+
+    def lookup(question):
+        citations = parse_citations(question)
+        return store.lookup_citations(citations) if citations else []
+
+    def search(question):
+        q_vec = model.encode([question], convert_to_numpy=True)[0].astype("float32")
+        lexical = store.search_lexical(question, settings.hybrid_candidates, settings.hybrid_bm25_min_ratio)
+        dense = store.search(q_vec, settings.hybrid_candidates)
+        return store.fuse(dense, lexical, args.k, settings.hybrid_rrf_k, query_vec=q_vec, **cutoff)
+
+    search("warm up")
+    logger.info(f"{len(questions)} section questions over {len(chunks)} chunks ({model_name}):")
+    for label, fn in (("citation lookup", lookup), ("embed + hybrid search", search)):
+        timings = _time_per_call(fn, questions, 5)
+        found = [fn(q) for q in questions]
+        answered = [(p, r) for p, r in zip(patterns, found) if r]
+        precision = np.mean([np.mean([bool(p.search(c["text"])) for c in r]) for p, r in answered]) if answered else 0.0
+        logger.info(
+            f"  {label:<22} answered {len(answered):2}/{len(questions)} | "
+            f"precision {precision:.2f} | chunks {np.mean([len(r) for r in found]):.1f}"
+        )
+        _report(label.split()[0], timings)
+
+
+def bench_rerank(args):
+    """Prompt-chunk quality and per-stage latency: dense top-k vs cross-encoder re-ranking of wider candidates."""
+    import asyncio
+    import re
+    from app.config import get_settings
+    from app.services.reranker import RerankerService
+    from app.services.vector_store import VectorStore, text_hash
+
+    settings = get_settings()
+    settings.rerank_enabled = True
+    settings.rerank_budget_ms = args.budget_ms
+    if args.rerank_model:
+        settings.rerank_model = args.rerank_model
+    model, model_name, chunks, vectors = _embed_corpus(args.model)
+    for c in chunks:
+        c["text_hash"] = text_hash(c["text"])
+    store = VectorStore(vectors.shape[1], "Flat", embed=None, metric="cosine")
+    store.reset()
+    store.add_vectors(chunks, vectors)
+    reranker = RerankerService()
+
+    questions = [q for q, _ in SECTION_QUERIES] + [q[0] for q in PARALLEL_QUERIES]
+    patterns = [re.compile(p, re.IGNORECASE) for _, p in SECTION_QUERIES]
+    expected = [q[2] for q in PARALLEL_QUERIES]
+    n_section = len(SECTION_QUERIES)
+
+    def quality(found: list[list[dict]]) -> tuple[float, float]:
+        precision = np.mean([
+            sum(bool(p.search(c["text"])) for c in r) / args.k for p, r in zip(patterns, found[:n_section])
+        ])
+        recall = _source_recall([[c["source"] for c in r] for r in found[n_section:]], expected)
+        return precision, recall
+
+    async def run(rerank: bool) -> tuple[list[list[dict]], list[float], list[float], int]:
+        found, search_ms, rerank_ms, fallbacks = [], [], [], 0
+        await reranker.rerank("warm up", [{"text": "a"}, {"text": "b"}])
+        for question in questions:
+            start = time.perf_counter()
+            q_vec = model.encode([question], convert_to_numpy=True)[0].astype("float32")
+            results = store.search(
+                q_vec, args.candidates if rerank else args.k,
+                min_score=settings.retrieval_min_similarity,
+                dropoff=2.0 if rerank else settings.retrieval_similarity_dropoff,
+            )
+            search_ms.append((time.perf_counter() - start) * 1000)
+            if rerank and results:
+                start = time.perf_counter()
+                results, completed = await reranker.rerank(question, results, args.k)
+                rerank_ms.append((time.perf_counter() - start) * 1000)
+                fallbacks += not completed
+            found.append(results[:args.k])
+        return found, search_ms, rerank_ms, fallbacks
+
+    logger.info(
+        f"{len(questions)} questions over {len(chunks)} chunks ({model_name} + {settings.rerank_model}), "
+        f"budget {args.budget_ms} ms:"
+    )
+    for label, rerank in ((f"dense top-{args.k}", False), (f"top-{args.candidates} re-ranked", True)):
+        found, search_ms, rerank_ms, fallbacks = asyncio.run(run(rerank))
+        precision, recall = quality(found)
+        stages = f"embed+search {statistics.mean(search_ms):6.1f} ms"
+        if rerank_ms:
+            p95 = sorted(rerank_ms)[int(len(rerank_ms) * 0.95) - 1]
+            stages += f" | rerank mean {statistics.mean(rerank_ms):6.1f} ms, p95 {p95:6.1f} ms, {fallbacks} over budget"
+        logger.info(
+            f"  {label:<20} section precision@{args.k} {precision:.2f} | source recall {recall:.2f} | {stages}"
+        )
+
+
+def bench_batching(args):
+    """Query-embedding throughput / latency under concurrent load: one encode per request vs micro-batching."""
+    import asyncio
+    from sentence_transformers import SentenceTransformer
+    from app.config import get_settings
+    from app.services.query_batcher import QueryBatcher
+
+    model_name = args.model or get_settings().local_embedding_model
+    model = SentenceTransformer(model_name)
+    questions = [q for q, _ in LANGUAGE_SAMPLES] + [q[0] for q in PARALLEL_QUERIES] + [q for q, _ in SECTION_QUERIES]
+    texts = [f"{questions[i % len(questions)]} ({i})" for i in range(args.requests)]  # distinct texts
+
+    def encode(batch: list[str]) -> np.ndarray:
+        return model.encode(batch, batch_size=len(batch), show_progress_bar=False, convert_to_numpy=True)
+
+    batcher = QueryBatcher(encode, args.max_batch, args.max_wait_ms / 1000)
+    encode(["warm up"])
+
+    async def single(text: str):
+        # One encode per request on a worker thread: concurrent requests serialize on the CPU
+        return await asyncio.to_thread(encode, [text])
+
+    async def run(embed, concurrency: int) -> tuple[float, list[float]]:
+        semaphore = asyncio.Semaphore(concurrency)
+        latencies = []
+
+        async def one(text: str):
+            async with semaphore:
+                start = time.perf_counter()
+                await embed(text)
+                latencies.append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(one(t) for t in texts))
+        return len(texts) / (time.perf_counter() - start), sorted(latencies)
+
+    logger.info(
+        f"{args.requests} query embeddings ({model_name}), max batch {args.max_batch}, "
+        f"max wait {args.max_wait_ms} ms:"
+    )
+    for concurrency in [int(c) for c in args.concurrency.split(",")]:
+        for label, embed in (("per request", single), ("micro-batched", batcher.embed)):
+            batches_before = batcher.batches
+            qps, latencies = asyncio.run(run(embed, concurrency))
+            batches = batcher.batches - batches_before
+            avg_batch = f" | avg batch {args.requests / batches:5.1f}" if batches else ""
+            logger.info(
+                f"  concurrency {concurrency:>3} {label:<14} {qps:7.1f} queries/s | "
+                f"p50 {statistics.median(latencies):7.1f} ms | p95 {latencies[int(len(latencies) * 0.95) - 1]:7.1f} ms"
+                f"{avg_batch}"
+            )
+
+
+def bench_batch(args):
+    """Retrieval for a bulk upload: one embed + search per question vs one embed_texts + multi-row search."""
+    from app.config import get_settings
+    from app.services.vector_store import VectorStore, text_hash
+
+    settings = get_settings()
+    model, model_name, chunks, vectors = _embed_corpus(args.model)
+    for c in chunks:
+        c["text_hash"] = text_hash(c["text"])
+    store = VectorStore(vectors.shape[1], "Flat", embed=None, metric="cosine")
+    store.reset()
+    store.add_vectors(chunks, vectors)
+    cutoff = {"min_score": settings.retrieval_min_similarity, "dropoff": settings.retrieval_similarity_dropoff}
+    base = [q for q, _ in LANGUAGE_SAMPLES if q.isascii()] + [q[0] for q in PARALLEL_QUERIES] + [
+        q for q, _ in SECTION_QUERIES
+    ]
+    # Bulk uploads repeat common questions; every third one here is a repeat
+    questions = [base[i % len(base)] if i % 3 == 0 else f"{base[i % len(base)]} (case {i})" for i in range(args.questions)]
+    distinct = list(dict.fromkeys(" ".join(q.split()).casefold() for q in questions))
+
+    def encode(texts):
+        return model.encode(texts, batch_size=64, show_progress_bar=False, convert_to_numpy=True).astype("float32")
+
+    encode(["warm up"])
+    start = time.perf_counter()
+    for q in questions:
+        store.search(encode([q])[0], args.k, **cutoff)
+    sequential = time.perf_counter() - start
+
+    start = time.perf_counter()
+    store.search_batch(encode(distinct), args.k, **cutoff)
+    batched = time.perf_counter() - start
+
+    logger.info(f"Retrieval for {len(questions)} questions ({len(distinct)} distinct) over {len(chunks)} chunks ({model_name}):")
+    logger.info(f"  one at a time            {sequential:6.2f}s | {len(questions) / sequential:7.1f} questions/s")
+    logger.info(
+        f"  coalesced + batched      {batched:6.2f}s | {len(questions) / batched:7.1f} questions/s "
+        f"({sequential / batched:.1f}x)"
+    )
+
+
+def bench_classifier(args):
+    """Issue classification accuracy / latency: local nearest-centroid vs LLM, and local with LLM fallback."""
+    import asyncio
+    from app.config import get_settings
+    from app.services.classifier_service import ClassifierService
+    from app.services.local_classifier import LocalClassifier
+
+    settings = get_settings()
+    settings.classifier_mode = "local"
+    local = LocalClassifier()
+    texts = [t for t, _ in CLASSIFIER_EVAL]
+    labels = [c for _, c in CLASSIFIER_EVAL]
+
+    async def run_local():
+        out = []
+        for text in texts:
+            start = time.perf_counter()
+            category, probability = await local.classify(text)
+            out.append((category, probability, (time.perf_counter() - start) * 1000))
+        return out
+
+    predictions = asyncio.run(run_local())
+    confident = [p >= args.min_confidence for _, p, _ in predictions]
+    accuracy = np.mean([c == label for (c, _, _), label in zip(predictions, labels)])
+    confident_accuracy = np.mean([
+        c == label for (c, _, _), label, ok in zip(predictions, labels, confident) if ok
+    ]) if any(confident) else 0.0
+    logger.info(f"Classifier on {len(texts)} held-out descriptions ({local.embeddings.model_name}):")
+    logger.info(
+        f"  local           accuracy {accuracy:.2f} | "
+        f"{statistics.mean(ms for _, _, ms in predictions):6.1f} ms/description"
+    )
+    logger.info(
+        f"  local, p>={args.min_confidence:.2f}  answers {sum(confident)}/{len(texts)} locally, "
+        f"accuracy on those {confident_accuracy:.2f}"
+    )
+    for (category, probability, _), label, text in zip(predictions, labels, texts):
+        if category != label:
+            logger.info(f"    miss: {text[:60]!r} -> {category} (p={probability:.2f}), expected {label}")
+
+    # CLASSIFIER_TEMPERATURE x CLASSIFIER_MIN_CONFIDENCE: how many descriptions stay
+    # local and how accurate those are; the rest would fall back to the LLM
+    vectors = local.embeddings.embed_texts(texts)
+    correct = np.array([c == label for (c, _, _), label in zip(predictions, labels)])
+    thresholds = [0.3, 0.4, 0.5, 0.6, 0.7]
+    logger.info("  sweep: local accuracy on confident / LLM fallback rate")
+    logger.info("    temperature " + " | ".join(f"p>={t:.1f}".ljust(11) for t in thresholds))
+    for temperature in (0.02, 0.05, 0.1):
+        local.temperature = temperature
+        best = np.array([local.probabilities(v).max() for v in vectors])
+        cells = []
+        for threshold in thresholds:
+            ok = best >= threshold
+            cells.append(f"{correct[ok].mean() if ok.any() else 0.0:.2f} / {1 - ok.mean():4.0%}")
+        logger.info(f"    {temperature:<11.2f} " + " | ".join(cells))
+    local.temperature = settings.classifier_temperature
+
+    if not args.llm:
+        logger.info("  (pass --llm to compare with the LLM baseline; needs GEMINI_API_KEY)")
+        return
+    classifier = ClassifierService()
+
+    async def run_llm():
+        out = []
+        for text in texts:
+            start = time.perf_counter()
+            result = await classifier._classify_llm(text)
+            out.append((result["category"], (time.perf_counter() - start) * 1000))
+        return out
+
+    llm = asyncio.run(run_llm())
+    llm_accuracy = np.mean([c == label for (c, _), label in zip(llm, labels)])
+    hybrid = [p[0] if ok else l[0] for p, l, ok in zip(predictions, llm, confident)]
+    hybrid_accuracy = np.mean([c == label for c, label in zip(hybrid, labels)])
+    logger.info(f"  LLM             accuracy {llm_accuracy:.2f} | {statistics.mean(ms for _, ms in llm):6.1f} ms/description")
+    logger.info(
+        f"  local + LLM fallback accuracy {hybrid_accuracy:.2f} | "
+        f"LLM calls {len(texts) - sum(confident)}/{len(texts)}"
+    )
+
+
+def bench_translation(args):
+    """LLM round trips / time for a stream of Tamil requests: no translation memory vs memory, cold and after restart."""
+    import asyncio
+    import random
+    import tempfile
+    from app.config import get_settings
+    from app.services.language_service import LanguageService
+    from app.services.translation_memory import TranslationMemory
+    from app.utils.constants import CATEGORY_DESCRIPTIONS, LOCAL_CLASSIFIER_EXPLANATION, NO_RELEVANT_PROVISIONS_MESSAGE
+
+    class CountingLLM:
+        """Stands in for Gemini: fixed latency, counts calls."""
+        calls = 0
+
+        async def generate(self, system_prompt: str, user_prompt: str, **kwargs) -> str:
+            CountingLLM.calls += 1
+            await asyncio.sleep(args.llm_ms / 1000)
+            return f"translation of {hash(user_prompt)}"
+
+    # Each Tamil request translates its question to English and, some of the time,
+    # a fixed English message (classifier explanation, no-match notice) back to Tamil.
+    # Popular questions repeat, as on the live service.
+    rng = random.Random(0)
+    questions = [ta for _, ta, _ in PARALLEL_QUERIES] + [t for t, lang in LANGUAGE_SAMPLES if lang == "ta"]
+    weights = [1 / (rank + 1) for rank in range(len(questions))]
+    fixed = [NO_RELEVANT_PROVISIONS_MESSAGE] + [
+        LOCAL_CLASSIFIER_EXPLANATION.format(category=c, description=d) for c, d in CATEGORY_DESCRIPTIONS.items()
+    ]
+    workload = []
+    for i in range(args.requests):
+        question = rng.choices(questions, weights)[0] if rng.random() < 0.7 else f"{rng.choice(questions)} ({i})"
+        workload.append((question, "ta", "en"))
+        if rng.random() < 0.5:
+            workload.append((rng.choice(fixed), "en", "ta"))
+
+    settings = get_settings()
+
+    def run(enabled: bool, fresh: bool) -> tuple[int, float, float]:
+        settings.translation_memory_enabled = enabled
+        previous = TranslationMemory._instance
+        if previous is not None:
+            previous.close()
+        if fresh:
+            for path in Path(tmp).glob("translation_memory.sqlite3*"):
+                path.unlink()
+        TranslationMemory._instance = None  # re-open from disk, as a restarted worker would
+        language = LanguageService()
+        language.llm = CountingLLM()
+        CountingLLM.calls = 0
+        start = time.perf_counter()
+
+        async def go():
+            for text, source, target in workload:
+                await language.translate(text, source, target)
+
+        asyncio.run(go())
+        return CountingLLM.calls, time.perf_counter() - start, language.memory.stats["hit_rate"]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        settings.data_dir = tmp
+        logger.info(
+            f"{len(workload)} translations for {args.requests} Tamil requests "
+            f"(simulated LLM at {args.llm_ms:.0f} ms/call):"
+        )
+        for label, enabled, fresh in [
+            ("no memory", False, True),
+            ("memory, cold", True, True),
+            ("memory, after restart", True, False),
+        ]:
+            calls, elapsed, hit_rate = run(enabled, fresh)
+            logger.info(
+                f"  {label:22s} LLM calls {calls:4d} | hit rate {hit_rate:4.0%} | "
+                f"{elapsed:6.2f}s total, {elapsed / len(workload) * 1000:6.1f} ms/translation"
+            )
+
+        memory = TranslationMemory()
+        timings = []
+        for _ in range(1000):
+            start = time.perf_counter()
+            memory.lookup(fixed[0], "en", "ta")
+            timings.append((time.perf_counter() - start) * 1e6)
+        _report("memory hit", timings)
+        memory.close()
+
+
+def bench_tamil(args):
+    """Retrieval latency / recall for Tamil questions: translate first vs translate ∥ direct embedding under a budget."""
+    import asyncio
+    import random
+    from app.config import get_settings
+    from app.services.vector_store import VectorStore, text_hash
+
+    settings = get_settings()
+    model, model_name, chunks, vectors = _embed_corpus(args.model)
+    for c in chunks:
+        c["text_hash"] = text_hash(c["text"])
+    store = VectorStore(vectors.shape[1], "Flat", embed=None, metric="cosine")
+    store.reset()
+    store.add_vectors(chunks, vectors)
+    english = [q[0] for q in PARALLEL_QUERIES]
+    tamil = [q[1] for q in PARALLEL_QUERIES]
+    expected = [q[2] for q in PARALLEL_QUERIES]
+    budget = args.budget_ms / 1000
+    rng = random.Random(0)
+
+    def encode(text: str) -> np.ndarray:
+        return model.encode([text], show_progress_bar=False, convert_to_numpy=True)[0].astype("float32")
+
+    def search(query: str, vector: np.ndarray) -> list[str]:
+        lexical = store.search_lexical(query, settings.hybrid_candidates, settings.hybrid_bm25_min_ratio)
+        dense = store.search(vector, settings.hybrid_candidates)
+        fused = store.fuse(
+            dense, lexical, args.k, settings.hybrid_rrf_k, query_vec=vector,
+            min_score=settings.retrieval_min_similarity, dropoff=settings.retrieval_similarity_dropoff,
+        )
+        return [r["source"] for r in fused]
+
+    async def translate(i: int) -> str:
+        # Simulated LLM translation: log-normal latency around --llm-ms, the reference English as output
+        await asyncio.sleep(rng.lognormvariate(0, 0.5) * args.llm_ms / 1000)
+        return english[i]
+
+    async def english_only(i: int) -> list[str]:
+        return search(english[i], await asyncio.to_thread(encode, english[i]))
+
+    async def translate_first(i: int) -> list[str]:
+        query = await translate(i)
+        return search(query, await asyncio.to_thread(encode, query))
+
+    async def crosslingual(i: int) -> list[str]:
+        return search(tamil[i], await asyncio.to_thread(encode, tamil[i]))
+
+    async def parallel(i: int) -> list[str]:
+        translation = asyncio.ensure_future(translate(i))
+        direct = asyncio.ensure_future(asyncio.to_thread(encode, tamil[i]))
+        done, _ = await asyncio.wait({translation}, timeout=budget)
+        if translation in done:
+            query = translation.result()
+            return search(query, await asyncio.to_thread(encode, query))
+        translation.cancel()
+        return search(tamil[i], await direct)
+
+    async def measure(fn) -> tuple[list[float], float]:
+        latencies, found = [], []
+        for _ in range(args.rounds):
+            for i in range(len(PARALLEL_QUERIES)):
+                start = time.perf_counter()
+                found.append(await fn(i))
+                latencies.append((time.perf_counter() - start) * 1000)
+        return sorted(latencies), _source_recall(found, expected * args.rounds)
+
+    encode("warm up")
+    logger.info(
+        f"Retrieval for {len(PARALLEL_QUERIES)} parallel questions x {args.rounds} rounds ({model_name}), "
+        f"simulated translation ~{args.llm_ms:.0f} ms, budget {args.budget_ms:.0f} ms:"
+    )
+    for label, fn in (
+        ("English", english_only),
+        ("Tamil, translate first", translate_first),
+        ("Tamil, parallel", parallel),
+        ("Tamil, cross-lingual", crosslingual),
+    ):
+        latencies, recall = asyncio.run(measure(fn))
+        logger.info(
+            f"  {label:<24} recall@{args.k} {recall:.2f} | p50 {statistics.median(latencies):7.1f} ms | "
+            f"p95 {latencies[int(len(latencies) * 0.95) - 1]:7.1f} ms"
+        )
+
+
+def bench_pdf(args):
+    """Complaint PDF download: render a stored draft vs generate a new draft then render."""
+    import asyncio
+    from app.services.complaint_service import ComplaintService
+    from app.services.pdf_service import PDFService
+
+    details = {
+        "complainant_name": "R. Lakshmi",
+        "complainant_address": "12 Gandhi Street, Madurai, Tamil Nadu",
+        "opponent_name": "Sri Murugan Electronics",
+        "issue_description": (
+            "I bought a refrigerator that stopped working within a week. The shop refuses "
+            "to repair or replace it despite the warranty and has stopped answering my calls."
+        ),
+        "location": "Madurai",
+        "date": "2024-03-14",
+        "language": "en",
+    }
+    service = ComplaintService()
+    pdf = PDFService()
+    # A stand-in for a full draft (~2,500 tokens) when the LLM isn't called
+    sample = "\n\n".join(
+        f"{i}. The respondent, {details['opponent_name']}, failed to honour the warranty on the product "
+        "purchased on the date above, which amounts to a deficiency in service under the Consumer "
+        "Protection Act, 2019, and caused the complainant financial loss and mental agony."
+        for i in range(1, 40)
+    )
+
+    if args.llm:
+        start = time.perf_counter()
+        draft = asyncio.run(service.generate_complaint(**details))
+        logger.info(f"  LLM draft generation   {(time.perf_counter() - start) * 1000:8.1f} ms (the cost /pdf used to pay)")
+    else:
+        draft_id = service.drafts.put(sample, "en", details)
+        draft = {"draft_id": draft_id, "draft_text": sample, "language": "en"}
+        logger.info("  (pass --llm to time the draft generation /pdf used to repeat; needs GEMINI_API_KEY)")
+
+    def by_id():
+        stored = asyncio.run(service.resolve_draft(draft_id=draft["draft_id"]))
+        return pdf.generate_complaint_pdf(stored["draft_text"], stored["language"])
+
+    by_id()
+    timings = []
+    for _ in range(args.iterations):
+        start = time.perf_counter()
+        size = len(by_id())
+        timings.append((time.perf_counter() - start) * 1e6)
+    logger.info(f"PDF from a stored draft ({len(draft['draft_text'])} chars, {size / 1024:.0f} KiB), {args.iterations} renders:")
+    _report("by draft_id", timings)
+
+
+def _load_worker(args):
+    """Child process for `load`: open the saved store, run a few searches, print a JSON report."""
+    import json
+    from app.config import get_settings
+    from app.services.vector_store import VectorStore
+    from app.utils.memory import process_memory_mb
+
+    settings = get_settings()
+    store_dir = Path(settings.vector_store_dir)
+    manifest = VectorStore.read_manifest(store_dir)
+    before = process_memory_mb()
+    start = time.perf_counter()
+    store = VectorStore(
+        manifest["dimension"], manifest["index_factory"], embed=None, metric=manifest.get("metric", "l2")
+    )
+    store.load(store_dir, manifest["embedding_model"], mmap=args.mmap)
+    load_ms = (time.perf_counter() - start) * 1000
+    queries = np.random.default_rng(0).random((50, manifest["dimension"]), dtype="float32")
+    for q in queries:
+        store.search(q, 5)
+    print(json.dumps({"load_ms": load_ms, "before": before, "after": process_memory_mb(), "mapped": store.mapped}))
+
+
+def bench_load(args):
+    """Per-worker load time and memory for the saved index: in-memory vs memory-mapped."""
+    import json
+    import subprocess
+
+    logger.info("  mode      | worker | load ms | RSS MB | private MB | file-backed MB")
+    for mmap in (False, True):
+        for worker in range(args.workers):
+            cmd = [sys.executable, str(SCRIPT_DIR / "benchmark.py"), "_load-worker"] + (["--mmap"] if mmap else [])
+            out = subprocess.run(cmd, capture_output=True, text=True, check=True).stdout
+            report = json.loads(out.strip().splitlines()[-1])
+            after, before = report["after"], report["before"]
+            delta = {k: after.get(k, 0) - before.get(k, 0) for k in ("rss_mb", "private_mb", "file_backed_mb")}
+            mode = "mmap" if report["mapped"] else "in-memory"
+            logger.info(
+                f"  {mode:<9} | {worker:>6} | {report['load_ms']:>7.1f} | {delta['rss_mb']:>6.1f} | "
+                f"{delta['private_mb']:>10.1f} | {delta['file_backed_mb']:>14.1f}"
+            )
+    logger.info("  (memory columns are growth from loading + 50 searches; file-backed pages are shared between workers)")
+
+
+def main():
+    load_dotenv()
+    parser = argparse.ArgumentParser(description="Needhi benchmarks")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("language", help="language detection latency")
+    p.add_argument("--iterations", type=int, default=200)
+    p.set_defaults(func=bench_language)
+
+    p = sub.add_parser("crosslingual", help="Tamil retrieval recall with and without translation")
+    p.add_argument("--model", help="sentence-transformers model (default: LOCAL_EMBEDDING_MODEL)")
+    p.add_argument("--k", type=int, default=5)
+    p.add_argument("--translate", action="store_true", help="translate with the LLM instead of using reference English")
+    p.set_defaults(func=bench_crosslingual)
+
+    p = sub.add_parser("ann", help="approximate index recall@k vs latency against Flat")
+    p.add_argument("--model", help="sentence-transformers model (default: LOCAL_EMBEDDING_MODEL)")
+    p.add_argument("--factories", help="';'-separated faiss factory strings (default: HNSW32, IVF-Flat, IVF-PQ)")
+    p.add_argument("--k", type=int, default=5)
+    p.add_argument("--queries", type=int, default=200, help="corpus chunks sampled as extra queries")
+    p.add_argument("--output", help="write the markdown report to this file")
+    p.set_defaults(func=bench_ann)
+
+    p = sub.add_parser("chunks", help="chunk store load time / memory: pickled dicts vs memory-mapped columns")
+    p.add_argument("--scales", default="1,4,16", help="comma-separated corpus size multipliers")
+    p.set_defaults(func=bench_chunks)
+
+    p = sub.add_parser("load", help="per-worker load time and memory of the saved index, in-memory vs mmap")
+    p.add_argument("--workers", type=int, default=2, help="worker processes started per mode")
+    p.set_defaults(func=bench_load)
+
+    p = sub.add_parser("quantize", help="memory / latency / recall@k of quantized indexes with optional re-rank")
+    p.add_argument("--model", help="sentence-transformers model (default: LOCAL_EMBEDDING_MODEL)")
+    p.add_argument("--factories", help="';'-separated faiss factory strings (default: Flat, SQfp16, SQ8, PQ)")
+    p.add_argument("--rerank", type=int, default=50, help="candidates re-scored with float32 vectors")
+    p.add_argument("--k", type=int, default=5)
+    p.add_argument("--queries", type=int, default=200, help="corpus chunks sampled as extra queries")
+    p.add_argument("--output", help="write the markdown report to this file")
+    p.set_defaults(func=bench_quantize)
+
+    p = sub.add_parser("relevance", help="prompt chunks per question: fixed top-k vs relevance cutoff")
+    p.add_argument("--model", help="sentence-transformers model (default: LOCAL_EMBEDDING_MODEL)")
+    p.add_argument("--k", type=int, default=5)
+    p.add_argument("--min-similarity", type=float, default=0.25)
+    p.add_argument("--dropoff", type=float, default=0.15)
+    p.set_defaults(func=bench_relevance)
+
+    p = sub.add_parser("hybrid", help="section-number recall: dense only vs BM25 + dense fused by RRF")
+    p.add_argument("--model", help="sentence-transformers model (default: LOCAL_EMBEDDING_MODEL)")
+    p.add_argument("--k", type=int, default=5)
+    p.add_argument("--candidates", type=int, default=20, help="hits taken from each retriever before fusion")
+    p.set_defaults(func=bench_hybrid)
+
+    p = sub.add_parser("chunking", help="chunk count / embed time / precision: recursive vs statute-aware chunking")
+    p.add_argument("--model", help="sentence-transformers model (default: LOCAL_EMBEDDING_MODEL)")
+    p.add_argument("--k", type=int, default=5)
+    p.set_defaults(func=bench_chunking)
+
+    p = sub.add_parser("citations", help="section questions: direct citation lookup vs embedding + hybrid search")
+    p.add_argument("--model", help="sentence-transformers model (default: LOCAL_EMBEDDING_MODEL)")
+    p.add_argument("--k", type=int, default=5)
+    p.set_defaults(func=bench_citations)
+
+    p = sub.add_parser("rerank", help="precision / recall / latency: dense top-k vs cross-encoder re-ranking")
+    p.add_argument("--model", help="sentence-transformers model (default: LOCAL_EMBEDDING_MODEL)")
+    p.add_argument("--rerank-model", help="cross-encoder model (default: RERANK_MODEL)")
+    p.add_argument("--k", type=int, default=5)
+    p.add_argument("--candidates", type=int, default=50, help="dense candidates passed to the cross-encoder")
+    p.add_argument("--budget-ms", type=int, default=300)
+    p.set_defaults(func=bench_rerank)
+
+    p = sub.add_parser("batching", help="query embedding throughput under concurrency: per request vs micro-batched")
+    p.add_argument("--model", help="sentence-transformers model (default: LOCAL_EMBEDDING_MODEL)")
+    p.add_argument("--concurrency", default="1,8,32", help="comma-separated numbers of concurrent requests")
+    p.add_argument("--requests", type=int, default=256)
+    p.add_argument("--max-batch", type=int, default=32)
+    p.add_argument("--max-wait-ms", type=float, default=5.0)
+    p.set_defaults(func=bench_batching)
+
+    p = sub.add_parser("batch", help="bulk-question retrieval: per question vs coalesced, batched embed + search")
+    p.add_argument("--model", help="sentence-transformers model (default: LOCAL_EMBEDDING_MODEL)")
+    p.add_argument("--questions", type=int, default=300)
+    p.add_argument("--k", type=int, default=5)
+    p.set_defaults(func=bench_batch)
+
+    p = sub.add_parser("classifier", help="issue classification accuracy / latency: local centroid vs LLM")
+    p.add_argument("--llm", action="store_true", help="also run the LLM baseline (uses API quota)")
+    p.add_argument("--min-confidence", type=float, default=0.5, help="local probability below which the LLM is asked")
+    p.set_defaults(func=bench_classifier)
+
+    p = sub.add_parser("translation", help="LLM round trips for repeated translations: no memory vs translation memory")
+    p.add_argument("--requests", type=int, default=200)
+    p.add_argument("--llm-ms", type=float, default=20.0, help="simulated LLM latency per translation")
+    p.set_defaults(func=bench_translation)
+
+    p = sub.add_parser("tamil", help="Tamil retrieval latency / recall: translate first vs parallel under a budget")
+    p.add_argument("--model", default=None, help="embedding model (a multilingual one suits parallel mode)")
+    p.add_argument("--k", type=int, default=5)
+    p.add_argument("--llm-ms", type=float, default=900.0, help="median simulated translation latency")
+    p.add_argument("--budget-ms", type=float, default=500.0, help="TAMIL_TRANSLATION_BUDGET_MS")
+    p.add_argument("--rounds", type=int, default=5)
+    p.set_defaults(func=bench_tamil)
+
+    p = sub.add_parser("pdf", help="complaint PDF latency: render a stored draft vs regenerate it")
+    p.add_argument("--iterations", type=int, default=20)
+    p.add_argument("--llm", action="store_true", help="also time one draft generation (uses API quota)")
+    p.set_defaults(func=bench_pdf)
+
+    p = sub.add_parser("_load-worker")
+    p.add_argument("--mmap", action="store_true")
+    p.set_defaults(func=_load_worker)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
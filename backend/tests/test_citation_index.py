@@ -0,0 +1,35 @@
+import pytest
+
+from app.services.citation_index import Citation, parse_citations
+
+
+def test_bare_section_next_to_a_cited_one_gets_the_named_act():
+    assert parse_citations("Section 498A of IPC and section 304B") == [
+        Citation("IPC", "498A"),
+        Citation("IPC", "304B"),
+    ]
+
+
+def test_section_already_cited_with_its_act_is_not_repeated():
+    assert parse_citations("What does IPC section 420 say?") == [Citation("IPC", "420")]
+
+
+def test_bare_section_without_a_single_named_act_has_no_act():
+    assert parse_citations("section 420 or IPC 302 or CrPC 41") == [
+        Citation(None, "420"),
+        Citation("IPC", "302"),
+        Citation("CrPC", "41"),
+    ]
+
+
+@pytest.mark.parametrize("question", ["What is section 498-A IPC?", "IPC 498 A bailable?", "Is 498A of IPC bailable?"])
+def test_hyphenated_or_spaced_suffix_stays_part_of_the_section(question):
+    assert parse_citations(question) == [Citation("IPC", "498A")]
+
+
+def test_lowercase_article_after_a_section_is_not_a_suffix():
+    assert parse_citations("Is IPC 420 a bailable offence?") == [Citation("IPC", "420")]
+
+
+def test_article_cited_with_the_constitution_is_listed_once():
+    assert parse_citations("Article 21 of constitution") == [Citation("Constitution", "Article 21")]
@@ -0,0 +1,165 @@
+"""VectorStore incremental indexing: shared chunks, re-uploads and what the manifest records."""
+
+import hashlib
+
+import faiss
+import numpy as np
+import pytest
+
+from app.services import vector_store
+from app.services.vector_store import VectorStore, search_parameters
+
+DIM = 8
+
+
+class FakeEmbedder:
+    """Deterministic vectors from the text hash; counts calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, texts, progress=None):
+        self.calls += 1
+        if self.calls > 20:
+            raise AssertionError("re-indexing did not terminate")
+        rows = []
+        for text in texts:
+            seed = int.from_bytes(hashlib.sha256(text.encode()).digest()[:4], "little")
+            rows.append(np.random.default_rng(seed).standard_normal(DIM))
+        return np.asarray(rows, dtype="float32")
+
+
+@pytest.fixture
+def paragraphs(monkeypatch):
+    # One chunk per paragraph, so tests control exactly which chunks files share
+    monkeypatch.setattr(
+        vector_store, "chunk_text",
+        lambda text, source="unknown": [{"text": p, "source": source} for p in text.split("\n\n") if p],
+    )
+
+
+@pytest.fixture
+def store(paragraphs):
+    store = VectorStore(DIM, "Flat", embed=FakeEmbedder())
+    store.reset()
+    return store
+
+
+def _write(path, *paragraphs):
+    path.write_text("\n\n".join(paragraphs), encoding="utf-8")
+    return path
+
+
+def _indexed_texts(store):
+    return sorted(store.chunks.get(int(i))["text"] for i in store.chunks.ids)
+
+
+def test_reupload_of_files_sharing_each_others_chunks_terminates(store, tmp_path):
+    x, y, z = "Chunk X text.", "Chunk Y text.", "Chunk Z text."
+    a, b = tmp_path / "A.txt", tmp_path / "B.txt"
+    store.index_file(_write(a, x))
+    store.index_file(_write(b, y))
+
+    store.index_file(_write(a, x, y))  # A now shares Y with B
+    store.index_file(_write(b, x, y, z))  # B shares X with A; removing B's Y used to re-index A forever
+
+    assert _indexed_texts(store) == [x, y, z]
+    assert store.total_vectors == 3
+    for name, path in (("A.txt", a), ("B.txt", b)):
+        assert store.files[name]["sha256"] == vector_store.file_hash(path)
+
+
+def test_shared_chunk_removed_with_its_owner_is_reindexed(store, tmp_path):
+    x, y = "Chunk X text.", "Chunk Y text."
+    a, b = tmp_path / "A.txt", tmp_path / "B.txt"
+    store.index_file(_write(a, x, y))
+    store.index_file(_write(b, y))  # B only shares Y, owned by A
+
+    store.index_file(_write(a, x))  # A drops Y: B must be re-indexed to keep it
+
+    assert _indexed_texts(store) == [x, y]
+    assert store.files["B.txt"]["count"] == 1
+
+
+def _unit(*values):
+    vector = np.zeros(DIM, dtype="float32")
+    vector[: len(values)] = values
+    return vector / np.linalg.norm(vector)
+
+
+def test_hybrid_fusion_applies_the_relevance_cutoff_and_keeps_cosine_scores(store):
+    chunks = [
+        {"text": "Section 420 of the IPC punishes cheating.", "source": "ipc.txt"},
+        {"text": "Cheating and dishonestly inducing delivery of property.", "source": "ipc.txt"},
+        {"text": "The tenant shall pay rent on time every month.", "source": "rent.txt"},
+    ]
+    chunks, _ = store.dedupe(chunks)
+    store.add_vectors(chunks, np.stack([_unit(1, 0.1), _unit(0.9, 0.3), _unit(0, 0, 1)]))
+    query = _unit(1, 0.2)
+
+    # "time" matches the rent chunk lexically, but it is unrelated (cosine 0)
+    dense = store.search(query, 10)
+    lexical = store.search_lexical("cheating time", 10)
+    fused = store.fuse(dense, lexical, 5, query_vec=query, min_score=0.25, dropoff=0.15)
+
+    assert [c["source"] for c in fused] == ["ipc.txt", "ipc.txt"]
+    assert all(c["score"] > 0.9 and 0 < c["rrf_score"] < 0.05 for c in fused)
+
+    off_topic = _unit(0, 0, 0, 1)
+    fused = store.fuse(
+        store.search(off_topic, 10), store.search_lexical("rent time", 10), 5,
+        query_vec=off_topic, min_score=0.25, dropoff=0.15,
+    )
+    assert fused == []
+
+
+def test_reupload_with_an_index_that_cannot_remove_vectors_rebuilds(paragraphs, tmp_path):
+    store = VectorStore(DIM, "HNSW32", embed=FakeEmbedder())
+    store.reset()
+    a, b = tmp_path / "A.txt", tmp_path / "B.txt"
+    store.index_file(_write(a, "Chunk X text."))
+    store.index_file(_write(b, "Chunk Y text."))
+
+    result = store.index_file(_write(a, "Chunk X text, revised.", "Chunk Z text."))
+
+    assert result["chunks_embedded"] == 2
+    assert _indexed_texts(store) == ["Chunk X text, revised.", "Chunk Y text.", "Chunk Z text."]
+    assert store.total_vectors == 3
+
+
+def test_manifest_records_flat_when_training_falls_back(paragraphs, tmp_path):
+    store = VectorStore(DIM, "IVF16,Flat", embed=FakeEmbedder())
+    store.reset()
+    store.index_file(_write(tmp_path / "A.txt", "Chunk X text.", "Chunk Y text."))  # too few to train 16 lists
+    assert store.built_factory == "Flat"
+    store.save(tmp_path / "store", "fake")
+
+    loaded = VectorStore(DIM, "IVF16,Flat", embed=FakeEmbedder())
+    loaded.load(tmp_path / "store", "fake")
+
+    assert loaded.built_factory == "Flat"
+    assert loaded.needs_rebuild  # training is retried on the next re-index
+
+
+def test_hnsw_store_gets_the_configured_ef_search(paragraphs, tmp_path):
+    store = VectorStore(DIM, "HNSW32", embed=FakeEmbedder())
+    store.reset()
+    store.index_file(_write(tmp_path / "A.txt", "Chunk X text.", "Chunk Y text."))
+
+    params = search_parameters(store.index, nprobe=8, ef_search=77)
+
+    assert isinstance(params, faiss.SearchParametersHNSW)
+    assert params.efSearch == 77
+    assert store.search_batch(np.ones((1, DIM), dtype="float32"), 2, params)[0]
+
+
+def test_reupload_of_an_unchanged_file_is_not_its_own_duplicate(store, tmp_path):
+    a = _write(tmp_path / "A.txt", "Chunk X text.")
+    store.index_file(a)
+
+    result = store.index_file(a)
+    assert result["unchanged"] and result["duplicate_of"] is None
+    assert result["chunks_embedded"] == 0
+
+    result = store.index_file(_write(tmp_path / "B.txt", "Chunk X text."))
+    assert not result["unchanged"] and result["duplicate_of"] == "A.txt"
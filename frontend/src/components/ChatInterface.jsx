@@ -1,5 +1,5 @@
 import React, { useState, useRef, useEffect } from 'react';
-import { askQuestion } from '../services/api';
+import { streamQuestion } from '../services/api';
 import { SAMPLE_QUESTIONS } from '../utils/constants';
 
 function LoadingDots() {
@@ -14,6 +14,7 @@ export default function ChatInterface({ language }) {
   const [messages, setMessages] = useState([]);
   const [input, setInput] = useState('');
   const [loading, setLoading] = useState(false);
+  const [streaming, setStreaming] = useState(false);
   const messagesEndRef = useRef(null);
 
   useEffect(() => {
@@ -29,16 +30,33 @@ export default function ChatInterface({ language }) {
     setInput('');
     setLoading(true);
 
+    // The assistant message is appended once sources arrive, then filled token by token
+    let started = false;
+    const updateAssistant = (patch) =>
+      setMessages((prev) => {
+        const next = [...prev];
+        const last = next[next.length - 1];
+        next[next.length - 1] = { ...last, ...patch(last) };
+        return next;
+      });
+
     try {
-      const data = await askQuestion(q);
-      const assistantMsg = {
-        role: 'assistant',
-        content: data.answer,
-        sources: data.sources || [],
-        category: data.category,
-        language: data.detected_language,
-      };
-      setMessages((prev) => [...prev, assistantMsg]);
+      await streamQuestion(q, null, {
+        onSources: (data) => {
+          started = true;
+          setStreaming(true);
+          setMessages((prev) => [
+            ...prev,
+            {
+              role: 'assistant',
+              content: '',
+              sources: data.sources || [],
+              language: data.detected_language,
+            },
+          ]);
+        },
+        onToken: (text) => updateAssistant((last) => ({ content: last.content + text })),
+      });
     } catch (err) {
       const errorMsg = {
         role: 'assistant',
@@ -48,9 +66,10 @@ export default function ChatInterface({ language }) {
             : '❌ Sorry, an error occurred. Please try again later.',
         sources: [],
       };
-      setMessages((prev) => [...prev, errorMsg]);
+      setMessages((prev) => (started ? [...prev.slice(0, -1), errorMsg] : [...prev, errorMsg]));
     } finally {
       setLoading(false);
+      setStreaming(false);
     }
   };
 
@@ -108,7 +127,7 @@ export default function ChatInterface({ language }) {
           </div>
         ))}
 
-        {loading && (
+        {loading && !streaming && (
           <div className="message assistant">
             <LoadingDots />
           </div>
@@ -1,4 +1,4 @@
-import React, { useState } from 'react';
+import React, { useEffect, useState } from 'react';
 import { generateComplaint, downloadComplaintPDF } from '../services/api';
 
 const INITIAL_FORM = {
@@ -13,12 +13,19 @@ const INITIAL_FORM = {
 export default function ComplaintForm({ language }) {
   const [form, setForm] = useState({ ...INITIAL_FORM });
   const [draft, setDraft] = useState('');
+  const [draftId, setDraftId] = useState(null);
   const [loading, setLoading] = useState(false);
   const [pdfLoading, setPdfLoading] = useState(false);
   const [error, setError] = useState('');
 
+  // The stored draft no longer matches once the form or language changes
+  useEffect(() => {
+    setDraftId(null);
+  }, [language]);
+
   const handleChange = (e) => {
     setForm({ ...form, [e.target.name]: e.target.value });
+    setDraftId(null);
   };
 
   const isFormValid = () =>
@@ -34,10 +41,12 @@ export default function ComplaintForm({ language }) {
     setLoading(true);
     setError('');
     setDraft('');
+    setDraftId(null);
 
     try {
       const data = await generateComplaint({ ...form, language });
       setDraft(data.draft_text);
+      setDraftId(data.draft_id);
     } catch (err) {
       setError(
         language === 'ta'
@@ -53,7 +62,8 @@ export default function ComplaintForm({ language }) {
     if (!isFormValid()) return;
     setPdfLoading(true);
     try {
-      await downloadComplaintPDF({ ...form, language });
+      // The server renders the stored draft; the form is the fallback if it has expired
+      await downloadComplaintPDF({ ...form, language, draft_id: draftId });
     } catch (err) {
       setError(
         language === 'ta'
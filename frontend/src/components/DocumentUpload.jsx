@@ -1,5 +1,5 @@
 import React, { useState, useEffect, useCallback } from 'react';
-import { uploadDocument, indexAllDocuments, getIndexStatus } from '../services/api';
+import { uploadDocument, indexAllDocuments, getIndexStatus, waitForIndexJob } from '../services/api';
 
 export default function DocumentUpload({ language }) {
   const [status, setStatus] = useState(null);
@@ -7,6 +7,7 @@ export default function DocumentUpload({ language }) {
   const [loading, setLoading] = useState(false);
   const [indexing, setIndexing] = useState(false);
   const [dragging, setDragging] = useState(false);
+  const [progress, setProgress] = useState(null);
 
   const fetchStatus = useCallback(async () => {
     try {
@@ -27,14 +28,16 @@ export default function DocumentUpload({ language }) {
     setUploadMsg(null);
 
     try {
-      const data = await uploadDocument(file);
+      const job = await uploadDocument(file);
+      const data = await waitForIndexJob(job.job_id, setProgress);
       setUploadMsg({ type: 'success', text: `✅ ${data.message} (${data.chunks_created} chunks)` });
       fetchStatus();
     } catch (err) {
-      const msg = err.response?.data?.detail || 'Upload failed';
+      const msg = err.response?.data?.detail || err.message || 'Upload failed';
       setUploadMsg({ type: 'error', text: `❌ ${msg}` });
     } finally {
       setLoading(false);
+      setProgress(null);
     }
   };
 
@@ -42,17 +45,19 @@ export default function DocumentUpload({ language }) {
     setIndexing(true);
     setUploadMsg(null);
     try {
-      const data = await indexAllDocuments();
+      const job = await indexAllDocuments();
+      const data = await waitForIndexJob(job.job_id, setProgress);
       setUploadMsg({
         type: 'success',
         text: `✅ ${data.message}: ${data.documents_processed} docs, ${data.total_chunks} chunks`,
       });
       fetchStatus();
     } catch (err) {
-      const msg = err.response?.data?.detail || 'Indexing failed';
+      const msg = err.response?.data?.detail || err.message || 'Indexing failed';
       setUploadMsg({ type: 'error', text: `❌ ${msg}` });
     } finally {
       setIndexing(false);
+      setProgress(null);
     }
   };
 
@@ -103,6 +108,13 @@ export default function DocumentUpload({ language }) {
           </div>
         )}
 
+        {progress && (
+          <div style={{ textAlign: 'center', fontSize: '0.85rem', color: 'var(--text-light)' }}>
+            {progress.phase}: {progress.chunks_embedded}/{progress.chunks_total} chunks
+            {progress.chunks_per_second > 0 && ` (${progress.chunks_per_second}/s)`}
+          </div>
+        )}
+
         {uploadMsg && (
           <div className={`upload-status ${uploadMsg.type}`}>{uploadMsg.text}</div>
         )}
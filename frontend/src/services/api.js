@@ -19,12 +19,65 @@ export async function askQuestion(question, language = null) {
   return data;
 }
 
+/*
+ * Streaming Q&A over Server-Sent Events. The endpoint is a POST, so this
+ * reads the event stream with fetch instead of EventSource.
+ * Handlers: onSources({ sources, detected_language }), onToken(text), onDone({ disclaimer }).
+ */
+export async function streamQuestion(question, language = null, handlers = {}) {
+  const response = await fetch(`${API_BASE}/api/query/stream`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json', Accept: 'text/event-stream' },
+    body: JSON.stringify({ question, language }),
+  });
+  if (!response.ok || !response.body) {
+    throw new Error(`Streaming request failed: ${response.status}`);
+  }
+
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+
+  const dispatch = (raw) => {
+    let event = 'message';
+    const dataLines = [];
+    raw.split('\n').forEach((line) => {
+      if (line.startsWith('event:')) event = line.slice(6).trim();
+      else if (line.startsWith('data:')) dataLines.push(line.slice(5).trim());
+    });
+    if (!dataLines.length) return;
+    const data = JSON.parse(dataLines.join('\n'));
+    if (event === 'sources') handlers.onSources?.(data);
+    else if (event === 'token') handlers.onToken?.(data.text);
+    else if (event === 'done') handlers.onDone?.(data);
+    else if (event === 'error') throw new Error(data.detail);
+  };
+
+  for (;;) {
+    const { value, done } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+    let sep;
+    while ((sep = buffer.indexOf('\n\n')) !== -1) {
+      dispatch(buffer.slice(0, sep));
+      buffer = buffer.slice(sep + 2);
+    }
+  }
+  if (buffer.trim()) dispatch(buffer);
+}
+
 /* ── Classifier ────────────────────────────────────────────── */
 export async function classifyIssue(description) {
   const { data } = await api.post('/api/classify/', { description });
   return data;
 }
 
+/* ── Assist (classify + answer in one call) ─────────────────── */
+export async function assist(question, language = null) {
+  const { data } = await api.post('/api/assist/', { question, language });
+  return data;
+}
+
 /* ── Complaint Draft ───────────────────────────────────────── */
 export async function generateComplaint(formData) {
   const { data } = await api.post('/api/complaint/draft', formData);
@@ -63,6 +116,25 @@ export async function indexAllDocuments() {
   return data;
 }
 
+export async function getIndexJob(jobId) {
+  const { data } = await api.get(`/api/documents/jobs/${jobId}`);
+  return data;
+}
+
+/*
+ * Upload and index-all return a job immediately; poll it until it finishes.
+ * onProgress(job) is called after every poll. Resolves with the job's result.
+ */
+export async function waitForIndexJob(jobId, onProgress = null, intervalMs = 1000) {
+  for (;;) {
+    const job = await getIndexJob(jobId);
+    onProgress?.(job);
+    if (job.status === 'completed') return job.result;
+    if (job.status === 'failed') throw new Error(job.error || 'Indexing failed');
+    await new Promise((resolve) => setTimeout(resolve, intervalMs));
+  }
+}
+
 export async function getIndexStatus() {
   const { data } = await api.get('/api/documents/status');
   return data;